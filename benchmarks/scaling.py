@@ -0,0 +1,95 @@
+"""Scaling suite, how the solutions grow with the size of their input.
+
+Every day runs on synthetic inputs of geometrically growing scale until one
+takes longer than the budget. The samples are written to scaling.csv, the
+fitted exponents, plots and super-linear hot spots to report.txt:
+
+    python benchmarks/scaling.py                # all days
+    python benchmarks/scaling.py 3 22 --budget 5
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from pathlib import Path
+
+import click
+from aoc23.cli import scaling
+
+# first scale of the days slower than DEFAULT_START allows
+START = {8: 16, 11: 8, 13: 1, 16: 32, 20: 4, 21: 9}
+DEFAULT_START = 64
+
+ALL_DAYS = range(1, 26)
+# day 1 reads its inputs itself, day 6 always has 4 races, its input hardly grows
+SKIPPED = {1, 6}
+
+
+@click.command()
+@click.argument("days", nargs=-1, type=click.IntRange(1, 25))
+@click.option(
+    "--budget",
+    type=click.FloatRange(min=0),
+    default=1.0,
+    show_default=True,
+    help="Stop growing a day's input once solving it takes longer (seconds).",
+)
+@click.option(
+    "--factor", type=click.FloatRange(min=1.1), default=2.0, show_default=True
+)
+@click.option("--steps", type=click.IntRange(min=2), default=8, show_default=True)
+@click.option("--repeat", type=click.IntRange(min=1), default=3, show_default=True)
+@click.option(
+    "--threshold",
+    type=float,
+    default=1.3,
+    show_default=True,
+    help="Flag functions whose self time grows faster than size ** threshold.",
+)
+@click.option(
+    "--output",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=Path(__file__).parent / "results",
+    show_default=True,
+)
+def main(  # noqa: PLR0913
+    days: tuple[int, ...],
+    budget: float,
+    factor: float,
+    steps: int,
+    repeat: int,
+    threshold: float,
+    output: Path,
+) -> None:
+    """Fit the time and memory exponents of DAYS, all days if none are given."""
+    results = []
+    for day in days or ALL_DAYS:
+        if day in SKIPPED:
+            continue
+        scales = islice(scaling.scales(START.get(day, DEFAULT_START), factor), steps)
+        try:
+            samples = scaling.measure_series(day, scales, budget, repeat=repeat)
+        except ModuleNotFoundError:
+            continue
+        except Exception as e:  # noqa: BLE001
+            # a failing day shouldn't cost the results of the others
+            click.secho(f"DAY {day:02} failed: {e!r}", err=True, fg="red")
+            continue
+        result = scaling.analyze(day, samples, threshold)
+        click.echo(
+            f"DAY {day:02} time ~ size^{result.time_exponent:.2f}"
+            f" ({len(samples)} sizes up to {samples[-1].seconds:.3f}s)",
+            err=True,
+        )
+        results.append(result)
+    output.mkdir(parents=True, exist_ok=True)
+    scaling.write_csv(results, output / "scaling.csv")
+    report = scaling.report(results)
+    (output / "report.txt").write_text(report)
+    click.echo(report, nl=False)
+    hotspots = sum(len(r.hotspots) for r in results)
+    click.echo(f"{hotspots} super-linear hot spot(s), reports in {output}", err=True)
+
+
+if __name__ == "__main__":
+    main()
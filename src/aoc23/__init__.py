@@ -1,6 +1,8 @@
 """Package initializer module."""
-from importlib.metadata import version
 
 
 def _version() -> str:
+    # importlib.metadata is expensive to import, only pay for it when needed
+    from importlib.metadata import version
+
     return version("aoc23")
@@ -1,7 +1,9 @@
+import re
+import sys
 from pathlib import Path
 from pprint import pp
 
-from aoc23.support import get_input
+from aoc23.support import read_input_bytes
 
 dstrings = {
     "one": "1",
@@ -15,6 +17,9 @@ dstrings = {
     "nine": "9",
 }
 
+DIGITS = {str(d).encode(): d for d in range(1, 10)}
+WORDS = {word.encode(): int(digit) for word, digit in dstrings.items()} | DIGITS
+
 
 def dstring_to_digits(line: str) -> str:
     i, res = 0, ""
@@ -34,15 +39,87 @@ def line_to_value(line: str) -> int:
     return int(digits[0] + digits[-1]) if len(digits) else 0
 
 
-def main() -> tuple[int, int]:
-    lines1: list[str] = get_input(Path(__file__).parent / "input01.txt")
-    lines2: list[str] = get_input(Path(__file__).parent / "input02.txt")
-    return sum(line_to_value(line) for line in lines1), sum(
-        line_to_value(dstring_to_digits(line)) for line in lines2
+def calibration_pattern(values: dict[bytes, int]) -> re.Pattern[bytes]:
+    """Match the first and the last of `values` of every line in two groups.
+
+    Both are matched in lookaheads, so they may overlap: "eighthree" is 83,
+    "eight" alone 88. The lazy prefix finds the first, the greedy middle
+    backtracks from the end of the line to the last. Nothing is decoded or
+    split, lines are scanned in place.
+    """
+    token = b"|".join(map(re.escape, values))
+    return re.compile(rb"^[^\n]*?(?=(%b))[^\n]*(?=(%b))" % (token, token), re.MULTILINE)
+
+
+PATTERN1 = calibration_pattern(DIGITS)
+PATTERN2 = calibration_pattern(WORDS)
+
+
+def calibration_sum(
+    data: bytes, pattern: re.Pattern[bytes], values: dict[bytes, int]
+) -> int:
+    """Sum of the values of all lines in `data`, lines without any count 0."""
+    return sum(
+        10 * values[first] + values[last] for first, last in pattern.findall(data)
     )
 
 
+def scan_engine(data: bytes) -> tuple[int, int]:
+    return calibration_sum(data, PATTERN1, DIGITS), calibration_sum(
+        data, PATTERN2, WORDS
+    )
+
+
+def numpy_engine(data: bytes) -> tuple[int, int]:
+    """Both sums computed on `data` as one array, without a loop over the lines.
+
+    Every line is a segment ending in its newline. The digit (part 1) resp.
+    digit or word (part 2) positions of a segment are reduced to the first and
+    the last one with minimum/maximum.reduceat. Words are found by comparing
+    the array shifted by each of their letters.
+    """
+    import numpy as np
+
+    chars = np.frombuffer(data + b"\n", dtype=np.uint8)
+    size = len(chars)
+    starts = np.concatenate(([0], np.flatnonzero(chars == ord("\n"))[:-1] + 1))
+    is_digit = (chars >= ord("1")) & (chars <= ord("9"))
+    values = np.where(is_digit, chars - ord("0"), 0).astype(np.int64)
+    digit_values = values.copy()
+    for word, value in WORDS.items():
+        # number of positions the word could start at
+        if len(word) == 1 or (count := size - len(word) + 1) <= 0:
+            continue
+        found = chars[:count] == word[0]
+        for offset, char in enumerate(word[1:], start=1):
+            found &= chars[offset : offset + count] == char
+        values[:count][found] = value
+
+    positions = np.arange(size)
+
+    def calibration(values: np.ndarray) -> int:
+        present = values > 0
+        first = np.minimum.reduceat(np.where(present, positions, size), starts)
+        last = np.maximum.reduceat(np.where(present, positions, -1), starts)
+        found = last >= 0
+        return int((10 * values[first[found]] + values[last[found]]).sum())
+
+    return calibration(digit_values), calibration(values)
+
+
+# interchangeable implementations, e.g. to check them against each other
+ENGINES = {"scan": scan_engine, "numpy": numpy_engine}
+
+
+def main(engine: str = "scan") -> tuple[int, int]:
+    solve = ENGINES[engine]
+    data1 = read_input_bytes(Path(__file__).parent / "input01.txt")
+    data2 = read_input_bytes(Path(__file__).parent / "input02.txt")
+    return solve(data1)[0], solve(data2)[1]
+
+
 if __name__ == "__main__":
-    sol1, sol2 = main()
-    pp(f"Solution 1: {sol1}")
+    # python -m aoc23.aoc01.main [scan|numpy]
+    sol1, sol2 = main(*sys.argv[1:2])
     pp(f"Solution 1: {sol1}")
+    pp(f"Solution 2: {sol2}")
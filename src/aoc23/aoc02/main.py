@@ -1,10 +1,19 @@
+from __future__ import annotations
+
 import re
 from functools import reduce
 from pathlib import Path
 from pprint import pp
-from typing import TypedDict
+from typing import TYPE_CHECKING, NamedTuple, TypedDict
+
+from aoc23.support import read_input
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
-from aoc23.support import get_input
+    import numpy as np
+
+INPUT = "input01.txt"
 
 
 class Roll(TypedDict):
@@ -63,12 +72,146 @@ def roll_power(r: Roll) -> int:
     return max(1, r["red"]) * max(1, r["green"]) * max(1, r["blue"])
 
 
-def main() -> tuple[int, int]:
-    lines: list[str] = get_input(Path(__file__).parent / "input01.txt")
-    games = [parse_line(line) for line in lines]
-    return sum([g["id"] for g in games if game_possible(g)]), sum(
-        [roll_power(min_cubes(g)) for g in games]
+class GameTable(NamedTuple):
+    """All rolls of all games as columns, the rolls of a game are adjacent."""
+
+    game: np.ndarray  # id of the game of every roll
+    roll: np.ndarray  # index of the roll within its game
+    red: np.ndarray
+    green: np.ndarray
+    blue: np.ndarray
+
+
+def parse_table(raw: str) -> GameTable:
+    """Parse all games at once, missing colors count 0.
+
+    The input is scanned as a byte array: numbers are the runs of digits, a
+    number followed by ":" is a game id, any other one is a count of the color
+    starting two bytes after it. Every ":" and ";" starts a roll.
+    """
+    import numpy as np
+
+    # the padding keeps the bytes after the last number in range
+    chars = np.frombuffer(raw.encode() + b"\n\n", dtype=np.uint8)
+    is_digit = (chars >= ord("0")) & (chars <= ord("9"))
+    edges = np.diff(is_digit.astype(np.int8), prepend=0)
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    numbers = np.zeros(len(starts), dtype=np.int64)
+    for offset in range(int((ends - starts).max(initial=0))):
+        longer = ends - starts > offset
+        numbers[longer] = numbers[longer] * 10 + chars[starts[longer] + offset] - 48
+
+    is_id = chars[ends] == ord(":")
+    colors = chars[ends[~is_id] + 1]
+    counts = numbers[~is_id]
+    is_boundary = (chars == ord(":")) | (chars == ord(";"))
+    roll_of_count = (np.cumsum(is_boundary) - 1)[starts[~is_id]]
+    is_first_roll = chars[is_boundary] == ord(":")
+    game_of_roll = np.cumsum(is_first_roll) - 1
+    first_roll = np.flatnonzero(is_first_roll)
+
+    def column(color: str) -> np.ndarray:
+        cubes = np.zeros(len(game_of_roll), dtype=np.int32)
+        is_color = colors == ord(color[0])
+        cubes[roll_of_count[is_color]] = counts[is_color]
+        return cubes
+
+    return GameTable(
+        game=numbers[is_id].astype(np.int32)[game_of_roll],
+        roll=(np.arange(len(game_of_roll)) - first_roll[game_of_roll]).astype(np.int32),
+        red=column("red"),
+        green=column("green"),
+        blue=column("blue"),
+    )
+
+
+def table_min_cubes(table: GameTable) -> tuple[np.ndarray, np.ndarray]:
+    """Ids of the games and the most red, green and blue cubes of any roll."""
+    import numpy as np
+
+    starts = np.flatnonzero(table.roll == 0)
+    cubes = np.stack([table.red, table.green, table.blue], axis=1)
+    if not len(starts):
+        return table.game, cubes
+    return table.game[starts], np.maximum.reduceat(cubes, starts)
+
+
+# largest number of cube sets (most cubes of a color + 1) ** 3 tabulated densely
+DENSE_SETS = 1 << 22
+# comparisons of configurations with cube sets done at once
+CHUNK_SIZE = 1 << 22
+
+
+def possible_id_sums(
+    table: GameTable, caps: Sequence[tuple[int, int, int]]
+) -> np.ndarray:
+    """Id sums of the games possible with at most the (red, green, blue) in `caps`.
+
+    The id sums are tabulated by the cube set games need and summed up along
+    all three colors, a configuration is then a lookup of its cube set. If the
+    table would get too big the configurations are compared with the distinct
+    cube sets instead.
+    """
+    import numpy as np
+
+    ids, cubes = table_min_cubes(table)
+    limits = np.array(caps, dtype=np.int64).reshape(-1, 3)
+    base = int(cubes.max(initial=0)) + 1
+    # a cube set as a single number
+    keys = (cubes[:, 0].astype(np.int64) * base + cubes[:, 1]) * base + cubes[:, 2]
+    if base**3 <= DENSE_SETS:
+        id_sums = np.bincount(keys, ids, base**3).astype(np.int64)
+        totals = id_sums.reshape(base, base, base).cumsum(0).cumsum(1).cumsum(2)
+        red, green, blue = np.minimum(limits, base - 1).clip(0).T
+        return np.where((limits >= 0).all(axis=1), totals[red, green, blue], 0)
+
+    unique_keys, game_set = np.unique(keys, return_inverse=True)
+    cube_sets = np.stack(
+        [unique_keys // base**2, unique_keys // base % base, unique_keys % base],
+        axis=1,
     )
+    id_sums = np.bincount(game_set, ids, len(cube_sets)).astype(np.int64)
+    sums = np.empty(len(limits), dtype=np.int64)
+    step = max(1, CHUNK_SIZE // max(1, len(cube_sets)))
+    for start in range(0, len(limits), step):
+        chunk = limits[start : start + step, np.newaxis]
+        # configurations x cube sets
+        possible = (cube_sets[np.newaxis] <= chunk).all(axis=2)
+        sums[start : start + step] = possible @ id_sums
+    return sums
+
+
+def power_sum(table: GameTable) -> int:
+    """Sum of the powers of the smallest cube sets, like `roll_power`."""
+    import numpy as np
+
+    _, cubes = table_min_cubes(table)
+    return int(np.maximum(cubes, 1).astype(np.int64).prod(axis=1).sum())
+
+
+def parse(raw: str) -> GameTable:
+    return parse_table(raw)
+
+
+def part1(table: GameTable) -> int:
+    return int(possible_id_sums(table, [(MAX_RED, MAX_GREEN, MAX_BLUE)])[0])
+
+
+def part2(table: GameTable) -> int:
+    return power_sum(table)
+
+
+def legacy_part1(games: list[Game]) -> int:
+    return sum([g["id"] for g in games if game_possible(g)])
+
+
+def legacy_part2(games: list[Game]) -> int:
+    return sum([roll_power(min_cubes(g)) for g in games])
+
+
+def main() -> tuple[int, int]:
+    table = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(table), part2(table)
 
 
 if __name__ == "__main__":
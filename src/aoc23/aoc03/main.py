@@ -1,9 +1,16 @@
 import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
 from pprint import pp
+from typing import NamedTuple
 
-from aoc23.support import get_input
+from aoc23.support import iter_input, read_input
+
+INPUT = "input01.txt"
+
+SYMBOL = re.compile(r"[^\d.]")
 
 
 @dataclass(frozen=True)
@@ -20,15 +27,26 @@ class Pos:
     row: int
 
 
-def parse_input(lines: list[str]) -> tuple[list[Pos], set[ValueCoord]]:
+class Schematic(NamedTuple):
+    symbols: list[Pos]
+    numbers: list[ValueCoord]  # indexed by the ids in cells
+    # id of the number covering each cell row by row, -1 if there is none
+    cells: list[int]
+    width: int
+
+
+def parse_input(lines: list[str]) -> Schematic:
+    width = max(map(len, lines), default=0)
     symbols: list[Pos] = []
-    coords: set[ValueCoord] = set()
+    numbers: list[ValueCoord] = []
+    cells = [-1] * (width * len(lines))
     for irow, row in enumerate(lines):
-        for icol, col in enumerate(row):
-            if not col.isdigit() and col != ".":
-                symbols.append(Pos(icol, irow))
-        coords |= parse_numbers(row, irow)
-    return symbols, coords
+        symbols.extend(Pos(m.start(), irow) for m in SYMBOL.finditer(row))
+        for vco in parse_numbers(row, irow):
+            start, end = irow * width + vco.col_begin, irow * width + vco.col_end + 1
+            cells[start:end] = [len(numbers)] * (end - start)
+            numbers.append(vco)
+    return Schematic(symbols, numbers, cells, width)
 
 
 def parse_numbers(line: str, row: int) -> set[ValueCoord]:
@@ -39,43 +57,117 @@ def parse_numbers(line: str, row: int) -> set[ValueCoord]:
     }
 
 
-def get_adjacent(sym: Pos, value_coords: set[ValueCoord]) -> set[ValueCoord]:
-    matches: set[ValueCoord] = set()
-    for vco in value_coords:
-        # is there a number next to the symbol in the same or surrounding rows?
-        if (
-            vco.row in (sym.row - 1, sym.row, sym.row + 1)
-            and vco.col_begin - 1 <= sym.col <= vco.col_end + 1
-        ):
-            matches.add(vco)
+def adjacent_ids(sym: Pos, schematic: Schematic) -> set[int]:
+    """Ids of the numbers in the eight cells around `sym`."""
+    width, cells = schematic.width, schematic.cells
+    left, right = max(0, sym.col - 1), min(width, sym.col + 2)
+    ids: set[int] = set()
+    for row in range(max(0, sym.row - 1), min(len(cells) // width, sym.row + 2)):
+        ids.update(cells[row * width + left : row * width + right])
+    ids.discard(-1)
+    return ids
 
-    return matches
 
+def get_adjacent(sym: Pos, schematic: Schematic) -> set[ValueCoord]:
+    return {schematic.numbers[i] for i in adjacent_ids(sym, schematic)}
 
-def collect_adjacent(symbols: list[Pos], value_coords: set[ValueCoord]) -> int:
-    coords: set[ValueCoord] = set()
-    for sym in symbols:
-        if c := get_adjacent(sym, value_coords):
-            coords |= c
-    return sum(c.value for c in coords)
 
+def collect_adjacent(schematic: Schematic) -> int:
+    ids: set[int] = set()
+    for sym in schematic.symbols:
+        ids |= adjacent_ids(sym, schematic)
+    return sum(schematic.numbers[i].value for i in ids)
 
-def collect_adjacent2(symbols: list[Pos], value_coords: set[ValueCoord]) -> int:
+
+def collect_adjacent2(schematic: Schematic) -> int:
     gear: list[int] = []
-    for sym in symbols:
-        if (c := get_adjacent(sym, value_coords)) and len(c) == 2:  # noqa: PLR2004
-            a, b = (co.value for co in c)
+    for sym in schematic.symbols:
+        if len(ids := adjacent_ids(sym, schematic)) == 2:  # noqa: PLR2004
+            a, b = (schematic.numbers[i].value for i in ids)
             gear.append(a * b)
     return sum(gear)
 
 
-def main() -> tuple[int, int]:
+def parse(raw: str) -> Schematic:
     # Build a list of Values and their coordinates
-    lines1: list[str] = get_input(Path(__file__).parent / "input01.txt")
-    symbols, value_coords = parse_input(lines1)
-    value = collect_adjacent(symbols, value_coords)
-    gear = collect_adjacent2(symbols, value_coords)
-    return value, gear
+    return parse_input(raw.split("\n"))
+
+
+def part1(schematic: Schematic) -> int:
+    return collect_adjacent(schematic)
+
+
+def part2(schematic: Schematic) -> int:
+    return collect_adjacent2(schematic)
+
+
+# a row of the schematic and its numbers ordered by column
+Row = tuple[str, list[ValueCoord]]
+
+
+class WindowRow(NamedTuple):
+    row: int
+    part_numbers: list[int]  # numbers of the row next to a symbol
+    gear_ratios: list[int]  # products of the two numbers next to a symbol of the row
+
+
+def numbered_row(line: str, row: int) -> Row:
+    return line, sorted(parse_numbers(line, row), key=lambda vco: vco.col_begin)
+
+
+def window_row(irow: int, prev: Row, cur: Row, nxt: Row) -> WindowRow:
+    """Part numbers and gear ratios of `cur`, the only row they may be on."""
+    window = (prev, cur, nxt)
+    part_numbers = [
+        vco.value
+        for vco in cur[1]
+        if any(
+            SYMBOL.search(line, max(0, vco.col_begin - 1), vco.col_end + 2)
+            for line, _ in window
+        )
+    ]
+    gear_ratios = []
+    for sym in SYMBOL.finditer(cur[0]):
+        col = sym.start()
+        adjacent = [
+            vco.value
+            for _, numbers in window
+            for vco in numbers
+            if vco.col_begin - 1 <= col <= vco.col_end + 1
+        ]
+        if len(adjacent) == 2:  # noqa: PLR2004
+            gear_ratios.append(adjacent[0] * adjacent[1])
+    return WindowRow(irow, part_numbers, gear_ratios)
+
+
+def stream_schematic(lines: Iterable[str]) -> Iterator[WindowRow]:
+    """Part numbers and gear ratios row by row, e.g. of the lines of `iter_input`.
+
+    Only the previous, the current and the next row are held in memory, a row
+    is emitted once the row after it was read.
+    """
+    rows = (numbered_row(line, irow) for irow, line in enumerate(lines))
+    if (cur := next(rows, None)) is None:
+        return
+    prev: Row = ("", [])
+    for irow, nxt in enumerate(chain(rows, [("", [])])):
+        yield window_row(irow, prev, cur, nxt)
+        prev, cur = cur, nxt
+
+
+def solve_stream(lines: Iterable[str]) -> tuple[int, int]:
+    part_numbers = gear_ratios = 0
+    for row in stream_schematic(lines):
+        part_numbers += sum(row.part_numbers)
+        gear_ratios += sum(row.gear_ratios)
+    return part_numbers, gear_ratios
+
+
+def main(streaming: bool = False) -> tuple[int, int]:  # noqa: FBT001, FBT002
+    if streaming:
+        return solve_stream(iter_input(Path(__file__).parent / INPUT))
+    parsed = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(parsed), part2(parsed)
 
 
 if __name__ == "__main__":
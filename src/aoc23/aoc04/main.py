@@ -1,9 +1,13 @@
 import re
+from collections import deque
+from collections.abc import Iterable
 from pathlib import Path
 from pprint import pp
 from typing import TypedDict
 
-from aoc23.support import get_input
+from aoc23.support import iter_input
+
+INPUT = "input01.txt"
 
 
 class Card(TypedDict):
@@ -22,26 +26,46 @@ def parse_line(line: str) -> Card:
     )
 
 
-def get_worth(pile: list[Card]) -> int:
+def get_worth(pile: Iterable[Card]) -> int:
     """Solution 1."""
     return sum(2 ** (c["matches"] - 1) for c in pile if c["matches"] > 0)
 
 
-def accumulate(pile: list[Card]) -> int:
+def accumulate(pile: Iterable[Card]) -> int:
     """Solution 2."""
-    by_id = {card["id"]: card["matches"] for card in pile}
-    final_pile = {cid: 1 for cid, _ in by_id.items()}
+    total = 0
+    # copies won for the cards following the current one, see the table below
+    pending: deque[int] = deque()
+
+    for card in pile:
+        copies = 1 + (pending.popleft() if pending else 0)
+        total += copies
+        for i in range(card["matches"]):
+            if i < len(pending):
+                pending[i] += copies
+            else:
+                pending.append(copies)
+    return total
+
+
+def parse(raw: str) -> list[Card]:
+    return [parse_line(line) for line in raw.split("\n")]
 
-    for cardid, matches in by_id.items():
-        copies = final_pile[cardid]
-        for cid in range(cardid + 1, cardid + 1 + matches):
-            final_pile[cid] += copies
-    return sum(list(final_pile.values()))
+
+def part1(cards: list[Card]) -> int:
+    return get_worth(cards)
+
+
+def part2(cards: list[Card]) -> int:
+    return accumulate(cards)
 
 
 def main() -> tuple[int, int]:
-    cards = get_input(Path(__file__).parent / "input01.txt", parse_line)
-    return get_worth(cards), accumulate(cards)
+    # streams the input twice instead of parsing it once, see `Solver`
+    inputfile = Path(__file__).parent / INPUT
+    return get_worth(iter_input(inputfile, parse_line)), accumulate(
+        iter_input(inputfile, parse_line)
+    )
 
 
 if __name__ == "__main__":
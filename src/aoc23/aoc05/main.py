@@ -4,7 +4,9 @@ from itertools import batched
 from pathlib import Path
 from pprint import pp
 
-from aoc23.support import get_input
+from aoc23.support import read_input
+
+INPUT = "input01.txt"
 
 sections = [
     "seed-to-soil map:",
@@ -169,12 +171,24 @@ def find_location(mappings: Mappings, seed_ranges: list[range]) -> int:
     return min([r.start for r in seed_ranges])
 
 
-def main() -> tuple[int, int]:
-    lines: list[str] = get_input(Path(__file__).parent / "input01.txt")
-    seeds, mappings = parse_input(lines)
-    solution1 = {seed: find_mapped_value(mappings, seed)[-1] for seed in seeds}
+def parse(raw: str) -> tuple[Seeds, Mappings]:
+    return parse_input(raw.split("\n"))
+
+
+def part1(parsed: tuple[Seeds, Mappings]) -> int:
+    seeds, mappings = parsed
+    return min(find_mapped_value(mappings, seed)[-1] for seed in seeds)
+
+
+def part2(parsed: tuple[Seeds, Mappings]) -> int:
+    seeds, mappings = parsed
     ranges = [range(seed, seed + length) for seed, length in batched(seeds, 2)]
-    return min(solution1.values()), find_location(mappings, ranges)
+    return find_location(mappings, ranges)
+
+
+def main() -> tuple[int, int]:
+    parsed = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(parsed), part2(parsed)
 
 
 if __name__ == "__main__":
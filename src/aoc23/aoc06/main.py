@@ -3,7 +3,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from pprint import pp
 
-from aoc23.support import get_input
+from aoc23.support import read_input
+
+INPUT = "input01.txt"
 
 
 @dataclass
@@ -41,9 +43,21 @@ def solution(races: list[Race]) -> int:
     return result
 
 
+def parse(raw: str) -> list[str]:
+    return raw.split("\n")
+
+
+def part1(lines: list[str]) -> int:
+    return solution(get_races_01(lines))
+
+
+def part2(lines: list[str]) -> int:
+    return solution(get_races_02(lines))
+
+
 def main() -> tuple[int, int]:
-    lines: list[str] = get_input(Path(__file__).parent / "input01.txt")
-    return solution(get_races_01(lines)), solution(get_races_02(lines))
+    lines = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(lines), part2(lines)
 
 
 if __name__ == "__main__":
@@ -7,7 +7,9 @@ from pathlib import Path
 from pprint import pp
 from typing import Self
 
-from aoc23.support import get_input
+from aoc23.support import read_input
+
+INPUT = "input01.txt"
 
 CARD_MAP_1 = {"T": 10, "J": 11, "Q": 12, "K": 13, "A": 14}
 CARD_MAP_1.update({str(c): c for c in range(2, 10)})
@@ -131,10 +133,26 @@ def solution2(cards: list[Cards]) -> int:
     return sum([rank * c.bid for rank, c in enumerate(sorted(cards), start=1)])
 
 
+def parse(raw: str) -> list[tuple[str, int]]:
+    """Hands and bids, the card values depend on the part."""
+    return [(hand, int(bid)) for hand, bid in map(str.split, raw.split("\n"))]
+
+
+def deal(hands: list[tuple[str, int]], card_map: dict[str, int]) -> list[Cards]:
+    return [Cards([card_map[c] for c in hand], bid) for hand, bid in hands]
+
+
+def part1(hands: list[tuple[str, int]]) -> int:
+    return solution1(deal(hands, CARD_MAP_1))
+
+
+def part2(hands: list[tuple[str, int]]) -> int:
+    return solution2(deal(hands, CARD_MAP_2))
+
+
 def main() -> tuple[int, int]:
-    cards1 = get_input(Path(__file__).parent / "input01.txt", parse_line(CARD_MAP_1))  # type: ignore  # noqa: PGH003
-    cards2 = get_input(Path(__file__).parent / "input01.txt", parse_line(CARD_MAP_2))  # type: ignore  # noqa: PGH003
-    return solution1(cards1), solution2(cards2)
+    hands = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(hands), part2(hands)
 
 
 if __name__ == "__main__":
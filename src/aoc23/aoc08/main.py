@@ -1,50 +1,77 @@
+from __future__ import annotations
+
 import itertools
 import re
 from math import lcm
 from pathlib import Path
 from pprint import pp
-from typing import Callable
+from typing import TYPE_CHECKING
+
+from aoc23.support import read_input
+
+if TYPE_CHECKING:
+    from aoc23.support.graph import Graph
+
+INPUT = "input01.txt"
+
+
+Network = tuple[list[int], "Graph[str]", list[str]]
 
-from aoc23.support import get_input
 
+def parse_input(lines: list[str]) -> Network:
+    """Instructions as edge offsets (L=0, R=1) and the network as graph.
 
-def parse(lines: list[str]) -> tuple[str, dict[str, list[str]], list[str]]:
-    inst = lines[0]
-    start_nodes = []
+    Every node has exactly two edges, left before right.
+    """
+    from aoc23.support.graph import Graph
 
+    inst = [0 if c == "L" else 1 for c in lines[0]]
     tree = {}
     for line in lines[2:]:
         _key, _left, _right = re.findall(r"\w+", line)
-        tree.update({_key: [_left, _right]})
-        if _key.endswith("A"):
-            start_nodes.append(_key)
-    return inst, tree, start_nodes
+        tree[_key] = [_left, _right]
+    start_nodes = [node for node in tree if node.endswith("A")]
+    return inst, Graph.from_adjacency(tree), start_nodes
 
 
-def solution1(inst: str, m: dict, start_node: str, stop_crit: Callable) -> int:
-    g = itertools.cycle(inst)
-    next_node, steps = start_node, 0
+def solution1(inst: list[int], graph: Graph[str], start_node: str, stop: str) -> int:
+    """Steps from `start_node` to the first node whose label ends with `stop`."""
+    is_stop = bytearray(label.endswith(stop) for label in graph.labels)
+    offsets, targets = graph.offsets, graph.targets
+    node, steps = graph.index(start_node), 0
 
-    while not stop_crit(next_node) and (next_instruction := next(g)):
-        left, right = m[next_node]
-        next_node = left if next_instruction == "L" else right
+    for step in itertools.cycle(inst):
+        if is_stop[node]:
+            break
+        node = targets[offsets[node] + step]
         steps += 1
     return steps
 
 
-def solution2(inst: str, m: dict, start_nodes: list[str]) -> int:
+def solution2(inst: list[int], graph: Graph[str], start_nodes: list[str]) -> int:
     results = []
     for start in start_nodes:
-        s = solution1(inst, m, start, lambda n: n.endswith("Z"))
+        s = solution1(inst, graph, start, "Z")
         results.append(s)
     return lcm(*results)
 
 
+def parse(raw: str) -> Network:
+    return parse_input(raw.split("\n"))
+
+
+def part1(parsed: Network) -> int:
+    inst, graph, _ = parsed
+    return solution1(inst, graph, "AAA", "ZZZ")
+
+
+def part2(parsed: Network) -> int:
+    return solution2(*parsed)
+
+
 def main() -> tuple[int, int]:
-    inst, tree, start_nodes = parse(get_input(Path(__file__).parent / "input01.txt"))
-    return solution1(inst, tree, "AAA", lambda n: n == "ZZZ"), solution2(
-        inst, tree, start_nodes
-    )
+    parsed = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(parsed), part2(parsed)
 
 
 if __name__ == "__main__":
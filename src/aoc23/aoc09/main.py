@@ -1,13 +1,16 @@
+from collections.abc import Iterable
 from pathlib import Path
 from pprint import pp
 from typing import Callable
 
-from aoc23.support import get_input
+from aoc23.support import iter_input
+
+INPUT = "input01.txt"
 
 History = list[list[int]]
 
 
-def parse(line: str) -> list[int]:
+def parse_line(line: str) -> list[int]:
     return [int(n) for n in line.split()]
 
 
@@ -44,15 +47,29 @@ def extrap2(history: History) -> int:
 
 
 def solution(
-    input_lines: list[list[int]], extrapolate: Callable[[History], int]
+    input_lines: Iterable[list[int]], extrapolate: Callable[[History], int]
 ) -> int:
-    all_values = [extrapolate(create_history(line)) for line in input_lines]
-    return sum(all_values)
+    return sum(extrapolate(create_history(line)) for line in input_lines)
+
+
+def parse(raw: str) -> list[list[int]]:
+    return [parse_line(line) for line in raw.split("\n")]
+
+
+def part1(lines: list[list[int]]) -> int:
+    return solution(lines, extrap1)
+
+
+def part2(lines: list[list[int]]) -> int:
+    return solution(lines, extrap2)
 
 
 def main() -> tuple[int, int]:
-    lines = get_input(Path(__file__).parent / "input01.txt", parse)
-    return solution(lines, extrap1), solution(lines, extrap2)
+    # streams the input twice instead of parsing it once, see `Solver`
+    inputfile = Path(__file__).parent / INPUT
+    return solution(iter_input(inputfile, parse_line), extrap1), solution(
+        iter_input(inputfile, parse_line), extrap2
+    )
 
 
 if __name__ == "__main__":
@@ -4,7 +4,9 @@ from pathlib import Path
 from pprint import pp
 from typing import NamedTuple
 
-from aoc23.support import get_input
+from aoc23.support import read_input, trace
+
+INPUT = "ex01.txt"
 
 
 class Pos(NamedTuple):
@@ -120,6 +122,7 @@ def get_starting_directions(
     raise ValueError(msg)
 
 
+@trace.traced
 def bfs(grid: Grid, initial_pos: Pos, initial_dir: Direction) -> list[Pos]:
     steps: int = 1
     visited = {initial_pos}
@@ -141,6 +144,7 @@ def bfs(grid: Grid, initial_pos: Pos, initial_dir: Direction) -> list[Pos]:
                 positions.append(new_pos)
                 frontier.append((new_pos, steps + 1))
 
+    trace.counter("states_visited", len(visited))
     return positions
 
 
@@ -157,9 +161,21 @@ def solution1(grid: Grid) -> int:
     return i
 
 
+def parse(raw: str) -> list[str]:
+    return raw.split("\n")
+
+
+def part1(lines: list[str]) -> int:
+    return solution1(lines)
+
+
+def part2(lines: list[str]) -> int:  # noqa: ARG001
+    return 0
+
+
 def main() -> tuple[int, int]:
-    lines = get_input(Path(__file__).parent / "ex01.txt")
-    return solution1(lines), 0
+    lines = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(lines), part2(lines)
 
 
 if __name__ == "__main__":
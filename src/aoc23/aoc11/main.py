@@ -2,9 +2,9 @@ from pathlib import Path
 from pprint import pp
 from typing import NamedTuple
 
-import numpy as np
-import pandas as pd
-from aoc23.support import get_input
+from aoc23.support import read_input
+
+INPUT = "input01.txt"
 
 
 class Pos(NamedTuple):
@@ -17,7 +17,7 @@ Grid = list[str]
 
 def update_galaxy_positions(
     galaxies: list[Pos],
-    empty_cols: list[str],
+    empty_cols: list[int],
     empty_rows: list[int],
     expansion_factor: int,
 ) -> list[Pos]:
@@ -32,7 +32,11 @@ def update_galaxy_positions(
     return new_pos
 
 
-def parse_input(grid: Grid, expansion_factor: int) -> list[Pos]:
+def find_galaxies(grid: Grid) -> tuple[list[Pos], list[int], list[int]]:
+    """Positions of the galaxies, the empty columns and the empty rows."""
+    import numpy as np
+    import pandas as pd
+
     # Create a DataFrame from the grid
     galaxymap = pd.DataFrame([list(row) for row in grid])
 
@@ -54,12 +58,11 @@ def parse_input(grid: Grid, expansion_factor: int) -> list[Pos]:
     # Convert coordinates to namedtuples
     galaxy_positions = [Pos(col, row) for row, col in galaxies]
 
-    return update_galaxy_positions(
-        galaxy_positions,
-        list(empty_cols.columns),
-        list(empty_rows.index),
-        expansion_factor,
-    )
+    return galaxy_positions, list(empty_cols.columns), list(empty_rows.index)
+
+
+def parse_input(grid: Grid, expansion_factor: int) -> list[Pos]:
+    return update_galaxy_positions(*find_galaxies(grid), expansion_factor)
 
 
 def manhattan(pos1: Pos, pos2: Pos) -> int:
@@ -73,10 +76,21 @@ def solution(galaxies: list[Pos]) -> int:
     return sum(distances)
 
 
+def parse(raw: str) -> tuple[list[Pos], list[int], list[int]]:
+    return find_galaxies(raw.split("\n"))
+
+
+def part1(parsed: tuple[list[Pos], list[int], list[int]]) -> int:
+    return solution(update_galaxy_positions(*parsed, 2))
+
+
+def part2(parsed: tuple[list[Pos], list[int], list[int]]) -> int:
+    return solution(update_galaxy_positions(*parsed, 1000000))
+
+
 def main() -> tuple[int, int]:
-    galaxies1 = parse_input(get_input(Path(__file__).parent / "input01.txt"), 2)
-    galaxies2 = parse_input(get_input(Path(__file__).parent / "input01.txt"), 1000000)
-    return solution(galaxies1), solution(galaxies2)
+    parsed = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(parsed), part2(parsed)
 
 
 if __name__ == "__main__":
@@ -4,7 +4,9 @@ from pathlib import Path
 from pprint import pp
 from typing import NamedTuple
 
-from aoc23.support import get_input
+from aoc23.support import progress, read_input
+
+INPUT = "input01.txt"
 
 
 class Arrangement(NamedTuple):
@@ -89,14 +91,32 @@ def gen_pattern_rec(pattern: str, groups: tuple[int]) -> int:  # noqa: PLR0911
 
 
 def solution(arr: list[Arrangement]) -> int:
-    results = [gen_pattern_rec(a.pattern, tuple(a.springs)) for a in arr]
+    results = []
+    for i, a in enumerate(arr):
+        progress.report("arrangements", i, len(arr))
+        results.append(gen_pattern_rec(a.pattern, tuple(a.springs)))
     return sum(results)
 
 
+def unfold(a: Arrangement) -> Arrangement:
+    return parse_line2(f"{a.pattern} {','.join(map(str, a.springs))}")
+
+
+def parse(raw: str) -> list[Arrangement]:
+    return [parse_line(line) for line in raw.split("\n")]
+
+
+def part1(arr: list[Arrangement]) -> int:
+    return solution(arr)
+
+
+def part2(arr: list[Arrangement]) -> int:
+    return solution([unfold(a) for a in arr])
+
+
 def main() -> tuple[int, int]:
-    arr = get_input(Path(__file__).parent / "input01.txt", parse_line)
-    arr2 = get_input(Path(__file__).parent / "input01.txt", parse_line2)
-    return solution(arr), solution(arr2)
+    arr = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(arr), part2(arr)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,15 @@
+from __future__ import annotations
+
 from pathlib import Path
 from pprint import pp
-from typing import NamedTuple
+from typing import TYPE_CHECKING, NamedTuple
+
+from aoc23.support import read_input
 
-import pandas as pd
-from aoc23.support import get_input
+if TYPE_CHECKING:
+    import pandas as pd
+
+INPUT = "input01.txt"
 
 Grid = list[str]
 
@@ -21,6 +27,8 @@ class P1Result(NamedTuple):
 
 
 def parse_input(mirror_map: list[str]) -> list[Grid]:
+    import pandas as pd
+
     grids = []
     m = []
     for line in mirror_map:
@@ -99,6 +107,8 @@ def solution(puzzle_id: int, g: pd.DataFrame) -> P1Result:
 
 
 def solution2(g: pd.DataFrame, p1r: P1Result):
+    # smudges are tried on a copy, the parsed grids are shared by the parts
+    g = g.copy()
     rows, cols = g.shape
 
     p1col_refl = set(p1r.refl_cols)
@@ -150,21 +160,22 @@ def solution2(g: pd.DataFrame, p1r: P1Result):
     return res
 
 
-def main() -> tuple[int, int]:
-    s0 = [
-        solution(i, g)
-        for i, g in enumerate(
-            parse_input(get_input(Path(__file__).parent / "input01.txt"))
-        )
-    ]
-    s2 = [
-        solution2(g, s0[i])
-        for i, g in enumerate(
-            parse_input(get_input(Path(__file__).parent / "input01.txt"))
-        )
-    ]
+def parse(raw: str) -> list[pd.DataFrame]:
+    return parse_input(raw.split("\n"))
+
+
+def part1(grids: list[pd.DataFrame]) -> int:
+    return sum(solution(i, g).result for i, g in enumerate(grids))
+
 
-    return sum(p1r.result for p1r in s0), sum(s2)  # solution(galaxies2)
+def part2(grids: list[pd.DataFrame]) -> int:
+    # the reflections of part 1 are recomputed, the parts run independently
+    return sum(solution2(g, solution(i, g)) for i, g in enumerate(grids))
+
+
+def main() -> tuple[int, int]:
+    grids = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(grids), part2(grids)
 
 
 if __name__ == "__main__":
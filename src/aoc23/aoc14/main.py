@@ -4,7 +4,9 @@ from pathlib import Path
 from pprint import pp
 from typing import NamedTuple
 
-from aoc23.support import get_input
+from aoc23.support import progress, read_input
+
+INPUT = "input01.txt"
 
 
 def parse_input(input_lines: list[str]) -> tuple[str, ...]:
@@ -89,6 +91,7 @@ def solution2(grid: tuple[str, ...]) -> int:
     cycle_len, stop_cycle = 0, -1
     new_grid = grid
     for cycle in range(1000000000):
+        progress.report("cycles", cycle)
         new_grid = tiltcycle(new_grid)
 
         if new_grid in grids and len(grids[new_grid]) > 1 and cycle_len == 0:
@@ -98,6 +101,9 @@ def solution2(grid: tuple[str, ...]) -> int:
             # plausi check
             assert (1000000000 - (repeat_cycle_start + rest)) % cycle_len == 0
             stop_cycle = repeat_cycle_start + rest + cycle_len - 1
+            if stop_cycle < cycle:
+                # already passed, e.g. for a cycle of length 1
+                stop_cycle += cycle_len
 
         grids[new_grid] += [cycle]
         if cycle == stop_cycle:
@@ -107,9 +113,21 @@ def solution2(grid: tuple[str, ...]) -> int:
     return calc_weigth(new_grid)
 
 
+def parse(raw: str) -> tuple[str, ...]:
+    return parse_input(raw.split("\n"))
+
+
+def part1(grid: tuple[str, ...]) -> int:
+    return solution1(grid)
+
+
+def part2(grid: tuple[str, ...]) -> int:
+    return solution2(grid)
+
+
 def main() -> tuple[int, int]:
-    lines = parse_input(get_input(Path(__file__).parent / "input01.txt"))
-    return solution1(lines), solution2(lines)
+    grid = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(grid), part2(grid)
 
 
 if __name__ == "__main__":
@@ -4,7 +4,9 @@ from pathlib import Path
 from pprint import pp
 from typing import NamedTuple
 
-from aoc23.support import get_input
+from aoc23.support import read_input
+
+INPUT = "input01.txt"
 
 Steps = tuple[str, ...]
 
@@ -83,9 +85,21 @@ def solution1(steps: Steps) -> int:
     return sum([holiday_hash(step) for step in steps])
 
 
+def parse(raw: str) -> Steps:
+    return parse_input(raw.split("\n"))
+
+
+def part1(steps: Steps) -> int:
+    return solution1(steps)
+
+
+def part2(steps: Steps) -> int:
+    return solution2([parse_lens(step) for step in steps])
+
+
 def main() -> tuple[int, int]:
-    steps = parse_input(get_input(Path(__file__).parent / "input01.txt"))
-    return solution1(steps), solution2([parse_lens(step) for step in steps])
+    steps = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(steps), part2(steps)
 
 
 if __name__ == "__main__":
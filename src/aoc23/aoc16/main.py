@@ -6,7 +6,9 @@ from pathlib import Path
 from pprint import pp
 from typing import Final, NamedTuple
 
-from aoc23.support import get_input
+from aoc23.support import read_input, trace
+
+INPUT = "input01.txt"
 
 Grid = list[str]
 
@@ -72,6 +74,7 @@ def get_next_pos(
     )
 
 
+@trace.traced
 def bfs(
     grid: Grid,
     initial_pos: Pos,
@@ -89,6 +92,7 @@ def bfs(
             if is_inside_grid(grid, pos):
                 frontier.append((pos, d))
 
+    trace.counter("states_visited", len(visited))
     return visited
 
 
@@ -107,14 +111,27 @@ def solution2(grid: Grid) -> int:
     for start_pos, flow_dir in p:
         all_visited = bfs(grid, start_pos, flow_dir)
         visited = len({pos for pos, _ in all_visited})
+        trace.gauge("energized", visited)
         energized = max(energized, visited)
 
     return energized
 
 
+def parse(raw: str) -> Grid:
+    return raw.split("\n")
+
+
+def part1(grid: Grid) -> int:
+    return solution1(grid)
+
+
+def part2(grid: Grid) -> int:
+    return solution2(grid)
+
+
 def main() -> tuple[int, int]:
-    lines = get_input(Path(__file__).parent / "input01.txt")
-    return solution1(lines), solution2(lines)
+    grid = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(grid), part2(grid)
 
 
 if __name__ == "__main__":
@@ -5,7 +5,9 @@ from pathlib import Path
 from pprint import pp
 from typing import Callable, NamedTuple
 
-from aoc23.support import get_input
+from aoc23.support import read_input
+
+INPUT = "input01.txt"
 
 Grid = list[list[str]]
 
@@ -91,9 +93,21 @@ def solution(lines: list[str], decode: Callable[[str], tuple[str, int]]) -> int:
     return int(A + perimeter(vertices) / 2 + 1)  # Pick's theorem
 
 
+def parse(raw: str) -> list[str]:
+    return raw.split("\n")
+
+
+def part1(lines: list[str]) -> int:
+    return solution(lines, decode_line1)
+
+
+def part2(lines: list[str]) -> int:
+    return solution(lines, decode_line2)
+
+
 def main() -> tuple[int, int]:
-    lines = get_input(Path(__file__).parent / "input01.txt")
-    return solution(lines, decode_line1), solution(lines, decode_line2)
+    lines = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(lines), part2(lines)
 
 
 if __name__ == "__main__":
@@ -6,7 +6,9 @@ from pathlib import Path
 from pprint import pp
 from typing import Literal
 
-from aoc23.support import get_input
+from aoc23.support import read_input
+
+INPUT = "input01.txt"
 
 
 class Expr(ABC):
@@ -127,9 +129,21 @@ def solution(instructions: dict[str, Instr], vals: list[Rating]) -> int:
     return sum(r for _, t, r in results if t == "A")
 
 
+def parse(raw: str) -> tuple[dict[str, Instr], list[Rating]]:
+    return parse_input(raw.split("\n"))
+
+
+def part1(parsed: tuple[dict[str, Instr], list[Rating]]) -> int:
+    return solution(*parsed)
+
+
+def part2(parsed: tuple[dict[str, Instr], list[Rating]]) -> int:  # noqa: ARG001
+    return 0  # solution(lines)
+
+
 def main() -> tuple[int, int]:
-    instr, vals = parse_input(get_input(Path(__file__).parent / "input01.txt"))
-    return solution(instr, vals), 0  # solution(lines)
+    parsed = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(parsed), part2(parsed)
 
 
 if __name__ == "__main__":
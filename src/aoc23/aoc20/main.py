@@ -5,10 +5,14 @@ from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from pathlib import Path
 from pprint import pp
-from typing import Protocol, TypedDict, cast
+from typing import TYPE_CHECKING, Protocol, TypedDict, cast
 
-import graphviz
-from aoc23.support import get_input
+from aoc23.support import read_input, trace
+
+if TYPE_CHECKING:
+    import graphviz
+
+INPUT = "input01.txt"
 
 LOW = 0
 HIGH = 1
@@ -26,6 +30,8 @@ Circuit = dict[str, CompAttr]
 
 
 def circuit_graph(c: Circuit) -> graphviz.Digraph:
+    import graphviz
+
     # Create a graph
     dot = graphviz.Digraph(comment="Circuit")
 
@@ -61,17 +67,32 @@ def circuit_graph(c: Circuit) -> graphviz.Digraph:
     return dot
 
 
+# type ("&", "%" or "broadcaster"), name and targets of every module
+Wiring = list[tuple[str, str, list[str]]]
+
+
+def parse_wiring(lines: list[str]) -> Wiring:
+    wiring = []
+    for line in lines:
+        name, *targets = line.replace(" -> ", ",").replace(" ", "").split(",")
+        key = name[1:] if name[0] in ("&", "%") else name
+        tkey = name[0] if name[0] in ("&", "%") else name
+        wiring.append((tkey, key, targets))
+    return wiring
+
+
 def parse_input(lines: list[str]) -> Circuit:
+    return build_circuit(parse_wiring(lines))
+
+
+def build_circuit(wiring: Wiring) -> Circuit:
     comptype = {"&": Con, "%": Flop, "broadcaster": Broadcast}
     logic: dict[str, CompAttr] = {
         "button": CompAttr(comp=Button("button"), targets=["broadcaster"]),
         "output": CompAttr(comp=Output("output"), targets=[]),
         "rx": CompAttr(comp=Reset("rx"), targets=[]),
     }
-    for line in lines:
-        name, *targets = line.replace(" -> ", ",").replace(" ", "").split(",")
-        key = name[1:] if name[0] in ("&", "%") else name
-        tkey = name[0] if name[0] in ("&", "%") else name
+    for tkey, key, targets in wiring:
         logic[key] = CompAttr(comp=comptype[tkey](key), targets=targets)
 
     # create the circuit
@@ -179,12 +200,14 @@ class Con(Module):
         self._state = LOW if all(self._inputs.values()) else HIGH
 
 
+@trace.traced
 def solution1(circuit: Circuit) -> int:
     sig_count = defaultdict(lambda: 0)
 
     for _ in range(1000):
         root = circuit["button"]["comp"]
         frontier = deque([root])
+        sent = sig_count[LOW] + sig_count[HIGH]
 
         while frontier:
             current = frontier.popleft()
@@ -199,7 +222,9 @@ def solution1(circuit: Circuit) -> int:
                 # doesn't emit!
                 if not isinstance(c, Flop) or (isinstance(c, Flop) and emitted == LOW):
                     frontier.append(c)
+        trace.gauge("pulses_per_press", sig_count[LOW] + sig_count[HIGH] - sent)
 
+    trace.counter("pulses", sig_count[LOW] + sig_count[HIGH])
     return sig_count[0] * sig_count[1]
 
 
@@ -208,9 +233,23 @@ def solution2(circuit: Circuit) -> int:
     return 0
 
 
+def parse(raw: str) -> Wiring:
+    return parse_wiring(raw.split("\n"))
+
+
+def part1(wiring: Wiring) -> int:
+    # pushing the button changes the state of the modules, every part builds
+    # its own circuit
+    return solution1(build_circuit(wiring))
+
+
+def part2(wiring: Wiring) -> int:
+    return solution2(build_circuit(wiring))
+
+
 def main() -> tuple[int, int]:
-    lines = get_input(Path(__file__).parent / "input01.txt")
-    return solution1(parse_input(lines)), solution2(parse_input(lines))
+    wiring = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(wiring), part2(wiring)
 
 
 if __name__ == "__main__":
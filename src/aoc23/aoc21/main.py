@@ -1,23 +1,17 @@
 from __future__ import annotations
 
-from enum import Enum
 from pathlib import Path
 from pprint import pp
 
-from aoc23.support import get_input
+from aoc23.support import read_input
+
+INPUT = "input01.txt"
 
 Grid = list[str]
 
 Pos = complex  # x=real, y=imag
 
 
-class Direction(Enum):
-    LEFT = -1
-    RIGHT = 1
-    UP = -1j
-    DOWN = 1j
-
-
 def print_grid(grid: Grid) -> None:
     for row in grid:
         pp(row)
@@ -32,40 +26,24 @@ def make_grid(grid: Grid, steps: set[Pos]) -> Grid:
     return ["".join(row) for row in g]
 
 
-def get_start_pos(grid: Grid, char: str) -> Pos:
-    for r, row in enumerate(grid):
-        if (c := row.find(char)) > -1:
-            return Pos(c, r)
-    msg = f"{char} not found in grid"
-    raise ValueError(msg)
+def reachable(grid: Grid, steps: int) -> int:
+    """Number of plots reachable in exactly `steps` steps.
 
+    Everything outside the grid is garden, the grid is padded accordingly.
+    """
+    from aoc23.support.grid import Grid as CellGrid
+    from aoc23.support.grid import dilate
 
-def move(grid: Grid, initial_pos: Pos, step_count: int) -> set[tuple[int, Pos]]:
-    blocks = {
-        c + r * 1j
-        for r, row in enumerate(grid)
-        for c, col in enumerate(row)
-        if col == "#"
-    }
-    # for every round, move away from every plot 1 step
-    visited: set[tuple[int, Pos]] = {(0, initial_pos)}
-    for _ in range(step_count):
-        local_stack: set[tuple[int, Pos]] = set()
-        for steps, pos in visited:
-            reachable_neighbors = {
-                (steps + 1, n)
-                for n in {pos + offs.value for offs in Direction}
-                if n not in blocks
-            }
-            local_stack |= reachable_neighbors
-        visited |= set(local_stack)
-    return visited
+    cells = CellGrid.from_lines(grid).pad(steps, ".")
+    garden = ~cells.mask("#")
+    front = cells.mask("S")
+    for _ in range(steps):
+        front = dilate(front) & garden
+    return int(front.sum())
 
 
 def solution1(grid: Grid) -> int:
-    steps = 64
-    visited = move(grid, get_start_pos(grid, "S"), steps)
-    return len({v for s, v in visited if s == steps})
+    return reachable(grid, 64)
 
 
 def cmod(x: complex, modulo: int) -> complex:
@@ -103,9 +81,21 @@ def solution2(grid: Grid) -> int:
     return calculate(goal // modulo, *done)
 
 
+def parse(raw: str) -> Grid:
+    return raw.split("\n")
+
+
+def part1(grid: Grid) -> int:
+    return solution1(grid)
+
+
+def part2(grid: Grid) -> int:
+    return solution2(grid)
+
+
 def main() -> tuple[int, int]:
-    lines = get_input(Path(__file__).parent / "input01.txt")
-    return solution1(lines), solution2(lines)
+    grid = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(grid), part2(grid)
 
 
 if __name__ == "__main__":
@@ -4,12 +4,13 @@ from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from functools import reduce
 from itertools import chain
-from math import inf
 from pathlib import Path
 from pprint import pp
 from typing import Iterable
 
-from aoc23.support import get_input
+from aoc23.support import read_input, trace
+
+INPUT = "input01.txt"
 
 Grid = list[list[int]]
 
@@ -88,6 +89,7 @@ def resting_on(bottom: Iterable[Brick], brick: Brick) -> set[Brick]:
     )
 
 
+@trace.traced
 def pulldown(all_bricks: dict[int, list[Brick]]) -> tuple[dict[Brick, set[Brick]], int]:
     """Return the number of bricks that could be disintegrated."""
     processed = set()  # set(_bottom)
@@ -99,6 +101,7 @@ def pulldown(all_bricks: dict[int, list[Brick]]) -> tuple[dict[Brick, set[Brick]
 
     while remaining:
         brick = remaining.popleft()
+        trace.gauge("remaining_bricks", len(remaining))
         rests_on = resting_on(processed, brick)
         processed.add(brick)
         if rests_on:
@@ -115,6 +118,7 @@ def pulldown(all_bricks: dict[int, list[Brick]]) -> tuple[dict[Brick, set[Brick]
             brick.z1, brick.z2 = new_z1, new_z2
             bricks_dropped += 1
 
+    trace.counter("bricks_dropped", bricks_dropped)
     return resting_map, bricks_dropped
 
 
@@ -138,15 +142,13 @@ def solution1(bricks: list[Brick]) -> int:
 
 
 def get_dim(bricks: Iterable[Brick]) -> tuple[int, int]:
-    min_x = min_y = inf
-    max_x = max_y = -inf
+    """Largest x and y, the grid is indexed by the absolute coordinates."""
+    max_x = max_y = 0
     for b in bricks:
-        min_x = min(min_x, b.x1, b.x2)
-        min_y = min(min_y, b.y1, b.y2)
         max_x = max(max_x, b.x1, b.x2)
         max_y = max(max_y, b.y1, b.y2)
 
-    return int(max_x - min_x), int(max_y - min_y)
+    return max_x, max_y
 
 
 def update_grid(grid: Grid, b: Brick) -> int:
@@ -195,13 +197,35 @@ def solution2(bricks: list[Brick]) -> int:
     )
 
 
-def main() -> tuple[int, int]:
-    lines = get_input(Path(__file__).parent / "input01.txt")
-    blocks = sorted(
-        [parse_line(i, line) for i, line in enumerate(lines, start=1)],
+def settled(bricks: list[Brick]) -> list[Brick]:
+    """Copies of `bricks` (sorted by z1) after falling down, sorted by z1."""
+    clones = [b.clone() for b in bricks]
+    layers: dict[int, list[Brick]] = defaultdict(list)
+    for b in clones:
+        layers[b.z1].append(b)
+    pulldown(layers)
+    return sorted(clones, key=lambda brck: brck.z1)
+
+
+def parse(raw: str) -> list[Brick]:
+    return sorted(
+        [parse_line(i, line) for i, line in enumerate(raw.split("\n"), start=1)],
         key=lambda brck: brck.z1,
     )
-    return solution1(blocks), solution2(sorted(blocks, key=lambda brck: brck.z1))
+
+
+def part1(bricks: list[Brick]) -> int:
+    # solution1 lets the bricks fall, i.e. modifies them
+    return solution1([b.clone() for b in bricks])
+
+
+def part2(bricks: list[Brick]) -> int:
+    return solution2(settled(bricks))
+
+
+def main() -> tuple[int, int]:
+    bricks = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(bricks), part2(bricks)
 
 
 if __name__ == "__main__":
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
 from pathlib import Path
 from pprint import pp
 from sys import setrecursionlimit
 from typing import NamedTuple
 
-from aoc23.support import get_input
+from aoc23.support import progress, read_input, trace
+
+INPUT = "input01.txt"
 
 
 class Pos(NamedTuple):
@@ -44,12 +46,17 @@ def parse_maze(lines: list[str], honor_slopes: bool) -> Tree:
     return tree
 
 
-def dfs_rec(tree: Tree, start: Pos, stop: Pos, visited: set[Pos]) -> int:
+def dfs_rec(
+    tree: Tree, start: Pos, stop: Pos, visited: set[Pos], work: Counter[str]
+) -> int:
+    """Longest path from `start` to `stop`, counts visited states and branches."""
+    known = len(visited)
     steps = 0
     frontier = deque([(start, steps)])
     while frontier:
         current, steps = frontier.pop()
         if current == stop:
+            work["states_visited"] += len(visited) - known
             return steps
 
         visited.add(current)
@@ -58,29 +65,54 @@ def dfs_rec(tree: Tree, start: Pos, stop: Pos, visited: set[Pos]) -> int:
         if len(unvis_neighbors) == 1:
             frontier.append((unvis_neighbors[0], steps + 1))
         elif len(unvis_neighbors) > 1:
+            progress.report("steps on the current path", len(visited))
+            work["branches"] += len(unvis_neighbors)
             # on a branching point, recursively start a new dfs
             sub_res = [
-                1 + dfs_rec(tree, n, stop, set(visited)) for n in unvis_neighbors
+                1 + dfs_rec(tree, n, stop, set(visited), work) for n in unvis_neighbors
             ]
             steps += max(sub_res)
 
+    work["states_visited"] += len(visited) - known
     return steps
 
 
 def solution1(tree: Tree, start: Pos, stop: Pos) -> int:
     visited: set[Pos] = set()
-    return dfs_rec(tree, start, stop, visited)
+    work: Counter[str] = Counter()
+    steps = dfs_rec(tree, start, stop, visited, work)
+    # recorded once, the recursion is too hot for an event per branch
+    for name, value in work.items():
+        trace.counter(name, value)
+    return steps
 
 
 def solution2(tree: Tree, start: Pos, stop: Pos) -> int:
     return 0
 
 
-def main() -> tuple[int, int]:
-    lines = get_input(Path(__file__).parent / "input01.txt")
+def parse(raw: str) -> tuple[Tree, Tree, Pos, Pos]:
+    lines = raw.split("\n")
     tree1, tree2 = (parse_maze(lines, slope) for slope in (True, False))
     start, stop = Pos(lines[0].index("."), 0), Pos(lines[-1].index("."), len(lines) - 1)
-    return solution1(tree1, start, stop), solution2(tree2, start, stop)
+    return tree1, tree2, start, stop
+
+
+@trace.traced
+def part1(parsed: tuple[Tree, Tree, Pos, Pos]) -> int:
+    tree1, _, start, stop = parsed
+    return solution1(tree1, start, stop)
+
+
+@trace.traced
+def part2(parsed: tuple[Tree, Tree, Pos, Pos]) -> int:
+    _, tree2, start, stop = parsed
+    return solution2(tree2, start, stop)
+
+
+def main() -> tuple[int, int]:
+    parsed = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(parsed), part2(parsed)
 
 
 if __name__ == "__main__":
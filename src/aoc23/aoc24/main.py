@@ -5,7 +5,9 @@ from pathlib import Path
 from pprint import pp
 from typing import NamedTuple
 
-from aoc23.support import get_input
+from aoc23.support import read_input
+
+INPUT = "input01.txt"
 
 
 class Pos(NamedTuple):
@@ -80,9 +82,21 @@ def solution2(stones: list[Stone]) -> int:
     return 0
 
 
+def parse(raw: str) -> list[Stone]:
+    return [parse_line(line) for line in raw.split("\n")]
+
+
+def part1(stones: list[Stone]) -> int:
+    return solution1(stones)
+
+
+def part2(stones: list[Stone]) -> int:
+    return solution2(stones)
+
+
 def main() -> tuple[int, int]:
-    stones = get_input(Path(__file__).parent / "input01.txt", parse_line)
-    return solution1(stones), solution2(stones)
+    stones = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(stones), part2(stones)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import math
 from pathlib import Path
 from pprint import pp
 
-import networkx as nx
-from aoc23.support import get_input
+from aoc23.support import read_input
+
+INPUT = "input01.txt"
 
 Graph = dict[str, set[str]]
 
@@ -19,18 +19,47 @@ def get_edges(lines: list[str]) -> set[tuple[str, str]]:
     return edges
 
 
-def solution(edges: set[tuple[str, str]]) -> int:
-    graph = nx.from_edgelist(edges)
-    edge_betweenness = nx.edge_betweenness_centrality(graph)
-    most_crucial_edges = sorted(edge_betweenness, key=edge_betweenness.get)[-3:]
-    graph.remove_edges_from(most_crucial_edges)
-    group_sizes = [len(c) for c in nx.connected_components(graph)]
-    return math.prod(group_sizes)
+def solution(
+    edges: set[tuple[str, str]], cut_size: int = 3, seed: int = 25, trials: int = 1000
+) -> int:
+    """Product of the group sizes after cutting `cut_size` wires.
+
+    Karger's algorithm: contracting the edges in random order down to two nodes
+    finds the minimum cut with some probability, repeat until it does, at most
+    `trials` times. Raises ValueError if no trial cuts `cut_size` wires.
+    """
+    import random
+
+    from aoc23.support.graph import Graph, contract
+
+    graph = Graph.from_edges(sorted(edges))
+    order = [(u, v) for u, v in graph.edges() if u < v]
+    rng = random.Random(seed)  # noqa: S311
+    for _ in range(trials):
+        rng.shuffle(order)
+        group = contract(graph, order, nodes_left=2)
+        if sum(group[u] != group[v] for u, v in order) == cut_size:
+            first = sum(g == group[0] for g in group)
+            return first * (len(graph) - first)
+    msg = f"no cut of {cut_size} wires found in {trials} trials"
+    raise ValueError(msg)
+
+
+def parse(raw: str) -> set[tuple[str, str]]:
+    return get_edges(raw.split("\n"))
+
+
+def part1(edges: set[tuple[str, str]]) -> int:
+    return solution(edges)
+
+
+def part2(edges: set[tuple[str, str]]) -> str:  # noqa: ARG001
+    return "N/A"
 
 
 def main() -> tuple[int, str]:
-    graph = get_edges(get_input(Path(__file__).parent / "input01.txt"))
-    return solution(graph), "N/A"
+    edges = parse(read_input(Path(__file__).parent / INPUT))
+    return part1(edges), part2(edges)
 
 
 if __name__ == "__main__":
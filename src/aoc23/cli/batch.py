@@ -0,0 +1,139 @@
+"""Solve one day for many input files, e.g. the inputs of many people."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from aoc23.cli.bulk import ENC_SUFFIX, expand_paths
+from aoc23.cli.runner import (
+    day_module_name,
+    run_isolated,
+    timeout_message,
+    worker_pool,
+)
+from aoc23.support import Solver, progress, read_input
+from aoc23.support.solver import Timings, day_solver, timed
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Iterator
+
+
+def input_paths(pattern: str, base: Path | None = None) -> list[Path]:
+    """Files matching the glob `pattern`, or the inputs in the directory `pattern`.
+
+    Inputs in a directory are the .txt and .txt.enc files directly inside it.
+    """
+    base = base or Path.cwd()
+    if (base / pattern).is_dir():
+        found = expand_paths(base, [pattern], ".txt") + expand_paths(
+            base, [pattern], ".txt" + ENC_SUFFIX
+        )
+        return sorted(p for p in found if p.is_file())
+    return expand_paths(base, [pattern], "")
+
+
+def batch_solver(day: int) -> Solver[Any]:
+    """The solver of `day`, raises ValueError if it can't be given an input."""
+    solver, input_path = day_solver(import_module(day_module_name(day)))
+    if input_path is None:
+        msg = f"day {day:02} reads its input itself"
+        raise ValueError(msg)
+    return solver
+
+
+def record(
+    path: Path,
+    sol1: Any = None,  # noqa: ANN401
+    sol2: Any = None,  # noqa: ANN401
+    timings: Timings | None = None,
+    error: str | None = None,
+) -> dict[str, Any]:
+    """A JSON serializable result of one input file."""
+    return {
+        "file": str(path),
+        "sol1": sol1,
+        "sol2": sol2,
+        "timings": timings._asdict() if timings else None,
+        "error": error,
+    }
+
+
+def solve_file(day: int, path: Path) -> dict[str, Any]:
+    """Solve `day` for the input in `path`, exceptions end up in "error"."""
+    try:
+        solver = batch_solver(day)
+        # read_input decrypts <path>.enc if <path> doesn't exist
+        plain_path = path.with_name(path.name.removesuffix(ENC_SUFFIX))
+        raw, read_time = timed(read_input, plain_path)
+        parsed, parse_time = timed(solver.parse, raw)
+        sol1, time1 = timed(solver.part1, parsed)
+        sol2, time2 = timed(solver.part2, parsed)
+    except progress.Cancelled:
+        # stopped by `run_isolated`, which reports the timeout
+        raise
+    except Exception as e:  # noqa: BLE001
+        return record(path, error=f"{type(e).__name__}: {e}")
+    return record(path, sol1, sol2, Timings(read_time, parse_time, time1, time2))
+
+
+def solve_files(
+    day: int, paths: Iterable[Path], jobs: int = 1, timeout: float | None = None
+) -> Iterator[dict]:
+    """Solve `day` for every input, results are yielded as they are finished.
+
+    With `jobs` > 1 the inputs are distributed across that many worker
+    processes, `jobs` == 0 uses one worker per CPU. With a `timeout` every
+    input is solved in its own child process, stopped after `timeout` seconds.
+    """
+    if timeout is not None:
+        yield from _solve_files_isolated(day, list(paths), jobs, timeout)
+        return
+    if jobs == 1:
+        yield from (solve_file(day, path) for path in paths)
+        return
+
+    unfinished = yield from _solve_in_pool(day, list(paths), jobs or os.cpu_count())
+    # a worker died, e.g. killed for its memory usage, and the pool failed all
+    # inputs not finished by then: solve them again one at a time, only the
+    # input killing its worker is reported
+    for path in unfinished:
+        if (yield from _solve_in_pool(day, [path], 1)):
+            yield record(path, error="worker process died")
+
+
+def _solve_in_pool(
+    day: int, paths: list[Path], workers: int | None
+) -> Generator[dict, None, list[Path]]:
+    """Yield the results as they are finished, returns the inputs of a broken pool."""
+    pool = worker_pool(workers)
+    try:
+        futures = {pool.submit(solve_file, day, path): path for path in paths}
+        for future in as_completed(futures):
+            if not isinstance(future.exception(), BrokenProcessPool):
+                yield future.result()
+        return [
+            path
+            for future, path in futures.items()
+            if isinstance(future.exception(), BrokenProcessPool)
+        ]
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _solve_files_isolated(
+    day: int, paths: list[Path], jobs: int, timeout: float
+) -> Iterator[dict]:
+    for outcome in run_isolated(partial(solve_file, day), paths, jobs, timeout):
+        path = paths[outcome.position]
+        if outcome.timed_out:
+            yield record(path, error=timeout_message(outcome.elapsed, outcome.progress))
+        elif outcome.error is not None:
+            yield record(path, error=str(outcome.error))
+        else:
+            yield outcome.value
@@ -0,0 +1,160 @@
+"""Repeated timing of day modules and comparison against stored baselines."""
+
+from __future__ import annotations
+
+import json
+import math
+import platform
+import statistics
+import time
+from functools import partial
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from aoc23.cli.runner import day_module_name
+from aoc23.support import read_input
+from aoc23.support.solver import day_solver
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+    from types import ModuleType
+
+
+class Stats(NamedTuple):
+    runs: int
+    min: float
+    median: float
+    p95: float
+    stddev: float
+
+
+# day -> phase -> statistics, e.g. {"02": {"parse": Stats(...), "part1": ...}}
+BenchResult = dict[str, dict[str, Stats]]
+
+
+class Regression(NamedTuple):
+    day: str
+    phase: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else math.inf
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of `samples`."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: list[float]) -> Stats:
+    return Stats(
+        runs=len(samples),
+        min=min(samples),
+        median=statistics.median(samples),
+        p95=percentile(samples, 95),
+        stddev=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    )
+
+
+def measure(
+    func: Callable[[], Any],
+    warmup: int,
+    repeat: int,
+    setup: Callable[[], Any] | None = None,
+) -> Stats:
+    """Time `func` `repeat` times after `warmup` untimed calls.
+
+    `setup` is called untimed before every call, warmup or not.
+    """
+    for _ in range(warmup):
+        if setup:
+            setup()
+        func()
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def clear_caches(day_module: ModuleType) -> None:
+    """Empty the functools caches of the day, every run should start cold."""
+    for value in vars(day_module).values():
+        if callable(cache_clear := getattr(value, "cache_clear", None)):
+            cache_clear()
+
+
+def bench_day(day_module: ModuleType, warmup: int, repeat: int) -> dict[str, Stats]:
+    """Benchmark parse, part1 and part2 of a day, main() for legacy days.
+
+    The input is read once up front, parsing and the parts are timed without
+    the decryption. The caches of the day are cleared before every call, or
+    the parts would be timed as cache hits after the first one.
+    """
+    solver, input_path = day_solver(day_module)
+    cold = partial(clear_caches, day_module)
+    if input_path is None:
+        return {"main": measure(day_module.main, warmup, repeat, cold)}
+    raw = read_input(input_path)
+    parsed = solver.parse(raw)
+    return {
+        "parse": measure(partial(solver.parse, raw), warmup, repeat, cold),
+        "part1": measure(partial(solver.part1, parsed), warmup, repeat, cold),
+        "part2": measure(partial(solver.part2, parsed), warmup, repeat, cold),
+    }
+
+
+def bench_days(days: Iterable[int], warmup: int, repeat: int) -> BenchResult:
+    """Benchmark the phases of every available day in `days`."""
+    result: BenchResult = {}
+    for day in days:
+        try:
+            day_module = import_module(day_module_name(day))
+        except ModuleNotFoundError:
+            continue
+        result[f"{day:02}"] = bench_day(day_module, warmup, repeat)
+    return result
+
+
+def save_baseline(result: BenchResult, path: Path) -> None:
+    content = {
+        "python": platform.python_version(),
+        "days": {
+            day: {phase: stats._asdict() for phase, stats in phases.items()}
+            for day, phases in result.items()
+        },
+    }
+    path.write_text(json.dumps(content, indent=2) + "\n")
+
+
+def load_baseline(path: Path) -> BenchResult:
+    content = json.loads(path.read_text())
+    return {
+        day: {phase: Stats(**stats) for phase, stats in phases.items()}
+        for day, phases in content["days"].items()
+    }
+
+
+def compare(
+    result: BenchResult, baseline: BenchResult, threshold: float
+) -> list[Regression]:
+    """Phases whose median got slower than the baseline by more than `threshold`.
+
+    Days or phases missing in either result are not compared.
+    """
+    regressions = []
+    for day, phases in result.items():
+        for phase, stats in phases.items():
+            if (base := baseline.get(day, {}).get(phase)) is None:
+                continue
+            if stats.median > base.median * (1 + threshold):
+                regressions.append(Regression(day, phase, base.median, stats.median))
+    return regressions
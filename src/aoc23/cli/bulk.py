@@ -0,0 +1,169 @@
+"""Encrypt, decrypt and re-encrypt many input files at once."""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
+
+from aoc23.support import decrypted_content, encrypted_bytes
+from aoc23.support.container import (
+    FLAG_ZLIB,
+    encrypted_container,
+    is_container,
+    read_index,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+T = TypeVar("T")
+
+ENC_SUFFIX = ".enc"
+
+
+class Summary(NamedTuple):
+    files: int
+    size: int  # bytes of plain-text processed
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second."""
+        return self.size / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.files} file(s), {self.size} bytes in {self.elapsed:.3f}s"
+            f" ({self.throughput / 1e6:.2f} MB/s)"
+        )
+
+
+def expand_paths(
+    base: Path,
+    patterns: Iterable[str],
+    suffix: str,
+    recursive: bool = False,  # noqa: FBT001, FBT002
+) -> list[Path]:
+    """Resolve files, glob patterns and directories relative to `base`.
+
+    Directories expand to the files ending with `suffix` inside them.
+    """
+    paths: set[Path] = set()
+    for pattern in patterns:
+        path = base / pattern
+        if path.is_dir():
+            found = path.rglob(f"*{suffix}") if recursive else path.glob(f"*{suffix}")
+            paths.update(found)
+        elif any(c in pattern for c in "*?["):
+            # glob() only accepts relative patterns
+            root = Path(path.anchor)
+            found = root.glob(str(path.relative_to(root)))
+            paths.update(p for p in found if p.is_file())
+        elif path.exists():
+            paths.add(path)
+    return sorted(paths)
+
+
+def write_temp(path: Path, content: bytes) -> Path:
+    """Write `content` to a hidden file next to `path`, with the mode of `path`."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    mode = path.stat().st_mode & 0o777 if path.exists() else 0o644
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    with os.fdopen(fd, "wb") as f:
+        f.write(content)
+    return tmp
+
+
+def write_atomic(path: Path, content: bytes) -> None:
+    """Replace `path` by `content`, readers never see a partially written file."""
+    write_temp(path, content).replace(path)
+
+
+def encrypt(content: bytes, key: bytes, fmt: str, compress: bool) -> bytes:  # noqa: FBT001
+    if fmt == "v2":
+        return encrypted_container(content, key, compress=compress)
+    return encrypted_bytes(content, key)
+
+
+def encrypt_file(path: Path, key: bytes, fmt: str, compress: bool) -> int:  # noqa: FBT001
+    """Write the encrypted `path` next to it, returns the plain-text size."""
+    content = path.open().read().encode()
+    encrypted = encrypt(content, key, fmt, compress)
+    write_atomic(path.with_name(path.name + ENC_SUFFIX), encrypted)
+    return len(content)
+
+
+def rotate_file(path: Path, old_key: bytes, new_key: bytes) -> tuple[Path, int]:
+    """Re-encrypt `path` with `new_key` into a temporary file next to it.
+
+    Returns the temporary file and the plain-text size. v1 files aren't
+    authenticated, a wrong `old_key` is told apart by the plain-text not being
+    UTF-8, as written by `encrypt_file`.
+    """
+    from cryptography.exceptions import InvalidTag
+
+    try:
+        content = decrypted_content(path, old_key)
+        if is_container(path):
+            with path.open("rb") as f:
+                header, _ = read_index(f)
+            compress = bool(header.flags & FLAG_ZLIB)
+            encrypted = encrypt(content, new_key, "v2", compress)
+        else:
+            content.decode()
+            encrypted = encrypt(content, new_key, "v1", compress=False)
+    except (InvalidTag, ValueError) as e:
+        # v2 chunk not authentic, v1 padding broken or no text
+        msg = f"{path} doesn't decrypt with the old key"
+        raise ValueError(msg) from e
+    return write_temp(path, encrypted), len(content)
+
+
+def rotate_files(
+    paths: list[Path], old_key: bytes, new_key: bytes, jobs: int | None = None
+) -> tuple[list[int], float]:
+    """Re-encrypt all `paths` in place with `new_key`, or none of them.
+
+    The originals are only replaced once every file was re-encrypted, if one
+    fails the temporary files are removed. Returns the plain-text sizes and the
+    elapsed time, like `process_files`.
+    """
+    staged: dict[Path, Path] = {}
+
+    def stage(path: Path) -> int:
+        staged[path], size = rotate_file(path, old_key, new_key)
+        return size
+
+    try:
+        sizes, elapsed = process_files(paths, stage, jobs)
+    except BaseException:
+        for tmp in staged.values():
+            tmp.unlink(missing_ok=True)
+        raise
+    for path in paths:
+        staged[path].replace(path)
+    return sizes, elapsed
+
+
+def decrypt_file(path: Path, key: bytes, write: bool) -> bytes:  # noqa: FBT001
+    """Decrypt `path`, written next to it without the .enc suffix if `write`."""
+    content = decrypted_content(path, key)
+    if write:
+        write_atomic(path.with_name(path.name.removesuffix(ENC_SUFFIX)), content)
+    return content
+
+
+def process_files(
+    paths: list[Path], func: Callable[[Path], T], jobs: int | None = None
+) -> tuple[list[T], float]:
+    """Apply `func` to all paths in a thread pool, results are in path order.
+
+    The cryptography primitives release the GIL, so threads are sufficient.
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(jobs or None) as pool:
+        results = list(pool.map(func, paths))
+    return results, time.perf_counter() - start
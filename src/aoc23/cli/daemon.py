@@ -0,0 +1,304 @@
+"""Answer `aoc day` requests from a long running process with warm state.
+
+`aoc serve` keeps the day modules imported, the key resolved and the parsed
+inputs in memory. Clients send one JSON request per line on a Unix socket:
+
+    {"day": 5, "part": 1, "input": "..."}
+
+`part` (1, 2 or null for both) and `input` (raw input to parse instead of the
+day's input file) are optional. Every request is answered by one line, either
+the solutions or {"error": "...", "fallback": ...}. With `fallback` the client
+should compute the solutions itself, e.g. while the daemon restarts.
+
+Days are reloaded or re-parsed when a file in their directory changes. Changes
+to aoc23.support or the CLI restart the whole daemon.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module, reload
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import aoc23.support
+from aoc23.cli.runner import DayResult, day_module_name
+from aoc23.support import read_input
+from aoc23.support.cache import default_cache_dir
+from aoc23.support.solver import Timings, day_solver, timed
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from aoc23.support import Solver
+
+SOCKET_ENV = "AOC23_SOCKET"
+
+# seconds `aoc day --via-daemon` waits for the daemon before solving itself
+REQUEST_TIMEOUT = 60.0
+
+Fingerprint = tuple[tuple[str, int, int], ...]
+
+
+def default_socket_path() -> Path:
+    """AOC23_SOCKET, else aoc23.sock in $XDG_RUNTIME_DIR or the cache directory."""
+    if path := os.environ.get(SOCKET_ENV):
+        return Path(path)
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(runtime_dir) / "aoc23.sock"
+    return default_cache_dir() / "aoc23.sock"
+
+
+def fingerprint(directory: Path, pattern: str = "*") -> Fingerprint:
+    """Name, modification time and size of the files in `directory`."""
+    files = []
+    for f in sorted(directory.rglob(pattern)):
+        try:
+            st = f.stat()
+        except FileNotFoundError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            files.append((str(f.relative_to(directory)), st.st_mtime_ns, st.st_size))
+    return tuple(files)
+
+
+def _sources(files: Fingerprint) -> Fingerprint:
+    return tuple(f for f in files if f[0].endswith(".py"))
+
+
+def code_fingerprint() -> Fingerprint:
+    """Sources shared by all days, a change requires a restart."""
+    return fingerprint(Path(aoc23.support.__file__).parent, "*.py") + fingerprint(
+        Path(__file__).parent, "*.py"
+    )
+
+
+class WarmDay(NamedTuple):
+    module: ModuleType
+    solver: Solver[Any]
+    input_path: Path | None
+    files: Fingerprint  # of the day's directory when the input was parsed
+    parsed: Any = None
+    is_parsed: bool = False
+
+
+class WarmDays:
+    """Imported day modules and their parsed inputs.
+
+    Requests for the same day are serialized while the day is refreshed and
+    parsed, the parts run concurrently as they don't modify the parsed input.
+    """
+
+    def __init__(self) -> None:
+        """Start without any day, days are imported on their first request."""
+        self._days: dict[int, WarmDay] = {}
+        self._locks: defaultdict[int, threading.Lock] = defaultdict(threading.Lock)
+        self._locks_lock = threading.Lock()
+
+    def _lock(self, day: int) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks[day]
+
+    def _refresh(self, day: int) -> WarmDay:
+        """The day's state, reloaded resp. dropped if files changed since."""
+        warm = self._days.get(day)
+        module = warm.module if warm else import_module(day_module_name(day))
+        files = fingerprint(Path(str(module.__file__)).parent)
+        if warm and warm.files == files:
+            return warm
+        if warm and _sources(warm.files) != _sources(files):
+            module = reload(module)
+        warm = WarmDay(module, *day_solver(module), files)
+        self._days[day] = warm
+        return warm
+
+    def solve(self, day: int, part: int | None = None, raw: str | None = None) -> dict:
+        """Solutions as JSON serializable dict, `raw` replaces the input file."""
+        start = time.thread_time()
+        read_time = parse_time = 0.0
+        with self._lock(day):
+            warm = self._refresh(day)
+            if raw is not None:
+                if warm.input_path is None:
+                    msg = f"day {day:02} reads its input itself"
+                    raise ValueError(msg)
+                parsed, parse_time = timed(warm.solver.parse, raw)
+            elif warm.is_parsed:
+                parsed = warm.parsed
+            else:
+                raw, read_time = (
+                    timed(read_input, warm.input_path) if warm.input_path else ("", 0.0)
+                )
+                parsed, parse_time = timed(warm.solver.parse, raw)
+                self._days[day] = warm._replace(parsed=parsed, is_parsed=True)
+        sol1, time1 = timed(warm.solver.part1, parsed) if part != 2 else (None, 0.0)  # noqa: PLR2004
+        sol2, time2 = timed(warm.solver.part2, parsed) if part != 1 else (None, 0.0)
+        return {
+            "day": day,
+            "sol1": sol1,
+            "sol2": sol2,
+            "cpu_time": time.thread_time() - start,
+            "timings": Timings(read_time, parse_time, time1, time2)._asdict(),
+        }
+
+
+def _error(message: str, fallback: bool = False) -> dict:  # noqa: FBT001, FBT002
+    return {"error": message, "fallback": fallback}
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    server: DaemonServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if line.strip():
+                response = self.server.answer(line)
+                self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server handing the connections to a pool of worker threads."""
+
+    def __init__(self, path: Path, workers: int | None = None) -> None:
+        """Listen on `path`, answering up to `workers` requests at the same time."""
+        self.pool = ThreadPoolExecutor(workers)
+        self.days = WarmDays()
+        self.code = code_fingerprint()
+        self.restart = False
+        # the socket is only accessible by the current user
+        umask = os.umask(0o177)
+        try:
+            super().__init__(str(path), RequestHandler)
+        finally:
+            os.umask(umask)
+
+    def process_request(self, request: Any, client_address: Any) -> None:  # noqa: ANN401
+        self.pool.submit(self._process_request, request, client_address)
+
+    def _process_request(self, request: Any, client_address: Any) -> None:  # noqa: ANN401
+        try:
+            self.finish_request(request, client_address)
+        except Exception:  # noqa: BLE001
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.shutdown(cancel_futures=True)
+
+    def answer(self, line: bytes) -> dict:
+        try:
+            request = json.loads(line)
+            day = int(request["day"])
+            part, raw = request.get("part"), request.get("input")
+        except (ValueError, KeyError, TypeError) as e:
+            return _error(f"invalid request: {e!r}")
+        if part not in (None, 1, 2):
+            return _error(f"invalid part {part!r}")
+        if self.restart or code_fingerprint() != self.code:
+            self.request_restart()
+            return _error("sources changed, the daemon restarts", fallback=True)
+        try:
+            return self.days.solve(day, part, raw)
+        except ModuleNotFoundError:
+            return _error(f"day {day:02} not available")
+        except Exception as e:  # noqa: BLE001
+            return _error(f"day {day:02}: {e!r}")
+
+    def request_restart(self) -> None:
+        """Stop serving, `serve` returns True afterwards."""
+        if not self.restart:
+            self.restart = True
+            # shutdown() waits for serve_forever(), which runs in another thread
+            threading.Thread(target=self.shutdown).start()
+
+
+def is_listening(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            return False
+    return True
+
+
+def remove_stale_socket(path: Path) -> None:
+    """Remove the socket left behind by a killed daemon, nothing else."""
+    try:
+        mode = path.lstat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        msg = f"{path} exists and isn't a socket"
+        raise RuntimeError(msg)
+    path.unlink()
+
+
+def serve(path: Path, workers: int | None = None) -> bool:
+    """Answer requests on `path` until interrupted.
+
+    Returns True if the daemon stopped to be restarted with changed sources.
+    """
+    if is_listening(path):
+        msg = f"a daemon is already listening on {path}"
+        raise RuntimeError(msg)
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    remove_stale_socket(path)
+    with DaemonServer(path, workers) as server:
+        try:
+            server.serve_forever()
+        finally:
+            path.unlink(missing_ok=True)
+    return server.restart
+
+
+def request(
+    message: dict, path: Path | None = None, timeout: float | None = None
+) -> dict | None:
+    """Send one request, None if no daemon answers or it asks for a fallback.
+
+    A daemon not answering within `timeout` seconds counts as no daemon.
+    Raises RuntimeError if the daemon failed to compute the solutions.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(path or default_socket_path()))
+            sock.sendall(json.dumps(message).encode() + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            with sock.makefile("rb") as f:
+                line = f.readline()
+        except (FileNotFoundError, ConnectionRefusedError, TimeoutError):
+            return None
+    if not line:
+        return None
+    response = json.loads(line)
+    if "error" in response:
+        if response["fallback"]:
+            return None
+        raise RuntimeError(response["error"])
+    return response
+
+
+def request_day(
+    day: int, path: Path | None = None, timeout: float = REQUEST_TIMEOUT
+) -> DayResult | None:
+    """Both solutions of a day computed by the daemon, None if there is none."""
+    if (response := request({"day": day}, path, timeout)) is None:
+        return None
+    return DayResult(
+        day,
+        response["sol1"],
+        response["sol2"],
+        response["cpu_time"],
+        timings=Timings(**response["timings"]),
+    )
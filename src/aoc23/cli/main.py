@@ -1,16 +1,27 @@
 """Tool description."""
 
+from __future__ import annotations
+
+import time
+from contextlib import nullcontext, suppress
+from functools import partial
 from importlib import import_module
 from pathlib import Path
+from typing import IO, TYPE_CHECKING
 
 import click
 from aoc23 import _version
-from aoc23.support import (
-    decrypted_content,
-    encrypted_content,
-    get_aoc_secret,
-    sha256,
-)
+from aoc23.support import get_aoc_secret, input_cache, key_provider, sha256
+from aoc23.support.cache import ResultCache, cache_files, clear_files, default_cache_dir
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from contextlib import AbstractContextManager
+
+    from aoc23.cli.runner import DayResult
+
+# Modules needed by single commands only are imported by those commands, `aoc`
+# is started often and shouldn't pay for what it doesn't use.
 
 
 @click.group()
@@ -18,64 +29,593 @@ def cli() -> None:
     """CLI arguments and options."""
 
 
+def timeout_option(help_text: str) -> Callable[[Callable], Callable]:
+    return click.option(
+        "--timeout",
+        type=click.FloatRange(min=0, min_open=True),
+        metavar="SECONDS",
+        help=help_text,
+    )
+
+
+def cache_options(command: Callable) -> Callable:
+    """--no-cache and --refresh for commands using the result cache."""
+    command = click.option(
+        "--refresh",
+        is_flag=True,
+        help="Recompute the solutions and update the result cache.",
+    )(command)
+    return click.option(
+        "--no-cache",
+        is_flag=True,
+        help="Neither read nor write the result cache.",
+    )(command)
+
+
 @cli.command()
 def version() -> None:
     """Print application version."""
     click.echo(f"{_version()}")
 
 
+def solve_day(  # noqa: PLR0913
+    day: int,
+    via_daemon: bool,  # noqa: FBT001
+    cache: ResultCache | None,
+    refresh: bool,  # noqa: FBT001
+    parallel: bool,  # noqa: FBT001
+    timeout: float | None,
+) -> DayResult:
+    """Solve `day`, raises ClickException if it's missing or runs out of time."""
+    from aoc23.cli.runner import run_day, run_days_isolated, timeout_message
+
+    result = None
+    if via_daemon:
+        from aoc23.cli.daemon import request_day
+
+        result = request_day(day)
+    if result is None and timeout is None:
+        result = run_day(day, cache, refresh, parallel)
+    elif result is None:
+        run = partial(run_day, cache=cache, refresh=refresh, parallel=parallel)
+        result = next(run_days_isolated([day], timeout=timeout, run=run), None)
+    if result is None:
+        msg = f"day {day:02} not available"
+        raise click.ClickException(msg)
+    if result.timed_out:
+        msg = f"day {day:02}: {timeout_message(result.cpu_time, result.progress)}"
+        raise click.ClickException(msg)
+    return result
+
+
 @cli.command()
 @click.argument("day")
-def day(day: str) -> None:
-    """Execute and print solutions for a day."""
-    module_name = f"aoc23.aoc{int(day):02}.main"
-    day_module = import_module(module_name)
-    sol1, sol2 = day_module.main()
+@click.option(
+    "--profile",
+    type=click.Choice(["cpu", "mem", "both"]),
+    help="Profile the run with cProfile and/or tracemalloc.",
+)
+@click.option(
+    "--top",
+    type=click.IntRange(min=1),
+    default=20,
+    show_default=True,
+    help="Number of functions and allocation sites reported.",
+)
+@click.option(
+    "--profile-out",
+    type=click.Path(dir_okay=False, path_type=Path),
+    metavar="PREFIX",
+    help="Dump the raw profiles to PREFIX.prof and PREFIX.snapshot.",
+)
+@click.option(
+    "--parallel-parts",
+    is_flag=True,
+    help="Compute part 1 and 2 at the same time in separate processes.",
+)
+@click.option(
+    "--via-daemon",
+    is_flag=True,
+    help="Ask a running `aoc serve`, compute in-process if there is none.",
+)
+@click.option(
+    "--inputs",
+    metavar="DIR_OR_GLOB",
+    help="Solve the day for every input file given, one JSON line per file.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of worker processes for --inputs, 0 for one per CPU.",
+)
+@timeout_option("Stop the day, resp. every input, after SECONDS.")
+@click.option(
+    "--trace",
+    "trace_out",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write spans, counters and gauges as Chrome trace JSON to the file.",
+)
+@cache_options
+def day(  # noqa: PLR0913
+    day: str,
+    profile: str | None,
+    top: int,
+    profile_out: Path | None,
+    parallel_parts: bool,  # noqa: FBT001
+    via_daemon: bool,  # noqa: FBT001
+    inputs: str | None,
+    jobs: int,
+    timeout: float | None,
+    trace_out: Path | None,
+    no_cache: bool,  # noqa: FBT001
+    refresh: bool,  # noqa: FBT001
+) -> None:
+    """Execute and print solutions for a day.
+
+    The input is read and parsed once for both parts, the time spent in every
+    phase is reported on stderr. The daemon keeps parsed inputs in memory
+    instead of using the result cache.
+
+    With --inputs the results are printed as JSON lines with the keys file,
+    sol1, sol2, timings and error, in the order the inputs are finished.
+
+    With --timeout the day runs in a child process, which is stopped when the
+    time is up. Days reporting their progress (aoc23.support.progress) stop
+    cooperatively and the last progress is shown.
+
+    With --trace the day is solved in this process, bypassing the result
+    cache, and the phases and what the day reports to aoc23.support.trace are
+    written to the file. Open it in Perfetto or chrome://tracing.
+    """
+    if inputs is not None:
+        if profile or parallel_parts or via_daemon or trace_out:
+            msg = (
+                "--inputs excludes --profile, --parallel-parts, --via-daemon"
+                " and --trace"
+            )
+            raise click.UsageError(msg)
+        batch(int(day), inputs, jobs, timeout)
+        return
+    if profile and timeout is not None:
+        msg = "--timeout can't be combined with --profile"
+        raise click.UsageError(msg)
+    if trace_out and (parallel_parts or via_daemon or timeout is not None):
+        msg = "--trace excludes --parallel-parts, --via-daemon and --timeout"
+        raise click.UsageError(msg)
+    tracing: AbstractContextManager[None] = nullcontext()
+    if trace_out:
+        from aoc23.support import trace
+
+        tracing, no_cache = trace.tracing(trace_out), True
+    with tracing:
+        if profile:
+            from aoc23.cli.profiling import profile_call
+
+            day_module = import_module(f"aoc23.aoc{int(day):02}.main")
+            (sol1, sol2), report = profile_call(
+                day_module.main, profile, top, profile_out  # type: ignore[arg-type]
+            )
+        else:
+            cache = None if no_cache else ResultCache()
+            result = solve_day(
+                int(day), via_daemon, cache, refresh, parallel_parts, timeout
+            )
+            sol1, sol2 = result.sol1, result.sol2
+            if timings := result.timings:
+                click.echo(
+                    f"read {timings.read:.3f}s, parse {timings.parse:.3f}s,"
+                    f" part 1 {timings.part1:.3f}s, part 2 {timings.part2:.3f}s",
+                    err=True,
+                )
     click.echo(f"Solution 1: {sol1}")
     click.echo(f"Solution 2: {sol2}")
+    if profile:
+        click.echo(report)
+
+
+def batch(day: int, inputs: str, jobs: int, timeout: float | None = None) -> None:
+    """Solve `day` for all files matching `inputs`, see `aoc day --inputs`."""
+    import json
+
+    from aoc23.cli.batch import batch_solver, input_paths, solve_files
+
+    try:
+        batch_solver(day)
+    except (ModuleNotFoundError, ValueError) as e:
+        raise click.ClickException(str(e)) from None
+    if not (paths := input_paths(inputs)):
+        msg = f"no input files found for {inputs}"
+        raise click.ClickException(msg)
+    start = time.perf_counter()
+    errors = 0
+    for result in solve_files(day, paths, jobs, timeout):
+        click.echo(json.dumps(result, default=str))
+        errors += result["error"] is not None
+    elapsed = time.perf_counter() - start
+    click.echo(f"{len(paths)} input(s), {errors} error(s) in {elapsed:.3f}s", err=True)
+    if errors:
+        msg = f"{errors} of {len(paths)} input(s) failed"
+        raise click.ClickException(msg)
 
 
 @cli.command()
-def solutions() -> None:
-    """Execute and print solutions for all days available."""
-    for d in range(1, 25):
-        module_name = f"aoc23.aoc{d:02}.main"
-        try:
-            day_module = import_module(module_name)
-            sol1, sol2 = day_module.main()
-            click.echo(f"========== DAY {d:02} ==========")
-            click.echo(f"  Solution 1: {sha256(sol1)}")
-            click.echo(f"  Solution 2: {sha256(sol2)}")
-        except ModuleNotFoundError:
-            pass
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of worker processes, 0 for one per CPU.",
+)
+@click.option(
+    "--stats",
+    type=click.Choice(["table", "jsonl"]),
+    help="Run every day in its own process and report the resources it used.",
+)
+@timeout_option("Stop every day after SECONDS.")
+@click.option(
+    "--total-timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    metavar="SECONDS",
+    help="Stop all days still running after SECONDS.",
+)
+@cache_options
+def solutions(  # noqa: PLR0913
+    jobs: int,
+    stats: str | None,
+    timeout: float | None,
+    total_timeout: float | None,
+    no_cache: bool,  # noqa: FBT001
+    refresh: bool,  # noqa: FBT001
+) -> None:
+    """Execute and print solutions for all days available.
+
+    Solutions of days whose code and inputs didn't change are taken from the
+    result cache, unless --stats is given. With a timeout every day runs in a
+    child process that is stopped when the time is up, see `aoc day --timeout`.
+    """
+    import json
+
+    from aoc23.cli.runner import (
+        DAYS,
+        run_day,
+        run_days,
+        run_days_isolated,
+        timeout_message,
+        usage_record,
+        usage_table,
+    )
+
+    cache = None if no_cache else ResultCache()
+    wall_start, cpu_time = time.perf_counter(), 0.0
+    results = []
+    if stats:
+        runs = run_days_isolated(DAYS, jobs, timeout, total_timeout)
+    elif timeout or total_timeout:
+        run = partial(run_day, cache=cache, refresh=refresh)
+        runs = run_days_isolated(DAYS, jobs, timeout, total_timeout, run)
+    else:
+        runs = run_days(DAYS, jobs, cache, refresh)
+    for result in runs:
+        if stats == "jsonl":
+            click.echo(json.dumps(usage_record(result)))
+        elif result.timed_out:
+            click.echo(f"========== DAY {result.day:02} ==========")
+            click.echo(f"  {timeout_message(result.cpu_time, result.progress)}")
+        else:
+            click.echo(f"========== DAY {result.day:02} ==========")
+            click.echo(f"  Solution 1: {sha256(result.sol1)}")
+            click.echo(f"  Solution 2: {sha256(result.sol2)}")
+        results.append(result)
+        cpu_time += result.cpu_time
+    wall_time = time.perf_counter() - wall_start
+    if stats == "table":
+        click.echo(usage_table(results))
+    cached = sum(r.cached for r in results)
+    click.echo(
+        f"Wall time: {wall_time:.3f}s, CPU time: {cpu_time:.3f}s, cached: {cached}",
+        err=True,
+    )
+    if timed_out := sum(r.timed_out for r in results):
+        msg = f"{timed_out} day(s) timed out"
+        raise click.ClickException(msg)
 
 
 @cli.command()
-@click.argument("filepath")
-def enc(filepath: str) -> None:
-    """Encrypt a plain-text input file."""
-    final_path = Path(__file__).parent.parent / filepath
+@click.option(
+    "--socket",
+    "path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Unix socket to listen on  [default: $AOC23_SOCKET, else aoc23.sock in"
+    " $XDG_RUNTIME_DIR or the cache directory]",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Number of requests answered at the same time.",
+)
+def serve(path: Path | None, workers: int | None) -> None:
+    """Answer requests for solutions with warm modules and parsed inputs.
+
+    Requests are JSON lines like {"day": 5, "part": 1}, see `aoc day
+    --via-daemon`. The daemon restarts itself when aoc23.support changes.
+    """
+    import os
+    import signal
+    import sys
+
+    from aoc23.cli.daemon import default_socket_path, serve
 
-    if final_path.exists():
-        key = get_aoc_secret("aoc2023", "encryptionkey")
-        if key:
-            content = encrypted_content(final_path, bytes.fromhex(key))
-            new_path = Path(str(final_path) + ".enc")
-            with new_path.open("wb") as f:
-                f.write(content)
+    path = path or default_socket_path()
+    # resolved once for all requests
+    with suppress(Exception):
+        key_provider.get()
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    click.echo(f"Listening on {path}", err=True)
+    if serve(path, workers):
+        click.echo("Sources changed, restarting", err=True)
+        os.execv(sys.executable, [sys.executable, *sys.argv])  # noqa: S606
 
 
 @cli.command()
-@click.argument("filepath")
-def dec(filepath: str) -> None:
-    """Decrypt an encrypted input file."""
-    final_path = Path(__file__).parent.parent / filepath
-
-    if final_path.exists():
-        key = get_aoc_secret("aoc2023", "encryptionkey")
-        if key:
-            content = decrypted_content(final_path, bytes.fromhex(key))
+@click.argument("days", nargs=-1, type=click.IntRange(1, 25))
+@click.option("--warmup", type=click.IntRange(min=0), default=1, show_default=True)
+@click.option("--repeat", type=click.IntRange(min=1), default=5, show_default=True)
+@click.option(
+    "--save",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write the results as JSON baseline.",
+)
+@click.option(
+    "--compare",
+    "baseline",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Fail if a day got slower than in this JSON baseline.",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0),
+    default=0.1,
+    show_default=True,
+    help="Tolerated relative slowdown of the median against the baseline.",
+)
+def bench(  # noqa: PLR0913
+    days: tuple[int, ...],
+    warmup: int,
+    repeat: int,
+    save: Path | None,
+    baseline: Path | None,
+    threshold: float,
+) -> None:
+    """Benchmark days, all days available if none are given."""
+    from aoc23.cli.bench import bench_days, compare, load_baseline, save_baseline
+    from aoc23.cli.runner import DAYS
+
+    result = bench_days(days or DAYS, warmup, repeat)
+    for d, phases in result.items():
+        for phase, stats in phases.items():
+            click.echo(
+                f"DAY {d} {phase:<6} min {stats.min * 1000:10.3f}ms"
+                f"  median {stats.median * 1000:10.3f}ms"
+                f"  p95 {stats.p95 * 1000:10.3f}ms"
+                f"  stddev {stats.stddev * 1000:8.3f}ms"
+            )
+    if save:
+        save_baseline(result, save)
+    if not baseline:
+        return
+    if regressions := compare(result, load_baseline(baseline), threshold):
+        for r in regressions:
+            click.secho(
+                f"DAY {r.day} {r.phase} regressed: median {r.baseline * 1000:.3f}ms"
+                f" -> {r.current * 1000:.3f}ms ({r.ratio:.2f}x)",
+                err=True,
+            )
+        msg = f"{len(regressions)} regression(s) beyond {threshold:.0%}"
+        raise click.ClickException(msg)
+
+
+@cli.command()
+@click.argument("day", type=click.IntRange(1, 25))
+@click.option(
+    "--scale",
+    type=click.IntRange(min=1),
+    default=1000,
+    show_default=True,
+    help="Number of lines or items, the side length of grids.",
+)
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option(
+    "--output",
+    "-o",
+    type=click.File("w", lazy=True),
+    default="-",
+    help="File to write the input to  [default: stdout]",
+)
+def gen(day: int, scale: int, seed: int, output: IO[str]) -> None:
+    """Generate a synthetic input for DAY, the same for the same scale and seed."""
+    from aoc23.support.generate import generator_module, write
+
+    try:
+        generator_module(day)
+    except ModuleNotFoundError:
+        msg = f"no generator for day {day:02}"
+        raise click.ClickException(msg) from None
+    start = time.perf_counter()
+    size = write(day, scale, seed, output)
+    if output.name != "-":
+        click.echo(f"{size} characters in {time.perf_counter() - start:.3f}s", err=True)
+
+
+@cli.command()
+@click.argument("patterns", nargs=-1, required=True)
+@click.option(
+    "--recursive", "-r", is_flag=True, help="Include subdirectories of directories."
+)
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["v1", "v2"]),
+    default="v1",
+    show_default=True,
+    help="v2 is chunked and can be decrypted in parallel.",
+)
+@click.option("--compress", is_flag=True, help="Compress chunks (v2 only).")
+@click.option(
+    "--rotate",
+    "old_key_name",
+    metavar="OLD_KEY_NAME",
+    help="Re-encrypt .enc files in place, decrypting them with this keyring secret.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Number of worker threads, 0 for an automatic choice.",
+)
+def enc(  # noqa: PLR0913
+    patterns: tuple[str, ...],
+    recursive: bool,  # noqa: FBT001
+    fmt: str,
+    compress: bool,  # noqa: FBT001
+    old_key_name: str | None,
+    jobs: int,
+) -> None:
+    """Encrypt plain-text input files, given as paths, globs or directories."""
+    from aoc23.cli.bulk import (
+        ENC_SUFFIX,
+        Summary,
+        encrypt_file,
+        expand_paths,
+        process_files,
+        rotate_files,
+    )
+
+    key = bytes.fromhex(required_key())
+    base = Path(__file__).parent.parent
+
+    if old_key_name:
+        if not (old_key := get_aoc_secret("aoc2023", old_key_name)):
+            msg = f"aoc2023/{old_key_name} not found in keyring"
+            raise click.ClickException(msg)
+        paths = expand_paths(base, patterns, ENC_SUFFIX, recursive)
+        try:
+            sizes, elapsed = rotate_files(paths, bytes.fromhex(old_key), key, jobs)
+        except ValueError as e:
+            msg = f"{e}, no file was changed"
+            raise click.ClickException(msg) from e
+    else:
+        paths = expand_paths(base, patterns, ".txt", recursive)
+        func = partial(encrypt_file, key=key, fmt=fmt, compress=compress)
+        sizes, elapsed = process_files(paths, func, jobs)
+    click.echo(str(Summary(len(paths), sum(sizes), elapsed)), err=True)
+
+
+@cli.command()
+@click.argument("patterns", nargs=-1, required=True)
+@click.option(
+    "--recursive", "-r", is_flag=True, help="Include subdirectories of directories."
+)
+@click.option(
+    "--write",
+    is_flag=True,
+    help="Write the plain-text next to the encrypted files instead of printing it.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Number of worker threads, 0 for an automatic choice.",
+)
+def dec(
+    patterns: tuple[str, ...],
+    recursive: bool,  # noqa: FBT001
+    write: bool,  # noqa: FBT001
+    jobs: int,
+) -> None:
+    """Decrypt encrypted input files, given as paths, globs or directories."""
+    from aoc23.cli.bulk import (
+        ENC_SUFFIX,
+        Summary,
+        decrypt_file,
+        expand_paths,
+        process_files,
+    )
+
+    key = bytes.fromhex(required_key())
+    paths = expand_paths(Path(__file__).parent.parent, patterns, ENC_SUFFIX, recursive)
+    contents, elapsed = process_files(
+        paths, partial(decrypt_file, key=key, write=write), jobs
+    )
+    if not write:
+        for content in contents:
             click.echo(content)
+    summary = Summary(len(paths), sum(len(c) for c in contents), elapsed)
+    click.echo(str(summary), err=True)
+
+
+@cli.command("startup-report")
+@click.argument("module", default="aoc23.cli.main")
+@click.option("--top", type=click.IntRange(min=1), default=20, show_default=True)
+@click.option(
+    "--sort",
+    type=click.Choice(["cumulative", "self"]),
+    default="cumulative",
+    show_default=True,
+)
+def startup_report(module: str, top: int, sort: str) -> None:
+    """Show the modules imported by MODULE and what they cost."""
+    from aoc23.cli.startup import import_times
+
+    times = import_times(module)
+    click.echo(f"{'self [ms]':>10} {'cumulative [ms]':>16}  module")
+    for t in sorted(times, key=lambda t: getattr(t, sort), reverse=True)[:top]:
+        click.echo(f"{t.self / 1000:10.2f} {t.cumulative / 1000:16.2f}  {t.module}")
+    total = sum(t.cumulative for t in times if t.depth == 0)
+    click.echo(f"{len(times)} modules, {total / 1000:.2f}ms in total")
+
+
+@cli.group()
+def cache() -> None:
+    """Inspect or clear the result and input caches."""
+
+
+def _cache_dirs() -> dict[str, Path]:
+    return {
+        "results": ResultCache().directory,
+        "inputs": input_cache.disk_dir or default_cache_dir() / "inputs",
+    }
+
+
+@cache.command("stats")
+def cache_stats() -> None:
+    """Show number and size of the cached entries."""
+    for name, directory in _cache_dirs().items():
+        entries = cache_files(directory)
+        size = sum(s for _, s in entries)
+        limit = f" of {ResultCache().max_size} bytes" if name == "results" else ""
+        click.echo(
+            f"{name:<8} {len(entries):>5} entries, {size} bytes{limit} in {directory}"
+        )
+
+
+@cache.command("clear")
+def cache_clear() -> None:
+    """Remove all cached results and decrypted inputs."""
+    removed = sum(clear_files(directory) for directory in _cache_dirs().values())
+    click.echo(f"Removed {removed} entries")
+
+
+def required_key() -> str:
+    if not (key := key_provider.get()):
+        msg = "aoc2023/encryptionkey not found in keyring"
+        raise click.ClickException(msg)
+    return key
 
 
 def main() -> None:
@@ -0,0 +1,97 @@
+"""CPU and memory profiling of arbitrary calls, e.g. a day's main()."""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import tracemalloc
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+ProfileMode = Literal["cpu", "mem", "both"]
+
+# number of stack frames stored per allocation
+TRACEMALLOC_FRAMES = 10
+
+# allocations made by the profilers themselves aren't of interest
+IGNORED_FILES = [
+    tracemalloc.Filter(inclusive=False, filename_pattern=pattern)
+    for pattern in (
+        tracemalloc.__file__,
+        cProfile.__file__,
+        "<frozen importlib._bootstrap>",
+    )
+]
+
+
+def cpu_report(profile: cProfile.Profile, top: int) -> str:
+    stream = io.StringIO()
+    stats = pstats.Stats(profile, stream=stream)
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return stream.getvalue()
+
+
+def mem_report(
+    before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, peak: int, top: int
+) -> str:
+    """The peak and the sites whose memory grew most between the snapshots.
+
+    tracemalloc only sees the blocks alive when a snapshot is taken, memory
+    allocated and freed during the run shows up in the peak only.
+    """
+    stats = after.filter_traces(IGNORED_FILES).compare_to(
+        before.filter_traces(IGNORED_FILES), "lineno"
+    )
+    lines = [
+        f"Peak traced memory: {peak / 1024:.1f} KiB",
+        f"Top {top} allocation sites by memory retained after the run:",
+        *(f"  {stat}" for stat in stats[:top]),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def profile_call(
+    func: Callable[[], Any],
+    mode: ProfileMode,
+    top: int = 20,
+    dump_prefix: Path | None = None,
+) -> tuple[Any, str]:
+    """Call `func` under the profilers selected by `mode`.
+
+    Returns the result of `func` and a text report. With `dump_prefix` the raw
+    data is written to <prefix>.prof (cProfile, e.g. for snakeviz) and
+    <prefix>.snapshot (tracemalloc.Snapshot.load). In mode "both" the profilers
+    run at the same time, the CPU timings include the tracemalloc overhead.
+    """
+    profile = cProfile.Profile() if mode in ("cpu", "both") else None
+    trace_mem = mode in ("mem", "both")
+
+    if trace_mem:
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        before = tracemalloc.take_snapshot()
+    if profile:
+        profile.enable()
+    try:
+        result = func()
+    finally:
+        if profile:
+            profile.disable()
+        if trace_mem:
+            after = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    report = ""
+    if profile:
+        report += cpu_report(profile, top)
+        if dump_prefix:
+            profile.dump_stats(f"{dump_prefix}.prof")
+    if trace_mem:
+        report += mem_report(before, after, peak, top)
+        if dump_prefix:
+            after.dump(f"{dump_prefix}.snapshot")
+    return result, report
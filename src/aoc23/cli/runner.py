@@ -0,0 +1,460 @@
+"""Execute day modules, optionally spread across worker processes."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
+
+import aoc23.support
+from aoc23.support import decrypt_input, input_cache, key_provider, progress, sha256
+from aoc23.support.solver import Timings, day_solver, solve
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from multiprocessing.connection import Connection
+    from multiprocessing.context import BaseContext
+    from multiprocessing.process import BaseProcess
+    from resource import struct_rusage
+    from types import ModuleType
+
+    from aoc23.support.cache import ResultCache
+
+DAYS = range(1, 26)
+
+
+class ResourceUsage(NamedTuple):
+    wall_time: float
+    user_time: float
+    sys_time: float
+    peak_rss: int  # KiB the peak resident set size grew by
+    allocated_blocks: int  # blocks allocated by the day and alive at its end
+
+
+class DayResult(NamedTuple):
+    day: int
+    sol1: Any
+    sol2: Any
+    cpu_time: float  # for timed out days the wall time until they were stopped
+    usage: ResourceUsage | None = None
+    cached: bool = False
+    timings: Timings | None = None
+    timed_out: bool = False
+    progress: str | None = None  # the last progress reported by a timed out day
+
+
+def day_module_name(day: int) -> str:
+    return f"aoc23.aoc{day:02}.main"
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def day_cache_key(day_module: ModuleType) -> str | None:
+    """Content hash of everything the solutions of a day depend on.
+
+    That is the Python version, the sources of the day and of aoc23.support,
+    and the decrypted inputs next to the day module. None for modules that
+    don't live in a file.
+    """
+    if not (module_file := getattr(day_module, "__file__", None)):
+        return None
+    day_dir = Path(module_file).parent
+    support_dir = Path(aoc23.support.__file__).parent
+    parts = [sys.version]
+    for directory in (day_dir, support_dir):
+        parts.extend(
+            f"{directory.name}/{f.relative_to(directory)} {_digest(f.read_bytes())}"
+            for f in sorted(directory.rglob("*.py"))
+        )
+    parts.extend(f"{f.name} {_digest(f.read_bytes())}" for f in day_dir.glob("*.txt"))
+    # decrypted via the input cache, the day itself reads them from there
+    parts.extend(
+        f"{f.name} {_digest(input_cache.get(f, decrypt_input))}"
+        for f in day_dir.glob("*.txt.enc")
+    )
+    return _digest("\n".join(sorted(parts)).encode())
+
+
+def run_day(
+    day: int,
+    cache: ResultCache | None = None,
+    refresh: bool = False,  # noqa: FBT001, FBT002
+    parallel: bool = False,  # noqa: FBT001, FBT002
+) -> DayResult | None:
+    """Run the solutions of a day, None if the day isn't available.
+
+    With a `cache` the solutions are looked up there first, `refresh` skips
+    the lookup but still stores the new solutions. `parallel` computes the
+    parts in separate processes, see `solve`.
+    """
+    start = time.process_time()
+    try:
+        day_module = import_module(day_module_name(day))
+    except ModuleNotFoundError:
+        return None
+    key = day_cache_key(day_module) if cache is not None else None
+    if key and not refresh and (hit := cache.get(key)) is not None:  # type: ignore[union-attr]
+        sol1, sol2 = hit
+        return DayResult(day, sol1, sol2, time.process_time() - start, cached=True)
+    sol1, sol2, timings = solve(*day_solver(day_module), parallel=parallel)
+    if key:
+        cache.put(key, [sol1, sol2])  # type: ignore[union-attr]
+    return DayResult(day, sol1, sol2, time.process_time() - start, timings=timings)
+
+
+def _adopt_key(key: str | None) -> None:
+    # initializer of the workers, a module level function to be picklable
+    key_provider.adopt(key)
+
+
+def worker_pool(
+    max_workers: int | None, mp_context: BaseContext | None = None
+) -> ProcessPoolExecutor:
+    """Process pool whose workers know the key without asking the keyring.
+
+    The key is resolved once here and handed to every worker, whatever the
+    start method.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=_adopt_key,
+        initargs=(key_provider.share(),),
+    )
+
+
+def run_days(
+    days: Iterable[int],
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+    refresh: bool = False,  # noqa: FBT001, FBT002
+) -> Iterator[DayResult]:
+    """Run several days, results are yielded in the order of `days`.
+
+    With `jobs` > 1 the days are distributed across that many worker processes,
+    `jobs` == 0 uses one worker per CPU. `cache` and `refresh` are passed on to
+    `run_day`.
+    """
+    run = partial(run_day, cache=cache, refresh=refresh)
+    if jobs == 1:
+        yield from (r for r in map(run, days) if r is not None)
+        return
+
+    pool = worker_pool(jobs or os.cpu_count())
+    try:
+        # map() hands out results in submission order, i.e. day order
+        yield from (r for r in pool.map(run, days) if r is not None)
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _max_rss(usage: struct_rusage) -> int:
+    # ru_maxrss is reported in bytes on macOS, in KiB everywhere else
+    return usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+
+
+def _allocated_blocks(day: int) -> int:
+    """Blocks allocated by a cold run of `day` and still alive at its end.
+
+    Counted by tracemalloc, which only knows the blocks alive when the snapshot
+    is taken, blocks allocated and freed during the run aren't included.
+    """
+    import tracemalloc
+
+    from aoc23.cli.bench import clear_caches
+
+    clear_caches(import_module(day_module_name(day)))
+    tracemalloc.start()
+    try:
+        run_day(day)
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    return sum(stat.count for stat in snapshot.statistics("filename"))
+
+
+def run_day_measured(day: int) -> DayResult | None:
+    """Like `run_day`, additionally recording the resources used by the day.
+
+    Peak memory is a process wide high-water mark, the numbers are therefore
+    only meaningful if the day is the only thing running in the process. The
+    allocated blocks are counted in a second run, tracemalloc would slow down
+    the first one and add its traces to the peak memory.
+    """
+    import resource
+
+    before = resource.getrusage(resource.RUSAGE_SELF)
+    start = time.perf_counter()
+    result = run_day(day)
+    wall_time = time.perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_SELF)
+    if result is None:
+        return None
+    usage = ResourceUsage(
+        wall_time=wall_time,
+        user_time=after.ru_utime - before.ru_utime,
+        sys_time=after.ru_stime - before.ru_stime,
+        peak_rss=_max_rss(after) - _max_rss(before),
+        allocated_blocks=_allocated_blocks(day),
+    )
+    return result._replace(usage=usage)
+
+
+# seconds a cancelled child gets to stop by itself before it is killed
+CANCEL_GRACE = 1.0
+
+# seconds between two progress messages sent by a child
+PROGRESS_INTERVAL = 0.2
+
+
+class Outcome(NamedTuple):
+    """Result of calling a function in a child process, see `run_isolated`."""
+
+    position: int  # of the item in the items given
+    value: Any = None
+    error: BaseException | None = None
+    timed_out: bool = False
+    progress: str | None = None  # the last progress the function reported
+    elapsed: float = 0.0
+
+
+class _Child(NamedTuple):
+    position: int
+    process: BaseProcess
+    started: float
+    progress: str | None = None
+    cancelled_at: float | None = None
+
+
+class _PipeReporter:
+    """Sends the progress of a child to its parent, at most every PROGRESS_INTERVAL."""
+
+    def __init__(self, conn: Connection) -> None:
+        self.conn = conn
+        self.next_send = 0.0
+
+    def __call__(self, label: str, done: int, total: int | None) -> None:
+        if (now := time.monotonic()) >= self.next_send:
+            self.next_send = now + PROGRESS_INTERVAL
+            self.conn.send(("progress", str(progress.Progress(label, done, total))))
+
+
+def _run_child(func: Callable[[Any], Any], item: Any, conn: Connection) -> None:  # noqa: ANN401
+    # the parent asks to stop with SIGTERM, before killing the child
+    signal.signal(signal.SIGTERM, lambda *_: progress.cancel())
+    try:
+        with progress.reporting(_PipeReporter(conn)):
+            try:
+                conn.send(("result", (func(item), None)))
+            except progress.Cancelled as e:
+                conn.send(("cancelled", str(e)))
+            except Exception as e:  # noqa: BLE001
+                try:
+                    conn.send(("result", (None, e)))
+                except Exception:  # noqa: BLE001
+                    # the exception itself can't be pickled
+                    conn.send(("result", (None, RuntimeError(repr(e)))))
+    finally:
+        conn.close()
+
+
+def _deadline(child: _Child, timeout: float | None, overall: float) -> float:
+    if child.cancelled_at is not None:
+        return child.cancelled_at + CANCEL_GRACE
+    return min(overall, child.started + timeout if timeout is not None else math.inf)
+
+
+def _receive(conn: Connection, child: _Child) -> Outcome | _Child:
+    """The outcome of a finished child, else the child with its new progress."""
+    elapsed = time.monotonic() - child.started
+    try:
+        kind, payload = conn.recv()
+    except EOFError:
+        if child.cancelled_at is not None:
+            # didn't stop in time and got killed
+            return Outcome(
+                child.position, timed_out=True, progress=child.progress, elapsed=elapsed
+            )
+        error = ChildProcessError("worker process died")
+        return Outcome(child.position, error=error, progress=child.progress)
+    if kind == "progress":
+        return child._replace(progress=payload)
+    if kind == "cancelled":
+        return Outcome(
+            child.position, timed_out=True, progress=payload, elapsed=elapsed
+        )
+    value, error = payload
+    return Outcome(
+        child.position, value, error, progress=child.progress, elapsed=elapsed
+    )
+
+
+def run_isolated(  # noqa: C901
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    jobs: int = 1,
+    timeout: float | None = None,
+    total_timeout: float | None = None,
+) -> Iterator[Outcome]:
+    """Call `func` for every item in a fresh forked child, in order of completion.
+
+    Up to `jobs` children run at the same time (0: one per CPU). A child
+    running longer than `timeout` seconds, or when `total_timeout` seconds have
+    passed since the start, is cancelled: it receives SIGTERM, which makes the
+    next `aoc23.support.progress.report` raise Cancelled, and is killed if it
+    doesn't stop within CANCEL_GRACE seconds. Items not started before the
+    total timeout time out without running.
+    """
+    from multiprocessing import get_context
+    from multiprocessing.connection import wait
+
+    # forked children inherit the key resolved here, `func` and the items
+    # don't need to be picklable
+    key_provider.share()
+    ctx = get_context("fork")
+    max_running = jobs or os.cpu_count() or 1
+    overall = math.inf if total_timeout is None else time.monotonic() + total_timeout
+    pending = iter(enumerate(items))
+    running: dict[Connection, _Child] = {}
+    try:
+        while True:
+            while len(running) < max_running and (todo := next(pending, None)):
+                index, item = todo
+                if time.monotonic() >= overall:
+                    yield Outcome(index, timed_out=True)
+                    continue
+                receiver, sender = ctx.Pipe(duplex=False)
+                process = ctx.Process(target=_run_child, args=(func, item, sender))
+                process.start()
+                sender.close()
+                running[receiver] = _Child(index, process, time.monotonic())
+            if not running:
+                return
+            deadline = min(_deadline(c, timeout, overall) for c in running.values())
+            left = (
+                None if deadline == math.inf else max(0.0, deadline - time.monotonic())
+            )
+            # wait() returns the connections it was given
+            for conn in cast("list[Connection]", wait(list(running), left)):
+                received = _receive(conn, running[conn])
+                if isinstance(received, _Child):
+                    running[conn] = received
+                    continue
+                child = running.pop(conn)
+                conn.close()
+                child.process.join()
+                yield received
+            now = time.monotonic()
+            for conn, child in list(running.items()):
+                if now < _deadline(child, timeout, overall):
+                    continue
+                if child.cancelled_at is None:
+                    child.process.terminate()
+                    running[conn] = child._replace(cancelled_at=now)
+                else:
+                    child.process.kill()
+                    child.process.join()
+                    conn.close()
+                    del running[conn]
+                    elapsed = now - child.started
+                    yield Outcome(
+                        child.position,
+                        timed_out=True,
+                        progress=child.progress,
+                        elapsed=elapsed,
+                    )
+    finally:
+        for conn, child in running.items():
+            child.process.kill()
+            child.process.join()
+            conn.close()
+
+
+def run_days_isolated(
+    days: Iterable[int],
+    jobs: int = 1,
+    timeout: float | None = None,
+    total_timeout: float | None = None,
+    run: Callable[[int], DayResult | None] = run_day_measured,
+) -> Iterator[DayResult]:
+    """Run every day in a fresh child process, by default reporting its resources.
+
+    A forked child per day makes the peak memory attributable to that day
+    alone, the result cache isn't consulted. Up to `jobs` children run at the
+    same time (0: one per CPU), the results are yielded in the order of `days`.
+    Days exceeding the timeouts (see `run_isolated`) are yielded as DayResult
+    with `timed_out` set. Errors of a day are raised.
+    """
+    days = list(days)
+    done: dict[int, DayResult | None] = {}
+    next_index = 0
+    for outcome in run_isolated(run, days, jobs, timeout, total_timeout):
+        day = days[outcome.position]
+        if outcome.timed_out:
+            done[outcome.position] = DayResult(
+                day,
+                None,
+                None,
+                outcome.elapsed,
+                timed_out=True,
+                progress=outcome.progress,
+            )
+        elif isinstance(outcome.error, ChildProcessError):
+            msg = f"day {day:02}: {outcome.error}"
+            raise ChildProcessError(msg)
+        elif outcome.error is not None:
+            raise outcome.error
+        else:
+            done[outcome.position] = outcome.value
+        while next_index in done:
+            if (result := done.pop(next_index)) is not None:
+                yield result
+            next_index += 1
+
+
+def timeout_message(elapsed: float, last_progress: str | None) -> str:
+    message = f"TIMEOUT after {elapsed:.1f}s"
+    return f"{message}, last progress: {last_progress}" if last_progress else message
+
+
+def usage_record(result: DayResult) -> dict[str, Any]:
+    """A JSON serializable summary of a measured day."""
+    if result.timed_out:
+        return {
+            "day": result.day,
+            "timeout": timeout_message(result.cpu_time, result.progress),
+        }
+    usage = result.usage._asdict() if result.usage else {}
+    return {
+        "day": result.day,
+        "sol1": sha256(result.sol1),
+        "sol2": sha256(result.sol2),
+        "cpu_time": result.cpu_time,
+        **usage,
+    }
+
+
+def usage_table(results: Iterable[DayResult]) -> str:
+    header = (
+        f"{'DAY':>3} {'WALL[s]':>9} {'USER[s]':>9} {'SYS[s]':>9}"
+        f" {'PEAK RSS+[MiB]':>14} {'ALLOC BLOCKS':>12}"
+    )
+    lines = [header]
+    for r in results:
+        if (u := r.usage) is None:
+            continue
+        lines.append(
+            f"{r.day:>3} {u.wall_time:>9.3f} {u.user_time:>9.3f} {u.sys_time:>9.3f}"
+            f" {u.peak_rss / 1024:>14.1f} {u.allocated_blocks:>12}"
+        )
+    return "\n".join(lines)
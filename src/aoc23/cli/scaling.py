@@ -0,0 +1,259 @@
+"""Empirical complexity of the days on synthetic inputs of growing size.
+
+A day is run on generated inputs whose scale grows geometrically. Time,
+traced peak memory and the self time of every function in the day's module
+are recorded per size, then fitted to `c * size ** exponent` by least squares
+in log-log space. The size is the number of characters of the input, so an
+exponent of 1 is linear in the input, whatever `scale` means for the day.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import csv
+import io
+import math
+import pstats
+import tracemalloc
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from aoc23.cli.bench import clear_caches
+from aoc23.cli.runner import day_module_name
+from aoc23.support import generate
+from aoc23.support.solver import day_solver, timed
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from pathlib import Path
+    from types import ModuleType
+
+    from aoc23.support import Solver
+
+PHASES = ("parse", "part1", "part2")
+
+
+class Sample(NamedTuple):
+    scale: int
+    size: int  # characters of the input
+    parse: float
+    part1: float
+    part2: float
+    peak_memory: int  # bytes allocated at most while solving, per tracemalloc
+    functions: dict[str, float]  # self time per function of the day module
+
+    @property
+    def seconds(self) -> float:
+        return self.parse + self.part1 + self.part2
+
+
+class Hotspot(NamedTuple):
+    day: int
+    function: str
+    exponent: float
+    share: float  # of the self time at the largest size
+
+
+class DayScaling(NamedTuple):
+    day: int
+    samples: list[Sample]
+    time_exponent: float
+    memory_exponent: float
+    hotspots: list[Hotspot]
+
+
+def fit_exponent(sizes: Sequence[float], values: Sequence[float]) -> float:
+    """Slope of log(values) over log(sizes), NaN with less than two sizes."""
+    points = [(math.log(s), math.log(v)) for s, v in zip(sizes, values) if v > 0]
+    if len({x for x, _ in points}) < 2:  # noqa: PLR2004
+        return math.nan
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    return covariance / variance
+
+
+def _self_times(profile: cProfile.Profile, module_file: str) -> dict[str, float]:
+    stats: dict[Any, tuple] = pstats.Stats(profile).stats  # type: ignore[attr-defined]
+    return {
+        f"{name}:{line}": entry[2]
+        for (filename, line, name), entry in stats.items()
+        if filename == module_file
+    }
+
+
+def _solve(day_module: ModuleType, solver: Solver[Any], raw: str) -> tuple[float, ...]:
+    clear_caches(day_module)
+    parsed, parse_time = timed(solver.parse, raw)
+    _, time1 = timed(solver.part1, parsed)
+    _, time2 = timed(solver.part2, parsed)
+    return parse_time, time1, time2
+
+
+def measure(day: int, scale: int, seed: int = 0, repeat: int = 3) -> Sample:
+    """Solve the generated input of `scale`, the fastest of `repeat` runs counts.
+
+    Memory and the functions are measured in two more runs, under tracemalloc
+    resp. cProfile, which slow the code down. Caches of the day's functions are
+    cleared before every run.
+    """
+    day_module = import_module(day_module_name(day))
+    solver, input_path = day_solver(day_module)
+    if input_path is None:
+        msg = f"day {day:02} reads its input itself"
+        raise ValueError(msg)
+    raw = "".join(generate.generate(day, scale, seed))
+    parse, part1, part2 = (
+        min(t) for t in zip(*(_solve(day_module, solver, raw) for _ in range(repeat)))
+    )
+    tracemalloc.start()
+    try:
+        _solve(day_module, solver, raw)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    with cProfile.Profile() as profile:
+        _solve(day_module, solver, raw)
+    functions = _self_times(profile, str(day_module.__file__))
+    return Sample(
+        scale=scale,
+        size=len(raw),
+        parse=parse,
+        part1=part1,
+        part2=part2,
+        peak_memory=peak_memory,
+        functions=functions,
+    )
+
+
+def scales(start: int, factor: float = 2.0) -> Iterator[int]:
+    """Geometrically growing, distinct scales from `start` on."""
+    scale = start
+    while True:
+        yield scale
+        scale = max(scale + 1, round(scale * factor))
+
+
+def measure_series(
+    day: int, scales: Iterable[int], budget: float, seed: int = 0, repeat: int = 3
+) -> list[Sample]:
+    """Samples of growing scales until solving takes longer than `budget` seconds."""
+    samples = []
+    for scale in scales:
+        samples.append(sample := measure(day, scale, seed, repeat))
+        if sample.seconds > budget:
+            break
+    return samples
+
+
+def find_hotspots(
+    day: int, samples: Sequence[Sample], threshold: float, min_share: float
+) -> list[Hotspot]:
+    """Functions growing faster than size ** `threshold`, the costliest first.
+
+    Only functions taking at least `min_share` of the self time at the largest
+    size are considered, small ones are mostly noise.
+    """
+    largest = samples[-1].functions
+    total = sum(largest.values())
+    hotspots = []
+    for function, seconds in largest.items():
+        if not total or seconds / total < min_share:
+            continue
+        points = [(s.size, s.functions.get(function, 0.0)) for s in samples]
+        exponent = fit_exponent(*zip(*points))
+        if exponent > threshold:
+            hotspots.append(Hotspot(day, function, exponent, seconds / total))
+    return sorted(hotspots, key=lambda h: h.share, reverse=True)
+
+
+def analyze(
+    day: int, samples: list[Sample], threshold: float = 1.3, min_share: float = 0.05
+) -> DayScaling:
+    sizes = [s.size for s in samples]
+    return DayScaling(
+        day,
+        samples,
+        fit_exponent(sizes, [s.seconds for s in samples]),
+        fit_exponent(sizes, [s.peak_memory for s in samples]),
+        find_hotspots(day, samples, threshold, min_share),
+    )
+
+
+def write_csv(results: Iterable[DayScaling], path: Path) -> None:
+    """One row per day and size."""
+    with path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            ["day", "scale", "size", *PHASES, "seconds", "peak_memory"],
+        )
+        for result in results:
+            for s in result.samples:
+                writer.writerow(
+                    [
+                        result.day,
+                        s.scale,
+                        s.size,
+                        *(f"{t:.6f}" for t in (s.parse, s.part1, s.part2, s.seconds)),
+                        s.peak_memory,
+                    ]
+                )
+
+
+def text_plot(result: DayScaling, width: int = 60, height: int = 12) -> str:
+    """Log-log plot of time (*) and memory (o) relative to the smallest size.
+
+    The dots are a linear reference, points above them grow super-linearly.
+    """
+    samples = result.samples
+    series = [
+        ("*", [s.seconds for s in samples]),
+        ("o", [float(s.peak_memory) for s in samples]),
+    ]
+    x0 = math.log(samples[0].size)
+    xs = [math.log(s.size) - x0 for s in samples]
+    x_max = max(xs) or 1.0
+    # slope 1 in log-log space
+    points = [(".", x, x) for x in (c / (width - 1) * x_max for c in range(width))]
+    for mark, values in series:
+        y0 = math.log(max(values[0], 1e-9))
+        points += [(mark, x, math.log(max(v, 1e-9)) - y0) for x, v in zip(xs, values)]
+    y_min = min(0.0, *(y for _, _, y in points))
+    y_max = max(y for _, _, y in points) or 1.0
+    rows = [[" "] * width for _ in range(height)]
+    for mark, x, y in points:
+        col = round(x / x_max * (width - 1))
+        row = height - 1 - round((y - y_min) / (y_max - y_min) * (height - 1))
+        # time and memory are drawn over the reference
+        if rows[row][col] in " .":
+            rows[row][col] = mark
+    labels = [
+        f"x{math.exp(y_max):.3g}",
+        *[""] * (height - 2),
+        f"x{math.exp(y_min):.3g}",
+    ]
+    lines = [f"{label:>9} |{''.join(row)}" for label, row in zip(labels, rows)]
+    first, last = str(samples[0].size), f"{samples[-1].size} chars"
+    lines.append(f"{'':>9} +{'-' * width}")
+    lines.append(f"{'':>11}{first}{last:>{width - len(first)}}")
+    return "\n".join(lines)
+
+
+def report(results: Iterable[DayScaling]) -> str:
+    """Exponents, plot and super-linear hot spots of every day."""
+    out = io.StringIO()
+    for result in results:
+        sizes = ", ".join(str(s.size) for s in result.samples)
+        out.write(
+            f"DAY {result.day:02}  time ~ size^{result.time_exponent:.2f}"
+            f"  memory ~ size^{result.memory_exponent:.2f}  (sizes {sizes})\n"
+        )
+        out.write(text_plot(result) + "\n")
+        for h in result.hotspots:
+            out.write(
+                f"  HOT SPOT {h.function}: self time ~ size^{h.exponent:.2f},"
+                f" {h.share:.0%} of the time at the largest size\n"
+            )
+        out.write("\n")
+    return out.getvalue()
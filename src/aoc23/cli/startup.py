@@ -0,0 +1,40 @@
+"""Measure what importing a module costs, based on `python -X importtime`."""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from typing import NamedTuple
+
+IMPORT_CMD = "import importlib, sys; importlib.import_module(sys.argv[1])"
+IMPORT_TIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self: int  # microseconds
+    cumulative: int  # microseconds, including the imports made by the module
+    depth: int
+
+
+def parse_import_times(output: str) -> list[ImportTime]:
+    times = []
+    for line in output.splitlines():
+        if match := IMPORT_TIME.match(line):
+            us_self, us_cumulative, indent, module = match.groups()
+            times.append(
+                ImportTime(module, int(us_self), int(us_cumulative), len(indent) // 2)
+            )
+    return times
+
+
+def import_times(module: str) -> list[ImportTime]:
+    """Import `module` in a fresh interpreter and collect the import times."""
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", IMPORT_CMD, module],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_import_times(proc.stderr)
@@ -1,14 +1,33 @@
+from __future__ import annotations
+
+import codecs
 import hashlib
 import os
 from pathlib import Path
-from typing import Protocol, TypeVar
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+from aoc23.support.cache import InputCache
+from aoc23.support.container import (
+    decrypted_container,
+    is_container,
+    iter_decrypted_container,
+)
+from aoc23.support.keys import KeyProvider
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from cryptography.hazmat.primitives.ciphers import Cipher
+    from cryptography.hazmat.primitives.padding import PKCS7
 
-import keyring
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import padding
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+# keyring and cryptography are imported where needed, they are slow to import
+# and most CLI commands (and some days) don't use them
 
 T_co = TypeVar("T_co", covariant=True)
+P = TypeVar("P")
+
+# number of bytes read at once when streaming an input file
+CHUNK_SIZE = 1 << 20
 
 
 class LineParser(Protocol[T_co]):
@@ -20,24 +39,103 @@ def default_parser(line: str) -> str:
     return line
 
 
+class Solver(Protocol[P]):
+    """A day whose input is parsed once and shared by both parts.
+
+    Day modules implement it with module level functions and name the input
+    file they solve in INPUT. The parts must not modify the parsed input, they
+    may run in any order, repeatedly or in separate processes.
+    """
+
+    def parse(self, raw: str) -> P:
+        ...
+
+    def part1(self, parsed: P) -> Any:  # noqa: ANN401
+        ...
+
+    def part2(self, parsed: P) -> Any:  # noqa: ANN401
+        ...
+
+
+input_cache = InputCache()
+key_provider = KeyProvider("aoc2023", "encryptionkey")
+
+
+def input_key() -> bytes:
+    key = key_provider.get()
+    if not key:
+        msg = "aoc2023/encryptionkey not found in keyring"
+        raise Exception(msg)  # noqa: TRY002
+    return bytes.fromhex(key)
+
+
+def decrypt_input(encrypted_file: Path) -> bytes:
+    return decrypted_content(encrypted_file, input_key())
+
+
+def read_input(inputfile: Path) -> str:
+    """Content of `inputfile`, decrypted from <inputfile>.enc if necessary."""
+    if inputfile.exists():
+        return inputfile.open("r").read()
+    if (encrypted_file := Path(str(inputfile) + ".enc")).exists():
+        return input_cache.get(encrypted_file, decrypt_input).decode()
+    return ""
+
+
+def read_input_bytes(inputfile: Path) -> bytes:
+    """Like `read_input`, without decoding the content."""
+    if inputfile.exists():
+        return inputfile.read_bytes()
+    if (encrypted_file := Path(str(inputfile) + ".enc")).exists():
+        return input_cache.get(encrypted_file, decrypt_input)
+    return b""
+
+
 def get_input(
     inputfile: Path,
     line_parser: LineParser[T_co] = default_parser,  # type: ignore  # noqa: PGH003
 ) -> list[T_co]:
+    return [line_parser(line) for line in read_input(inputfile).split("\n")]
+
+
+def iter_input(
+    inputfile: Path,
+    line_parser: LineParser[T_co] = default_parser,  # type: ignore  # noqa: PGH003
+) -> Iterator[T_co]:
+    """Lazy variant of `get_input`, yields the same lines one by one.
+
+    Encrypted files are decrypted chunk by chunk, so only a chunk and the line
+    currently parsed are held in memory.
+    """
+    chunks: Iterable[str]
     if inputfile.exists():
-        content = inputfile.open("r").read()
+        chunks = iter_text_chunks(inputfile)
     elif (encrypted_file := Path(str(inputfile) + ".enc")).exists():
-        key = get_aoc_secret("aoc2023", "encryptionkey")
-        if key:
-            content = decrypted_content(encrypted_file, bytes.fromhex(key)).decode()
+        if (cached := input_cache.cached(encrypted_file)) is not None:
+            chunks = [cached.decode()]
         else:
-            msg = "aoc2023/encryptionkey not found in keyring"
-            raise Exception(msg)  # noqa: TRY002
-
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            decrypted = iter_decrypted_content(encrypted_file, input_key())
+            chunks = (decoder.decode(chunk) for chunk in decrypted)
     else:
-        content = ""
+        chunks = [""]
+
+    yield from (line_parser(line) for line in split_lines(chunks))
+
 
-    return [line_parser(line) for line in content.split("\n")]
+def iter_text_chunks(input_path: Path) -> Iterator[str]:
+    with input_path.open("r") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+
+def split_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Join text chunks and split them into lines like `get_input` does."""
+    rest = ""
+    for chunk in chunks:
+        *lines, rest = (rest + chunk).split("\n")
+        yield from lines
+    yield rest
 
 
 def sha256(input_string: str) -> str:
@@ -56,29 +154,34 @@ def sha256(input_string: str) -> str:
 def encrypted_content(input_path: Path, key: bytes) -> bytes:
     assert input_path.exists()  # noqa: S101
 
-    input_bytes = input_path.open().read().encode()
+    return encrypted_bytes(input_path.open().read().encode(), key)
+
 
+def encrypted_bytes(input_bytes: bytes, key: bytes) -> bytes:
     # Generate a random initialization vector (IV)
     iv = os.urandom(16)
 
     # Pad the input bytes to a multiple of the block size
-    padder = padding.PKCS7(algorithms.AES.block_size).padder()  # type: ignore  # noqa: PGH003
+    padder = pkcs7().padder()
     padded_input_bytes = padder.update(input_bytes) + padder.finalize()
 
     # Create an AES cipher object with CBC mode
-    cipher = Cipher(algorithms.AES(key), modes.CFB(iv), backend=default_backend())
+    cipher = aes_cfb(key, iv)
     encryptor = cipher.encryptor()
 
     # Encrypt the padded input bytes
-    encrypted_bytes = encryptor.update(padded_input_bytes) + encryptor.finalize()
+    ciphertext = encryptor.update(padded_input_bytes) + encryptor.finalize()
 
     # Return the IV and encrypted bytes
-    return iv + encrypted_bytes
+    return iv + ciphertext
 
 
 def decrypted_content(input_path: Path, key: bytes) -> bytes:
     assert input_path.exists()  # noqa: S101
 
+    if is_container(input_path):
+        return decrypted_container(input_path, key)
+
     encrypted_bytes = input_path.open("rb").read()
 
     # Extract the IV from the first 16 bytes of the encrypted data
@@ -88,22 +191,57 @@ def decrypted_content(input_path: Path, key: bytes) -> bytes:
     ciphertext = encrypted_bytes[16:]
 
     # Create an AES cipher object with CBC mode
-    cipher = Cipher(algorithms.AES(key), modes.CFB(iv), backend=default_backend())
+    cipher = aes_cfb(key, iv)
     decryptor = cipher.decryptor()
 
     # Decrypt the ciphertext
     decrypted_padded_data = decryptor.update(ciphertext) + decryptor.finalize()
 
     # Unpad the decrypted data
-    unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()  # type: ignore  # noqa: PGH003
+    unpadder = pkcs7().unpadder()
     return unpadder.update(decrypted_padded_data) + unpadder.finalize()
 
 
+def iter_decrypted_content(input_path: Path, key: bytes) -> Iterator[bytes]:
+    """Streaming variant of `decrypted_content`, yields the plain-text in chunks."""
+    if is_container(input_path):
+        yield from iter_decrypted_container(input_path, key)
+        return
+
+    with input_path.open("rb") as f:
+        iv = f.read(16)
+        cipher = aes_cfb(key, iv)
+        decryptor = cipher.decryptor()
+        # the unpadder holds back the final block until finalize() is called
+        unpadder = pkcs7().unpadder()
+        while chunk := f.read(CHUNK_SIZE):
+            yield unpadder.update(decryptor.update(chunk))
+        yield unpadder.update(decryptor.finalize()) + unpadder.finalize()
+
+
+def aes_cfb(key: bytes, iv: bytes) -> Cipher:
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+    return Cipher(algorithms.AES(key), modes.CFB(iv), backend=default_backend())
+
+
+def pkcs7() -> PKCS7:
+    from cryptography.hazmat.primitives import padding
+    from cryptography.hazmat.primitives.ciphers import algorithms
+
+    return padding.PKCS7(algorithms.AES.block_size)  # type: ignore  # noqa: PGH003
+
+
 def store_aoc_secret(service_name: str, secret_name: str, secret: str) -> None:
+    import keyring
+
     # Store the secret in the keychain
     keyring.set_password(service_name, secret_name, secret)
 
 
 def get_aoc_secret(service_name: str, secret_name: str) -> str | None:
+    import keyring
+
     # Retrieve the secret from the keychain
     return keyring.get_password(service_name, secret_name)
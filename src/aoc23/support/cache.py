@@ -0,0 +1,221 @@
+"""Caches for decrypted input files and for solutions."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from stat import S_ISREG
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DISK_CACHE_ENV = "AOC23_DISK_CACHE"
+RESULT_CACHE_SIZE_ENV = "AOC23_RESULT_CACHE_SIZE"
+RESULT_CACHE_SIZE = 4 << 20
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "aoc23"
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+
+# a cached entry is valid as long as mtime and size of the source file match
+Signature = tuple[int, int]
+
+
+def signature(path: Path) -> Signature:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def cache_files(directory: Path) -> list[tuple[Path, int]]:
+    """Files in `directory` and their sizes, least recently modified first."""
+    if not directory.is_dir():
+        return []
+    files = []
+    for f in directory.iterdir():
+        try:
+            stat = f.stat()
+        except FileNotFoundError:  # removed by a concurrent process
+            continue
+        if S_ISREG(stat.st_mode):
+            files.append((stat.st_mtime_ns, f, stat.st_size))
+    return [(f, size) for _, f, size in sorted(files)]
+
+
+def clear_files(directory: Path) -> int:
+    """Remove the files in `directory`, returns how many were removed."""
+    files = cache_files(directory)
+    for f, _ in files:
+        f.unlink(missing_ok=True)
+    return len(files)
+
+
+def write_private(path: Path, content: bytes) -> None:
+    """Atomically write `content` to a file only readable by the current user."""
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(content)
+    tmp.replace(path)
+
+
+class InputCache:
+    """Decrypted file contents keyed by path, modification time and size.
+
+    The on-disk cache stores plain-text, it is therefore only used if enabled
+    explicitly (`enable_disk`, or by setting AOC23_DISK_CACHE=1) and lives in a
+    directory only accessible by the current user.
+    """
+
+    def __init__(self) -> None:
+        """Start empty, with the disk cache enabled if AOC23_DISK_CACHE is 1."""
+        self._entries: dict[Path, tuple[Signature, bytes]] = {}
+        self._disk_dir: Path | None = None
+        self.stats = CacheStats()
+        if os.environ.get(DISK_CACHE_ENV) == "1":
+            self.enable_disk()
+
+    @property
+    def disk_dir(self) -> Path | None:
+        return self._disk_dir
+
+    def enable_disk(self, directory: Path | None = None) -> None:
+        directory = directory or default_cache_dir() / "inputs"
+        directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        directory.chmod(0o700)
+        self._disk_dir = directory
+
+    def disable_disk(self) -> None:
+        self._disk_dir = None
+
+    def get(self, path: Path, load: Callable[[Path], bytes]) -> bytes:
+        """Return the content of `path`, calling `load` only if not cached."""
+        if (content := self.cached(path)) is not None:
+            return content
+
+        path = path.resolve()
+        sig = signature(path)
+        if (content := self._read_disk(path, sig)) is not None:
+            self.stats.disk_hits += 1
+        else:
+            self.stats.misses += 1
+            content = load(path)
+            self._write_disk(path, sig, content)
+        self._entries[path] = (sig, content)
+        return content
+
+    def cached(self, path: Path) -> bytes | None:
+        """Return the content of `path` if it is held in memory, None otherwise."""
+        path = path.resolve()
+        if (entry := self._entries.get(path)) and entry[0] == signature(path):
+            self.stats.hits += 1
+            return entry[1]
+        return None
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """Drop `path` from memory and disk, or everything if no path is given."""
+        paths = [path.resolve()] if path else list(self._entries)
+        for p in paths:
+            self._entries.pop(p, None)
+        if self._disk_dir is None:
+            return
+        files = [self._disk_file(p) for p in paths] if path else self._disk_files()
+        for f in files:
+            f.unlink(missing_ok=True)
+
+    def _disk_file(self, path: Path) -> Path:
+        assert self._disk_dir is not None  # noqa: S101
+        return self._disk_dir / hashlib.sha256(str(path).encode()).hexdigest()
+
+    def _disk_files(self) -> list[Path]:
+        assert self._disk_dir is not None  # noqa: S101
+        return [f for f, _ in cache_files(self._disk_dir)]
+
+    def _read_disk(self, path: Path, sig: Signature) -> bytes | None:
+        if self._disk_dir is None:
+            return None
+        try:
+            header, content = self._disk_file(path).read_bytes().split(b"\n", 1)
+        except (FileNotFoundError, ValueError):
+            return None
+        return content if header == b"%d %d" % sig else None
+
+    def _write_disk(self, path: Path, sig: Signature, content: bytes) -> None:
+        if self._disk_dir is None:
+            return
+        write_private(self._disk_file(path), b"%d %d\n" % sig + content)
+
+
+class ResultCache:
+    """JSON serializable results keyed by a content hash, stored on disk.
+
+    Every hit refreshes the modification time of the entry, once the entries
+    exceed `max_size` bytes the least recently used ones are evicted. The size
+    defaults to AOC23_RESULT_CACHE_SIZE, or 4 MiB.
+    """
+
+    def __init__(
+        self, directory: Path | None = None, max_size: int | None = None
+    ) -> None:
+        """Store the entries in `directory`, by default results/ in the cache dir."""
+        self.directory = directory or default_cache_dir() / "results"
+        self.max_size = max_size or int(
+            os.environ.get(RESULT_CACHE_SIZE_ENV, RESULT_CACHE_SIZE)
+        )
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Any | None:  # noqa: ANN401
+        entry = self.directory / key
+        try:
+            value = json.loads(entry.read_bytes())
+        except (FileNotFoundError, ValueError):
+            self.stats.misses += 1
+            return None
+        with suppress(FileNotFoundError):  # evicted meanwhile
+            os.utime(entry)
+        self.stats.disk_hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> bool:  # noqa: ANN401
+        """Store `value`, returns False if it isn't JSON serializable."""
+        try:
+            content = json.dumps(value).encode()
+        except TypeError:
+            return False
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        write_private(self.directory / key, content)
+        self.evict()
+        return True
+
+    def entries(self) -> list[tuple[Path, int]]:
+        """Cached entries and their sizes, least recently used first."""
+        return cache_files(self.directory)
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the size limit is met."""
+        entries = self.entries()
+        size = sum(s for _, s in entries)
+        removed = 0
+        for entry, entry_size in entries:
+            if size <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            size -= entry_size
+            removed += 1
+        return removed
+
+    def clear(self) -> int:
+        return clear_files(self.directory)
@@ -0,0 +1,178 @@
+"""Chunked encrypted input container (format v2).
+
+Layout, all integers little endian:
+
+    header   magic, version, flags, chunk count, line count, salt
+    index    per chunk: file offset, stored size, plain size, first line number
+    chunks   AES-GCM encrypted (optionally zlib compressed) slices of the input
+
+Chunks always end on a line boundary and are authenticated independently,
+with the header and their own index entry as associated data. They can
+therefore be decrypted in parallel, and a range of lines only requires the
+chunks covering it.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from bisect import bisect_right
+from typing import IO, TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+MAGIC = b"AOC23v2\0"
+VERSION = 2
+FLAG_ZLIB = 0x01
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+HEADER = struct.Struct("<8sBBHIQ8s")
+INDEX_ENTRY = struct.Struct("<QIIQ")
+
+
+class Header(NamedTuple):
+    flags: int
+    chunk_count: int
+    line_count: int
+    salt: bytes
+
+    def pack(self) -> bytes:
+        return HEADER.pack(
+            MAGIC, VERSION, self.flags, 0, self.chunk_count, self.line_count, self.salt
+        )
+
+
+class Chunk(NamedTuple):
+    offset: int
+    size: int
+    plain_size: int
+    first_line: int
+
+    def pack(self) -> bytes:
+        return INDEX_ENTRY.pack(*self)
+
+
+def is_container(input_path: Path) -> bool:
+    with input_path.open("rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def split_chunks(content: bytes, chunk_size: int) -> Iterator[bytes]:
+    """Split into slices of about `chunk_size` bytes, ending after a newline."""
+    start = 0
+    while start < len(content):
+        end = content.find(b"\n", start + chunk_size - 1) + 1 or len(content)
+        yield content[start:end]
+        start = end
+
+
+def _nonce(salt: bytes, index: int) -> bytes:
+    return salt + index.to_bytes(4, "little")
+
+
+def encrypted_container(
+    content: bytes,
+    key: bytes,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    compress: bool = False,  # noqa: FBT001, FBT002
+) -> bytes:
+    plain_chunks = list(split_chunks(content, chunk_size))
+    stored = [zlib.compress(c) if compress else c for c in plain_chunks]
+    header = Header(
+        flags=FLAG_ZLIB if compress else 0,
+        chunk_count=len(plain_chunks),
+        line_count=content.count(b"\n") + 1,
+        salt=os.urandom(8),
+    )
+
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    aes = AESGCM(key)
+    offset = HEADER.size + INDEX_ENTRY.size * header.chunk_count
+    index: list[Chunk] = []
+    encrypted: list[bytes] = []
+    first_line = 0
+    for i, (plain, data) in enumerate(zip(plain_chunks, stored)):
+        # the GCM tag adds 16 bytes to every chunk
+        chunk = Chunk(offset, len(data) + 16, len(plain), first_line)
+        encrypted.append(
+            aes.encrypt(_nonce(header.salt, i), data, header.pack() + chunk.pack())
+        )
+        index.append(chunk)
+        offset += chunk.size
+        first_line += plain.count(b"\n")
+
+    return b"".join([header.pack(), *(c.pack() for c in index), *encrypted])
+
+
+def read_index(f: IO[bytes]) -> tuple[Header, list[Chunk]]:
+    magic, version, flags, _, chunk_count, line_count, salt = HEADER.unpack(
+        f.read(HEADER.size)
+    )
+    if magic != MAGIC or version != VERSION:
+        msg = f"not a version {VERSION} input container"
+        raise ValueError(msg)
+    index_data = f.read(INDEX_ENTRY.size * chunk_count)
+    index = [Chunk(*entry) for entry in INDEX_ENTRY.iter_unpack(index_data)]
+    return Header(flags, chunk_count, line_count, salt), index
+
+
+def _decrypt_chunk(
+    f: IO[bytes], key: bytes, header: Header, index: list[Chunk], i: int
+) -> bytes:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    chunk = index[i]
+    data = os.pread(f.fileno(), chunk.size, chunk.offset)
+    plain = AESGCM(key).decrypt(
+        _nonce(header.salt, i), data, header.pack() + chunk.pack()
+    )
+    return zlib.decompress(plain) if header.flags & FLAG_ZLIB else plain
+
+
+def decrypted_container(
+    input_path: Path, key: bytes, workers: int | None = None
+) -> bytes:
+    """Decrypt all chunks, spread across a pool of `workers` threads."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with input_path.open("rb") as f:
+        header, index = read_index(f)
+
+        def decrypt(i: int) -> bytes:
+            return _decrypt_chunk(f, key, header, index, i)
+
+        if header.chunk_count <= 1:
+            return b"".join(map(decrypt, range(header.chunk_count)))
+        with ThreadPoolExecutor(workers) as pool:
+            return b"".join(pool.map(decrypt, range(header.chunk_count)))
+
+
+def iter_decrypted_container(input_path: Path, key: bytes) -> Iterator[bytes]:
+    """Decrypt chunk by chunk, keeping only one chunk in memory."""
+    with input_path.open("rb") as f:
+        header, index = read_index(f)
+        for i in range(header.chunk_count):
+            yield _decrypt_chunk(f, key, header, index, i)
+
+
+def read_lines(input_path: Path, key: bytes, start: int, stop: int) -> list[str]:
+    """Return lines[start:stop] of the input, decrypting only the chunks needed."""
+    with input_path.open("rb") as f:
+        header, index = read_index(f)
+        stop = min(stop, header.line_count)
+        if start >= stop:
+            return []
+        if not index:  # empty input
+            return [""]
+        first_lines = [c.first_line for c in index]
+        first = bisect_right(first_lines, start) - 1
+        last = bisect_right(first_lines, stop - 1)
+        content = b"".join(
+            _decrypt_chunk(f, key, header, index, i) for i in range(first, last)
+        )
+    offset = index[first].first_line
+    return content.decode().split("\n")[start - offset : stop - offset]
@@ -0,0 +1,77 @@
+"""Synthetic inputs of arbitrary size, e.g. to see how the solutions scale.
+
+Every day has a module `dayNN` with a function `generate(scale, rng)` yielding
+the lines of a valid input in the format of that day. `scale` is the number of
+lines or items, for grids the side length, see the docstring of each generator.
+Modules whose items aren't separated by newlines define SEPARATOR.
+
+The same day, scale and seed always produce the same input. Inputs are written
+line by line as they are generated, generators only keep what the format
+requires (a row of a grid, the loop of day 10, ...), never the whole text.
+"""
+
+from __future__ import annotations
+
+import random
+from importlib import import_module
+from string import ascii_lowercase
+from typing import IO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import ModuleType
+
+
+def generator_module(day: int) -> ModuleType:
+    """Raises ModuleNotFoundError if there is no generator for `day`."""
+    return import_module(f"{__name__}.day{day:02}")
+
+
+def generate(day: int, scale: int, seed: int = 0) -> Iterator[str]:
+    """Text of the input in pieces, including the separators."""
+    module = generator_module(day)
+    separator = getattr(module, "SEPARATOR", "\n")
+    rng = random.Random(seed)  # noqa: S311
+    for i, item in enumerate(module.generate(scale, rng)):
+        # the inputs don't end with a newline
+        yield separator + item if i else item
+
+
+def write(day: int, scale: int, seed: int, out: IO[str]) -> int:
+    """Write the input to `out`, returns the number of characters written."""
+    return sum(out.write(piece) for piece in generate(day, scale, seed))
+
+
+def label(index: int, width: int = 3) -> str:
+    """Unique lowercase name of `index`, at least `width` letters long."""
+    letters: list[str] = []
+    while index or len(letters) < width:
+        index, digit = divmod(index, 26)
+        letters.append(ascii_lowercase[digit])
+    return "".join(reversed(letters))
+
+
+def staircase(
+    columns: int, width: int, height: int, rng: random.Random
+) -> list[tuple[int, int]]:
+    """Corners of a simple rectilinear polygon, clockwise from the top left.
+
+    The polygon spans `columns` columns of 1..`width` units, its top edge lies
+    in [0, height) and its bottom edge in (height, 2 * height].
+    `height` must be at least 2.
+    """
+    widths = [rng.randint(1, width) for _ in range(columns)]
+    tops, bottoms = [rng.randrange(height)], [rng.randrange(height)]
+    for ys in (tops, bottoms):
+        for _ in range(columns - 1):
+            # consecutive columns differ, so no corner is a straight line
+            y = rng.randrange(height - 1)
+            ys.append(y + (y >= ys[-1]))
+    corners, x = [], 0
+    for top, w in zip(tops, widths):
+        corners += [(x, top), (x + w, top)]
+        x += w
+    for bottom, w in zip(reversed(bottoms), reversed(widths)):
+        corners += [(x, height + 1 + bottom), (x - w, height + 1 + bottom)]
+        x -= w
+    return corners
@@ -0,0 +1,31 @@
+"""Calibration document, `scale` lines."""
+
+from __future__ import annotations
+
+from string import ascii_lowercase
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+DIGITS = "123456789"
+WORDS = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+TOKENS = (*ascii_lowercase, *DIGITS, *WORDS)
+LENGTHS = range(2, 13)
+# lines drawn at once, single draws dominate the run time otherwise
+BATCH = 1024
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    for start in range(0, scale, BATCH):
+        lengths = rng.choices(LENGTHS, k=min(BATCH, scale - start))
+        tokens = rng.choices(TOKENS, k=sum(lengths))
+        digits = rng.choices(DIGITS, k=len(lengths))
+        end = 0
+        for length, digit in zip(lengths, digits):
+            line = tokens[end : end + length]
+            end += length
+            # part 1 needs at least one digit per line
+            line.insert(int(rng.random() * (length + 1)), digit)
+            yield "".join(line)
@@ -0,0 +1,23 @@
+"""Cube games, `scale` games."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+COLORS = ("red", "green", "blue")
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    for game in range(1, scale + 1):
+        draws = (
+            ", ".join(
+                f"{rng.randint(1, 20)} {color}"
+                for color in rng.sample(COLORS, rng.randint(1, 3))
+            )
+            for _ in range(rng.randint(1, 6))
+        )
+        yield f"Game {game}: {'; '.join(draws)}"
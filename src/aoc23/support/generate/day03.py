@@ -0,0 +1,27 @@
+"""Engine schematic, `scale` rows of 140 columns."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+WIDTH = 140
+SYMBOLS = "*#+$/@%=&"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(scale):
+        row: list[str] = []
+        while len(row) < WIDTH:
+            if (r := rng.random()) < 0.1:  # noqa: PLR2004
+                row.extend(str(rng.randint(1, 999)))
+                # numbers on a row are separated
+                row.append(rng.choice(SYMBOLS) if rng.random() < 0.1 else ".")  # noqa: PLR2004
+            elif r < 0.15:  # noqa: PLR2004
+                row.append(rng.choice(SYMBOLS))
+            else:
+                row.append(".")
+        yield "".join(row[:WIDTH])
@@ -0,0 +1,27 @@
+"""Scratchcards, `scale` cards with 10 winning numbers and 25 numbers each."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+NUMBERS = range(1, 100)
+
+
+def _numbers(numbers: list[int]) -> str:
+    return " ".join(f"{n:>2}" for n in numbers)
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    width = len(str(scale))
+    for card in range(1, scale + 1):
+        winning = rng.sample(NUMBERS, 10)
+        # copies are never won beyond the last card
+        matches = min(rng.choice((0, 0, 1, 1, 2, 3, 4, 5, 10)), scale - card)
+        others = [n for n in NUMBERS if n not in winning]
+        numbers = rng.sample(winning, matches) + rng.sample(others, 25 - matches)
+        rng.shuffle(numbers)
+        yield f"Card {card:>{width}}: {_numbers(winning)} | {_numbers(numbers)}"
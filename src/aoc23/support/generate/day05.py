@@ -0,0 +1,41 @@
+"""Almanac, `scale` seed ranges and ranges per map."""
+
+from __future__ import annotations
+
+from itertools import pairwise
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+LIMIT = 1 << 32
+MAPS = (
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+)
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    seeds = []
+    for _ in range(scale):
+        start = rng.randrange(LIMIT)
+        seeds += [start, rng.randint(1, max(1, (LIMIT - start) // scale))]
+    yield "seeds: " + " ".join(map(str, seeds))
+    for name in MAPS:
+        yield ""
+        yield f"{name} map:"
+        # every map is a permutation of [0, LIMIT) made of `scale` ranges
+        cuts = [0, *sorted(rng.sample(range(1, LIMIT), scale - 1)), LIMIT]
+        sources = list(pairwise(cuts))
+        destinations = sources[:]
+        rng.shuffle(destinations)
+        destination = 0
+        for start, stop in destinations:
+            yield f"{destination} {start} {stop - start}"
+            destination += stop - start
@@ -0,0 +1,23 @@
+"""Boat races, 4 races whose concatenated time (part 2) is about `scale`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+RACES = 4
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    # the digits of `scale`, spread across the races
+    total = len(str(scale))
+    digits = [max(1, total // RACES + (i < total % RACES)) for i in range(RACES)]
+    times = [rng.randrange(max(4, 10 ** (d - 1)), 10**d) for d in digits]
+    # a record set by holding the button shorter than optimal can be beaten
+    records = [(hold := rng.randint(1, t // 2 - 1)) * (t - hold) for t in times]
+    widths = [len(str(r)) + 3 for r in records]
+    yield "Time:    " + "".join(f"{t:>{w}}" for t, w in zip(times, widths))
+    yield "Distance:" + "".join(f"{r:>{w}}" for r, w in zip(records, widths))
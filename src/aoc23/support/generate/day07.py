@@ -0,0 +1,16 @@
+"""Camel cards, `scale` hands."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+CARDS = "23456789TJQKA"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(scale):
+        yield f"{''.join(rng.choices(CARDS, k=5))} {rng.randint(1, 1000)}"
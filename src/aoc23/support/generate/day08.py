@@ -0,0 +1,40 @@
+"""Desert map, about `scale` nodes on 6 ghost paths.
+
+Every ghost walks a cycle through Z and back to the node after its start
+node, two nodes per step, so that the lcm of the first arrivals at Z is
+the answer of part 2, like in the real inputs. AAA to ZZZ is the first
+path.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aoc23.support.generate import label
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+PRIMES = (43, 47, 53, 59, 61, 67, 71, 73, 79, 83)
+GHOSTS = 6
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    periods = rng.sample(PRIMES, GHOSTS)
+    # each path has 2 nodes per step of its cycle
+    length = max(1, scale // (2 * sum(periods)))
+    yield "".join(rng.choices("LR", k=length))
+    yield ""
+    count = 0
+    for ghost, period in enumerate(periods):
+        start, end = ("AAA", "ZZZ") if ghost == 0 else (f"{ghost}GA", f"{ghost}GZ")
+        steps = [
+            [label(count := count + 1) for _ in range(2)]
+            for _ in range(length * period - 1)
+        ]
+        for node, targets in zip([[start], *steps, [end]], [*steps, [end], steps[0]]):
+            pair = targets if len(targets) == 2 else targets * 2  # noqa: PLR2004
+            for name in node:
+                left, right = rng.sample(pair, 2)
+                yield f"{name} = ({left}, {right})"
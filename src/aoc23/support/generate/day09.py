@@ -0,0 +1,26 @@
+"""OASIS report, `scale` histories of 21 values each.
+
+Every history is a polynomial of degree < 7, so its differences reach zero.
+"""
+
+from __future__ import annotations
+
+from math import comb
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+VALUES = 21
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(scale):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 7))]
+        offset = rng.randint(0, 10)
+        values = (
+            sum(c * comb(x + offset, k) for k, c in enumerate(coefficients))
+            for x in range(VALUES)
+        )
+        yield " ".join(map(str, values))
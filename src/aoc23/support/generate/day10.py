@@ -0,0 +1,57 @@
+"""Pipe maze, `scale` x `scale` tiles.
+
+The loop runs around a staircase shaped region and is surrounded by random
+pipes. S sits on a horizontal part of the loop, or on its first tile if it has
+none, with ground on its sides off the loop, so it connects to exactly two tiles.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aoc23.support.generate import staircase
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+MIN_SCALE = 8
+PIPES = "|-LJ7F"
+# pipe connecting two directions, given as (row, col) offsets
+TILES = {
+    frozenset({(-1, 0), (1, 0)}): "|",
+    frozenset({(0, -1), (0, 1)}): "-",
+    frozenset({(-1, 0), (0, 1)}): "L",
+    frozenset({(-1, 0), (0, -1)}): "J",
+    frozenset({(1, 0), (0, -1)}): "7",
+    frozenset({(1, 0), (0, 1)}): "F",
+}
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    size = max(scale, MIN_SCALE)
+    columns = max(2, (size - 2) // 4)
+    corners = staircase(columns, (size - 2) // columns, (size - 3) // 2, rng)
+    # tiles of the loop, the polygon is shifted by one tile off the border
+    loop: dict[tuple[int, int], str] = {}
+    path = []
+    for (x1, y1), (x2, y2) in zip(corners, corners[1:] + corners[:1]):
+        dx, dy = (x2 > x1) - (x2 < x1), (y2 > y1) - (y2 < y1)
+        path += [
+            (y1 + dy * i + 1, x1 + dx * i + 1)
+            for i in range(max(abs(x2 - x1), abs(y2 - y1)))
+        ]
+    for i, (row, col) in enumerate(path):
+        prev_row, prev_col = path[i - 1]
+        next_row, next_col = path[i - len(path) + 1]
+        ends = {(prev_row - row, prev_col - col), (next_row - row, next_col - col)}
+        loop[row, col] = TILES[frozenset(ends)]
+    # small staircases may turn at every tile
+    row, col = next((pos for pos, tile in loop.items() if tile == "-"), path[0])
+    loop[row, col] = "S"
+    for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        loop.setdefault((row + dr, col + dc), ".")
+    for row in range(size):
+        yield "".join(
+            loop.get((row, col)) or rng.choice(PIPES + "..") for col in range(size)
+        )
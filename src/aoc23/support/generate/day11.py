@@ -0,0 +1,22 @@
+"""Galaxy image, `scale` x `scale` pixels with some empty rows and columns."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+GALAXIES = 0.02
+EMPTY = 0.05
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    columns = [rng.random() >= EMPTY for _ in range(scale)]
+    for _ in range(scale):
+        empty = rng.random() < EMPTY
+        yield "".join(
+            "#" if used and not empty and rng.random() < GALAXIES else "."
+            for used in columns
+        )
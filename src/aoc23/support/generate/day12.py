@@ -0,0 +1,27 @@
+"""Condition records, `scale` rows of up to 20 springs."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+LENGTH = 20
+UNKNOWN = 0.5
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(scale):
+        groups = [rng.randint(1, 5) for _ in range(rng.randint(1, 5))]
+        # every group needs an operational spring after it, except the last
+        free = LENGTH - sum(groups) - len(groups) + 1
+        while free < 0:
+            free += groups.pop() + 1
+        springs = "." * rng.randint(0, free // 2)
+        for group in groups:
+            springs += "#" * group + "." * rng.randint(1, 2)
+        springs = springs.rstrip(".") + "." * rng.randint(0, 1)
+        record = "".join("?" if rng.random() < UNKNOWN else c for c in springs)
+        yield f"{record} {','.join(map(str, groups))}"
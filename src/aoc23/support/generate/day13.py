@@ -0,0 +1,59 @@
+"""Mirror patterns, `scale` patterns of 5 to 17 rows and columns.
+
+Every pattern has exactly one line of reflection, and exactly one other line
+where a single smudge (a wrong cell) breaks the reflection, as parts 1 and 2
+expect.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+Pattern = list[list[str]]
+
+
+def _mismatches(pattern: Pattern, after: int) -> int:
+    """Differing cells when reflecting the rows at the line after row `after`."""
+    pairs = zip(reversed(pattern[: after + 1]), pattern[after + 1 :])
+    return sum(a != b for upper, lower in pairs for a, b in zip(upper, lower))
+
+
+def _lines(pattern: Pattern) -> list[int]:
+    """Mismatches of all horizontal lines followed by all vertical lines."""
+    transposed = [list(col) for col in zip(*pattern)]
+    return [_mismatches(p, i) for p in (pattern, transposed) for i in range(len(p) - 1)]
+
+
+def _pattern(rng: random.Random) -> Pattern:
+    rows, cols = rng.randint(5, 17), rng.randint(5, 17)
+    pattern = [rng.choices("#.", k=cols) for _ in range(rows)]
+    # reflect the rows at a random line, then the columns at another one,
+    # keeping the row reflection intact for the rows it covers
+    line = rng.randrange(rows - 1)
+    for i in range(min(line + 1, rows - line - 1)):
+        pattern[line + 1 + i] = pattern[line - i][:]
+    col_line = rng.randrange(cols - 1)
+    width = min(col_line + 1, cols - col_line - 1)
+    for row in pattern:
+        for i in range(width):
+            row[col_line + 1 + i] = row[col_line - i]
+    return pattern
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    for i in range(scale):
+        while True:
+            pattern = _pattern(rng)
+            # a smudge that breaks one of the two reflections
+            row, col = rng.randrange(len(pattern)), rng.randrange(len(pattern[0]))
+            pattern[row][col] = "." if pattern[row][col] == "#" else "#"
+            mismatches = _lines(pattern)
+            if mismatches.count(0) == 1 and mismatches.count(1) == 1:
+                break
+        if i:
+            yield ""
+        yield from ("".join(row) for row in pattern)
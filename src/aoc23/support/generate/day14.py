@@ -0,0 +1,17 @@
+"""Reflector dish, `scale` x `scale` tiles of round and cube-shaped rocks."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+TILES = ".O#"
+WEIGHTS = (0.7, 0.2, 0.1)
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(scale):
+        yield "".join(rng.choices(TILES, WEIGHTS, k=scale))
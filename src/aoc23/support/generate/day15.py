@@ -0,0 +1,25 @@
+"""Initialization sequence, `scale` steps on about sqrt(scale) labels."""
+
+from __future__ import annotations
+
+from string import ascii_lowercase
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+SEPARATOR = ","
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    # without duplicates, in a deterministic order
+    labels = list(
+        dict.fromkeys(
+            "".join(rng.choices(ascii_lowercase, k=rng.randint(2, 6)))
+            for _ in range(max(1, int(scale**0.5)))
+        )
+    )
+    for _ in range(scale):
+        label = rng.choice(labels)
+        yield f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}"  # noqa: PLR2004
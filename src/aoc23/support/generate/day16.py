@@ -0,0 +1,17 @@
+"""Mirror contraption, `scale` x `scale` tiles."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+TILES = "./\\|-"
+WEIGHTS = (0.9, 0.025, 0.025, 0.025, 0.025)
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    for _ in range(scale):
+        yield "".join(rng.choices(TILES, WEIGHTS, k=scale))
@@ -0,0 +1,32 @@
+"""Dig plan, 4 * `scale` instructions.
+
+Both the plain instructions and the ones hidden in the colors (part 2) dig
+the outline of a staircase shaped lagoon, see `staircase`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aoc23.support.generate import staircase
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+# direction letter and its digit in the color
+DIRECTIONS = {(1, 0): ("R", 0), (0, 1): ("D", 1), (-1, 0): ("L", 2), (0, -1): ("U", 3)}
+
+
+def _moves(corners: list[tuple[int, int]]) -> Iterator[tuple[str, int, int]]:
+    for (x1, y1), (x2, y2) in zip(corners, corners[1:] + corners[:1]):
+        dx, dy = (x2 > x1) - (x2 < x1), (y2 > y1) - (y2 < y1)
+        yield *DIRECTIONS[dx, dy], abs(x2 - x1) + abs(y2 - y1)
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    columns = max(1, scale)
+    plain = _moves(staircase(columns, 8, 6, rng))
+    hidden = _moves(staircase(columns, 100_000, 250_000, rng))
+    for (direction, _, length), (_, digit, distance) in zip(plain, hidden):
+        yield f"{direction} {length} (#{distance:05x}{digit})"
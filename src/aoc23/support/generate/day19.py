@@ -0,0 +1,42 @@
+"""Workflows and part ratings, `scale` workflows and `scale` parts.
+
+The workflows form a tree below "in", built depth first, so it gets deeper
+as the scale grows.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aoc23.support.generate import label
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+CATEGORIES = "xmas"
+NEW_WORKFLOW = 0.5
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    pending, created = ["in"], 1
+    while pending:
+        # mostly the latest workflow, which makes the tree deep
+        name = pending.pop(-1 if rng.random() < 0.8 else rng.randrange(len(pending)))  # noqa: PLR2004
+        targets = []
+        for _ in range(rng.randint(2, 4)):
+            if created < scale and (not pending or rng.random() < NEW_WORKFLOW):
+                targets.append(label(created))
+                pending.append(targets[-1])
+                created += 1
+            else:
+                targets.append(rng.choice("AR"))
+        *conditional, fallback = targets
+        rules = (
+            f"{rng.choice(CATEGORIES)}{rng.choice('<>')}{rng.randint(1, 4000)}:{target}"
+            for target in conditional
+        )
+        yield f"{name}{{{','.join([*rules, fallback])}}}"
+    yield ""
+    for _ in range(scale):
+        yield "{" + ",".join(f"{c}={rng.randint(1, 4000)}" for c in CATEGORIES) + "}"
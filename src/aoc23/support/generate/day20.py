@@ -0,0 +1,45 @@
+"""Module configuration, `scale` 12 bit counters feeding rx.
+
+Like in the real inputs, every counter is a chain of flip-flops read by a
+conjunction, which resets the counter and signals a common conjunction in
+front of rx through an inverter.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aoc23.support.generate import label
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+BITS = 12
+# the module names have 4 letters or more, so they never clash with "hub"
+WIDTH = 4
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    counters = max(1, scale)
+    flops = [
+        [label(c * (BITS + 2) + b, WIDTH) for b in range(BITS)] for c in range(counters)
+    ]
+    yield f"broadcaster -> {', '.join(chain[0] for chain in flops)}"
+    for c, chain in enumerate(flops):
+        conjunction, inverter = (
+            label(c * (BITS + 2) + BITS + i, WIDTH) for i in range(2)
+        )
+        # the highest bit is always set
+        bits = rng.getrandbits(BITS - 1) | 1 << (BITS - 1)
+        for b, flop in enumerate(chain):
+            targets = chain[b + 1 : b + 2]
+            if bits >> b & 1:
+                targets.append(conjunction)
+            yield f"%{flop} -> {', '.join(targets)}"
+        resets = [chain[0]] + [
+            flop for b, flop in enumerate(chain) if b and not bits >> b & 1
+        ]
+        yield f"&{conjunction} -> {', '.join([*resets, inverter])}"
+        yield f"&{inverter} -> hub"
+    yield "&hub -> rx"
@@ -0,0 +1,29 @@
+"""Garden map, `scale` x `scale` plots (made odd), S in the center.
+
+Like the real inputs, the border and the row and column of S are free of
+rocks.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+ROCKS = 0.1
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    size = max(3, scale | 1)
+    center = size // 2
+    for row in range(size):
+        if row in (0, center, size - 1):
+            line = ["."] * size
+        else:
+            line = ["#" if rng.random() < ROCKS else "." for _ in range(size)]
+            line[0] = line[center] = line[-1] = "."
+        if row == center:
+            line[center] = "S"
+        yield "".join(line)
@@ -0,0 +1,42 @@
+"""Snapshot of `scale` falling bricks above a 10 x 10 area.
+
+Bricks are stacked in layers that don't overlap: either up to 3 parallel
+horizontal bricks, or a single vertical brick.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+SIZE = 10
+
+
+def _brick(x1: int, y1: int, z1: int, x2: int, y2: int, z2: int) -> str:  # noqa: PLR0913
+    return f"{x1},{y1},{z1}~{x2},{y2},{z2}"
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    z, count = 1, 0
+    while count < scale:
+        z += rng.randint(0, 2)
+        if rng.random() < 0.2:  # noqa: PLR2004
+            height = rng.randint(1, 4)
+            x, y = rng.randrange(SIZE), rng.randrange(SIZE)
+            yield _brick(x, y, z, x, y, z + height - 1)
+            z, count = z + height, count + 1
+            continue
+        # all bricks of a layer point in the same direction, along x or y
+        along_y = rng.random() < 0.5  # noqa: PLR2004
+        for x in rng.sample(range(SIZE), min(rng.randint(1, 3), scale - count)):
+            length = rng.randint(1, 4)
+            y = rng.randrange(SIZE - length + 1)
+            if along_y:
+                yield _brick(x, y, z, x, y + length - 1, z)
+            else:
+                yield _brick(y, x, z, y + length - 1, x, z)
+            count += 1
+        z += 1
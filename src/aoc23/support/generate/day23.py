@@ -0,0 +1,56 @@
+"""Hiking trail map, `scale` x `scale` tiles (made odd).
+
+The trails are a maze without cycles, carved depth first from the entry in
+the top row to the exit in the bottom row. Slopes right after a junction
+point away from the entry.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+MIN_SCALE = 5
+# slope for a step in direction (row, col)
+SLOPES = {(-1, 0): "^", (1, 0): "v", (0, -1): "<", (0, 1): ">"}
+DIRECTIONS = list(SLOPES)
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    size = max(MIN_SCALE, scale | 1)
+    tiles = [bytearray(b"#" * size) for _ in range(size)]
+    # 1 + index of the direction the tile between two cells was carved in
+    carved = [bytearray(size) for _ in range(size)]
+    tiles[1][1] = ord(".")
+    stack = [(1, 1)]
+    while stack:
+        row, col = stack[-1]
+        options = [
+            (dr, dc)
+            for dr, dc in DIRECTIONS
+            if 0 < row + 2 * dr < size
+            and 0 < col + 2 * dc < size
+            and tiles[row + 2 * dr][col + 2 * dc] == ord("#")
+        ]
+        if not options:
+            stack.pop()
+            continue
+        dr, dc = rng.choice(options)
+        tiles[row + dr][col + dc] = tiles[row + 2 * dr][col + 2 * dc] = ord(".")
+        carved[row + dr][col + dc] = 1 + DIRECTIONS.index((dr, dc))
+        stack.append((row + 2 * dr, col + 2 * dc))
+    tiles[0][1] = tiles[size - 1][size - 2] = ord(".")
+
+    def is_junction(row: int, col: int) -> bool:
+        return sum(tiles[row + dr][col + dc] != ord("#") for dr, dc in DIRECTIONS) > 2  # noqa: PLR2004
+
+    for row, directions in enumerate(carved):
+        for col, direction in enumerate(directions):
+            if direction:
+                dr, dc = DIRECTIONS[direction - 1]
+                if is_junction(row - dr, col - dc):
+                    tiles[row][col] = ord(SLOPES[dr, dc])
+    yield from (line.decode() for line in tiles)
@@ -0,0 +1,31 @@
+"""Hailstones, `scale` stones all hit by one thrown rock (part 2).
+
+Stone i is at the rock's position at time t_i, so its starting position is
+rock + t_i * (rock velocity - stone velocity).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+LOW, HIGH = 100_000_000_000_000, 500_000_000_000_000
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    rock = [rng.randint(200_000_000_000_000, 400_000_000_000_000) for _ in range(3)]
+    rock_velocity = [rng.randint(-300, 300) for _ in range(3)]
+    count = 0
+    while count < scale:
+        time = rng.randint(10_000_000_000, 1_000_000_000_000)
+        velocity = [rng.randint(-500, 500) for _ in range(3)]
+        position = [
+            p + time * (v - w) for p, v, w in zip(rock, rock_velocity, velocity)
+        ]
+        # stones without horizontal movement have no slope in part 1
+        if velocity[0] and all(LOW <= p <= HIGH for p in position):
+            yield f"{', '.join(map(str, position))} @ {', '.join(map(str, velocity))}"
+            count += 1
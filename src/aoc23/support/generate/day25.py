@@ -0,0 +1,35 @@
+"""Wiring diagram, `scale` components in two groups connected by 3 wires.
+
+Every component is wired to 4 earlier components of its group (the first 5
+to each other), so the 3 wires between the groups are the only 3-cut.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aoc23.support.generate import label
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Iterator
+
+DEGREE = 4
+MIN_SCALE = 2 * (DEGREE + 1)
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    size = max(scale, MIN_SCALE)
+    first = rng.randint(DEGREE + 1, size - DEGREE - 1)
+    groups = (range(first), range(first, size))
+    # component of the second group -> component of the first one
+    bridges: dict[int, int] = {}
+    while len(bridges) < 3:  # noqa: PLR2004
+        bridges[rng.choice(groups[1])] = rng.choice(groups[0])
+    for group in groups:
+        for i, component in enumerate(group):
+            wired = list(group[:i]) if i <= DEGREE else rng.sample(group[:i], DEGREE)
+            if component in bridges:
+                wired.append(bridges[component])
+            if wired:
+                yield f"{label(component)}: {' '.join(map(label, wired))}"
@@ -0,0 +1,237 @@
+"""Graphs over interned labels, stored as CSR arrays.
+
+Labels (strings, tuples, ...) are mapped to dense ints once, the adjacency is
+kept in two flat `array`s: the neighbors of node `n` are
+`targets[offsets[n] : offsets[n + 1]]`, in the order the edges were added.
+The kernels work on the ints only, so inner loops neither hash labels nor
+allocate per node. `np.frombuffer(graph.targets, dtype=np.intp)` gives a
+zero-copy NumPy view where vectorized code is preferable.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+H = TypeVar("H", bound=Hashable)
+
+# array typecode of node indices, "q" matches np.intp on 64 bit platforms
+INDEX = "q"
+UNREACHABLE = -1
+
+
+class Labels(Generic[H]):
+    """Assigns consecutive ints to labels, in order of first appearance."""
+
+    def __init__(self, labels: Iterable[H] = ()) -> None:
+        """Intern `labels` in the given order."""
+        self._index: dict[H, int] = {}
+        self._labels: list[H] = []
+        for label in labels:
+            self.intern(label)
+
+    def intern(self, label: H) -> int:
+        if (index := self._index.get(label)) is None:
+            index = self._index[label] = len(self._labels)
+            self._labels.append(label)
+        return index
+
+    def index(self, label: H) -> int:
+        """Index of a known label, raises KeyError otherwise."""
+        return self._index[label]
+
+    def __getitem__(self, index: int) -> H:
+        return self._labels[index]
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __iter__(self) -> Iterator[H]:
+        """The labels in order of their indices."""
+        return iter(self._labels)
+
+    def __contains__(self, label: object) -> bool:
+        return label in self._index
+
+
+class Graph(Generic[H]):
+    """Directed graph in CSR form, undirected graphs store both directions."""
+
+    def __init__(self, labels: Labels[H], offsets: array, targets: array) -> None:
+        """Wrap CSR arrays, raises ValueError if they don't fit `labels`."""
+        if len(offsets) != len(labels) + 1 or offsets[-1] != len(targets):
+            msg = "offsets don't match the labels and targets"
+            raise ValueError(msg)
+        self.labels = labels
+        self.offsets = offsets
+        self.targets = targets
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[tuple[H, H]],
+        directed: bool = False,  # noqa: FBT001, FBT002
+        labels: Labels[H] | None = None,
+    ) -> Graph[H]:
+        """Build from (source, target) pairs.
+
+        Pass `labels` to fix the node numbering, e.g. to include nodes without
+        edges, further labels are interned as they appear.
+        """
+        labels = Labels() if labels is None else labels
+        sources = array(INDEX)
+        targets = array(INDEX)
+        for source, target in edges:
+            sources.append(labels.intern(source))
+            targets.append(labels.intern(target))
+        if not directed:
+            sources, targets = sources + targets, targets + sources
+        return cls(labels, *_csr(len(labels), sources, targets))
+
+    @classmethod
+    def from_adjacency(
+        cls,
+        adjacency: Mapping[H, Iterable[H]],
+        directed: bool = True,  # noqa: FBT001, FBT002
+    ) -> Graph[H]:
+        """Build from a mapping of every node to its neighbors, keeping their order."""
+        labels = Labels(adjacency)
+        edges = ((node, n) for node, neighbors in adjacency.items() for n in neighbors)
+        return cls.from_edges(edges, directed, labels)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of stored (directed) edges."""
+        return len(self.targets)
+
+    def index(self, label: H) -> int:
+        return self.labels.index(label)
+
+    def neighbors(self, node: int) -> array:
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def degree(self, node: int) -> int:
+        return self.offsets[node + 1] - self.offsets[node]
+
+    def edges(self) -> Iterable[tuple[int, int]]:
+        """All stored edges as (source, target) indices."""
+        offsets, targets = self.offsets, self.targets
+        for node in range(len(self)):
+            for i in range(offsets[node], offsets[node + 1]):
+                yield node, targets[i]
+
+
+def _csr(size: int, sources: array, targets: array) -> tuple[array, array]:
+    """Counting sort of the edges by source, stable within a source."""
+    offsets = array(INDEX, bytes(array(INDEX).itemsize * (size + 1)))
+    for source in sources:
+        offsets[source + 1] += 1
+    for node in range(size):
+        offsets[node + 1] += offsets[node]
+    position = offsets[:-1]
+    csr_targets = array(INDEX, bytes(targets.itemsize * len(targets)))
+    for source, target in zip(sources, targets):
+        csr_targets[position[source]] = target
+        position[source] += 1
+    return offsets, csr_targets
+
+
+def bfs(graph: Graph, start: int | Sequence[int]) -> array:
+    """Distances in edges from the start node(s), UNREACHABLE if there is no path."""
+    offsets, targets = graph.offsets, graph.targets
+    distance = array(INDEX, [UNREACHABLE]) * len(graph)
+    queue = deque([start] if isinstance(start, int) else start)
+    for node in queue:
+        distance[node] = 0
+    while queue:
+        node = queue.popleft()
+        next_distance = distance[node] + 1
+        for i in range(offsets[node], offsets[node + 1]):
+            if distance[target := targets[i]] == UNREACHABLE:
+                distance[target] = next_distance
+                queue.append(target)
+    return distance
+
+
+def dfs(graph: Graph, start: int) -> list[int]:
+    """Nodes reachable from `start` in depth first preorder."""
+    offsets, targets = graph.offsets, graph.targets
+    seen = bytearray(len(graph))
+    order = []
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        if seen[node]:
+            continue
+        seen[node] = 1
+        order.append(node)
+        # reversed, so neighbors are visited in edge order
+        stack.extend(
+            targets[i]
+            for i in range(offsets[node + 1] - 1, offsets[node] - 1, -1)
+            if not seen[targets[i]]
+        )
+    return order
+
+
+def reachable(graph: Graph, start: int, blocked: bytearray | None = None) -> bytearray:
+    """Mask (1 per node) of the nodes reachable from `start`.
+
+    Nodes set in `blocked` are never entered, unless it's the start node.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    seen = bytearray(len(graph)) if blocked is None else bytearray(blocked)
+    seen[start] = 1
+    found = bytearray(len(graph))
+    found[start] = 1
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        for i in range(offsets[node], offsets[node + 1]):
+            if not seen[target := targets[i]]:
+                seen[target] = found[target] = 1
+                stack.append(target)
+    return found
+
+
+def _find(parent: array, node: int) -> int:
+    while (up := parent[node]) != node:
+        # path halving
+        parent[node] = node = parent[up]
+    return node
+
+
+def contract(
+    graph: Graph, edges: Iterable[tuple[int, int]], nodes_left: int = 1
+) -> array:
+    """Contract `edges` in the given order until `nodes_left` nodes remain.
+
+    Returns the node each original node has been merged into, edges whose ends
+    are already merged are skipped. With randomly ordered edges and
+    `nodes_left=2` this is one round of Karger's min-cut algorithm.
+    """
+    parent = array(INDEX, range(len(graph)))
+    remaining = len(graph)
+    for u, v in edges:
+        if remaining <= nodes_left:
+            break
+        root_u, root_v = _find(parent, u), _find(parent, v)
+        if root_u != root_v:
+            parent[root_v] = root_u
+            remaining -= 1
+    for node in range(len(graph)):
+        parent[node] = _find(parent, node)
+    return parent
+
+
+def components(graph: Graph) -> array:
+    """Component representative of every node, edges are taken as undirected."""
+    return contract(graph, graph.edges())
@@ -0,0 +1,168 @@
+"""Character grids stored as 2-d uint8 arrays, one byte per cell.
+
+NumPy is imported by this module, days using it should import it where needed
+to keep their import cheap.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from numpy.typing import NDArray
+
+# (row, col) offsets of the neighbors of a cell
+N4 = ((-1, 0), (0, 1), (1, 0), (0, -1))
+N8 = (*N4, (-1, 1), (1, 1), (1, -1), (-1, -1))
+
+NEWLINE = ord("\n")
+
+
+def shift(
+    cells: NDArray,
+    dr: int,
+    dc: int,
+    fill: int = 0,
+    wrap: bool = False,  # noqa: FBT001, FBT002
+) -> NDArray:
+    """Value of the neighbor at offset (dr, dc) for every cell.
+
+    Neighbors outside the array are `fill`, or taken from the opposite side
+    with `wrap`, as if the array was tiled infinitely.
+    """
+    if wrap:
+        return np.roll(cells, (-dr, -dc), axis=(0, 1))
+    height, width = cells.shape
+    shifted = np.full_like(cells, fill)
+    if abs(dr) >= height or abs(dc) >= width:
+        return shifted
+    rows_to, rows_from = _shift_slices(dr, height)
+    cols_to, cols_from = _shift_slices(dc, width)
+    shifted[rows_to, cols_to] = cells[rows_from, cols_from]
+    return shifted
+
+
+def _shift_slices(offset: int, size: int) -> tuple[slice, slice]:
+    if offset >= 0:
+        return slice(0, size - offset), slice(offset, size)
+    return slice(-offset, size), slice(0, size + offset)
+
+
+def dilate(
+    mask: NDArray[np.bool_],
+    connectivity: int = 4,
+    wrap: bool = False,  # noqa: FBT001, FBT002
+) -> NDArray[np.bool_]:
+    """Cells having a neighbor in `mask`, e.g. the next front of a BFS."""
+    offsets = N4 if connectivity == 4 else N8  # noqa: PLR2004
+    result = np.zeros_like(mask)
+    for dr, dc in offsets:
+        result |= shift(mask, dr, dc, fill=False, wrap=wrap)
+    return result
+
+
+class Grid:
+    """A rectangular grid of characters.
+
+    `cells` may be a read-only view, e.g. of the decrypted input, operations
+    modifying cells work on a `copy`.
+    """
+
+    def __init__(self, cells: NDArray[np.uint8]) -> None:
+        """Wrap the 2-d array `cells`, raises ValueError for other shapes."""
+        if cells.ndim != 2:  # noqa: PLR2004
+            msg = f"a grid needs 2 dimensions, got {cells.ndim}"
+            raise ValueError(msg)
+        self.cells = cells
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> Grid:
+        """View the lines in `data` as grid, without copying.
+
+        All lines must have the same length, a trailing newline is optional.
+        """
+        buffer = np.frombuffer(data, dtype=np.uint8)
+        size = buffer.size - 1 if buffer.size and buffer[-1] == NEWLINE else buffer.size
+        newlines = np.flatnonzero(buffer[:size] == NEWLINE)
+        width = int(newlines[0]) if newlines.size else size
+        height = newlines.size + 1
+        if size != height * (width + 1) - 1 or np.any(
+            newlines != np.arange(width, size, width + 1)
+        ):
+            msg = "lines of a grid must have the same length"
+            raise ValueError(msg)
+        # row r starts at byte r * (width + 1), the newlines are skipped
+        cells = np.lib.stride_tricks.as_strided(
+            buffer, shape=(height, width), strides=(width + 1, 1), writeable=False
+        )
+        return cls(cells)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> Grid:
+        return cls.from_bytes("\n".join(lines).encode())
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    def __getitem__(self, pos: tuple[int, int]) -> str:
+        return chr(self.cells[pos])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return np.array_equal(self.cells, other.cells)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __str__(self) -> str:
+        return "\n".join(self.lines())
+
+    def lines(self) -> list[str]:
+        return [row.tobytes().decode() for row in self.cells]
+
+    def copy(self) -> Grid:
+        return Grid(self.cells.copy())
+
+    def mask(self, chars: str) -> NDArray[np.bool_]:
+        """Cells containing any of `chars`."""
+        return np.isin(self.cells, np.frombuffer(chars.encode(), dtype=np.uint8))
+
+    def find(self, chars: str) -> NDArray[np.intp]:
+        """Flat indices of all cells containing any of `chars`."""
+        return np.flatnonzero(self.mask(chars))
+
+    def to_flat(self, row: NDArray | int, col: NDArray | int) -> NDArray | int:
+        return row * self.width + col
+
+    def to_rowcol(self, index: NDArray | int) -> tuple[NDArray | int, NDArray | int]:
+        return divmod(index, self.width)
+
+    def shift(self, dr: int, dc: int, fill: str = "#", wrap: bool = False) -> Grid:  # noqa: FBT001, FBT002
+        """The neighbor at offset (dr, dc) of every cell, see `shift`."""
+        return Grid(shift(self.cells, dr, dc, ord(fill), wrap))
+
+    def pad(self, width: int = 1, fill: str = "#") -> Grid:
+        return Grid(np.pad(self.cells, width, constant_values=ord(fill)))
+
+    def tile(self, rows: int, cols: int) -> Grid:
+        return Grid(np.tile(self.cells, (rows, cols)))
+
+    def transpose(self) -> Grid:
+        return Grid(self.cells.T)
+
+    def rotate(self, k: int = 1) -> Grid:
+        """Rotated by k * 90 degrees counter-clockwise."""
+        return Grid(np.rot90(self.cells, k))
+
+    def flip(self, axis: int) -> Grid:
+        """Upside down (axis 0) or mirrored left to right (axis 1)."""
+        return Grid(np.flip(self.cells, axis))
@@ -0,0 +1,63 @@
+"""Resolve the encryption key once per process tree.
+
+The key is looked up in this order:
+
+1. the process itself, once resolved or adopted from the parent process it is
+   kept for the lifetime of the process
+2. AOC23_KEY, the hex encoded key in the environment (e.g. for CI)
+3. the keyring
+
+Forked children inherit a key resolved before the fork. Children started
+otherwise (spawn, forkserver) begin with an empty process, `KeyProvider.share`
+resolves the key for them and `KeyProvider.adopt` takes it over in the child,
+e.g. as initializer of a process pool, so they don't ask the keyring again.
+"""
+
+from __future__ import annotations
+
+import os
+
+KEY_ENV = "AOC23_KEY"
+
+
+class KeyProvider:
+    def __init__(self, service_name: str, secret_name: str) -> None:
+        """Provide the key stored as `secret_name` of `service_name` in the keyring."""
+        self.service_name = service_name
+        self.secret_name = secret_name
+        self._key: str | None = None
+
+    def get(self) -> str | None:
+        """Return the hex encoded key, None if it is unknown."""
+        if self._key is None:
+            self._key = self._from_env() or self._from_keyring()
+        return self._key
+
+    def share(self) -> str | None:
+        """Resolve the key to hand it to child processes, None if it is unknown.
+
+        Unlike `get`, a failing keyring counts as unknown key.
+        """
+        import keyring.errors
+
+        try:
+            return self.get()
+        except keyring.errors.KeyringError:
+            return None
+
+    def adopt(self, key: str | None) -> None:
+        """Use the `key` shared by the parent process, if it knew one."""
+        if key:
+            self._key = key
+
+    def forget(self) -> None:
+        """Drop the resolved key."""
+        self._key = None
+
+    def _from_env(self) -> str | None:
+        return os.environ.get(KEY_ENV)
+
+    def _from_keyring(self) -> str | None:
+        import keyring
+
+        return keyring.get_password(self.service_name, self.secret_name)
@@ -0,0 +1,71 @@
+"""Progress reports and cooperative cancellation of long running solvers.
+
+Solvers call `report` in their outer loops, e.g. once per cycle or line. As
+long as nobody is listening that's a check of two globals. A runner watching
+the solver installs a reporter with `reporting`, and calls `cancel` when the
+solver ran out of time: the next `report` raises `Cancelled`, so the solver
+stops with its last progress known instead of being killed blindly.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    # called with the label, done and total of every report
+    Reporter = Callable[[str, int, int | None], None]
+
+
+class Progress(NamedTuple):
+    label: str
+    done: int
+    total: int | None = None
+
+    def __str__(self) -> str:
+        if self.total is None:
+            return f"{self.label} {self.done}"
+        return f"{self.label} {self.done}/{self.total}"
+
+
+class Cancelled(Exception):  # noqa: N818
+    """Raised by `report` once `cancel` was called, carries the last progress."""
+
+    def __init__(self, progress: Progress) -> None:
+        """Stop at `progress`, which is also the message."""
+        super().__init__(str(progress))
+        self.progress = progress
+
+
+_reporter: Reporter | None = None
+_cancelled = False
+
+
+def report(label: str, done: int, total: int | None = None) -> None:
+    """Report that `done` of `total` (if known) things labeled `label` are done.
+
+    Raises Cancelled if the solver should stop.
+    """
+    if _cancelled:
+        raise Cancelled(Progress(label, done, total))
+    if _reporter is not None:
+        _reporter(label, done, total)
+
+
+def cancel() -> None:
+    """Make the next `report` raise Cancelled, safe to call from signal handlers."""
+    global _cancelled  # noqa: PLW0603
+    _cancelled = True
+
+
+@contextmanager
+def reporting(reporter: Reporter) -> Iterator[None]:
+    """Pass the reports made inside the block to `reporter`."""
+    global _reporter, _cancelled
+    previous, _reporter = _reporter, reporter
+    try:
+        yield
+    finally:
+        _reporter, _cancelled = previous, False
@@ -0,0 +1,94 @@
+"""Run days implementing `Solver` phase by phase."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
+
+from aoc23.support import Solver, read_input, trace
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import ModuleType
+
+
+class Timings(NamedTuple):
+    read: float
+    parse: float
+    part1: float
+    part2: float
+
+
+class LegacySolver:
+    """Adapter for days only providing main(), parsing computes both parts."""
+
+    def __init__(self, main: Callable[[], tuple[Any, Any]]) -> None:
+        """Adapt `main`, which reads its input and returns both solutions."""
+        self.main = main
+
+    def parse(self, raw: str) -> tuple[Any, Any]:  # noqa: ARG002
+        return self.main()
+
+    def part1(self, parsed: tuple[Any, Any]) -> Any:  # noqa: ANN401
+        return parsed[0]
+
+    def part2(self, parsed: tuple[Any, Any]) -> Any:  # noqa: ANN401
+        return parsed[1]
+
+
+def day_solver(day_module: ModuleType) -> tuple[Solver[Any], Path | None]:
+    """The solver of a day module and the input it reads.
+
+    Days without INPUT are adapted by `LegacySolver`, they read their inputs
+    themselves.
+    """
+    if hasattr(day_module, "INPUT"):
+        input_path = Path(str(day_module.__file__)).parent / day_module.INPUT
+        return cast("Solver[Any]", day_module), input_path
+    return LegacySolver(day_module.main), None
+
+
+def timed(func: Callable[..., Any], *args: Any) -> tuple[Any, float]:  # noqa: ANN401
+    start = time.perf_counter()
+    with trace.span(getattr(func, "__name__", "call")):
+        result = func(*args)
+    return result, time.perf_counter() - start
+
+
+# solver and parsed input inherited by the processes forked in `solve`
+_shared: dict[str, Any] = {}
+
+
+def _run_shared_part(part: str) -> tuple[Any, float]:
+    return timed(getattr(_shared["solver"], part), _shared["parsed"])
+
+
+def solve(
+    solver: Solver[Any],
+    input_path: Path | None,
+    parallel: bool = False,  # noqa: FBT001, FBT002
+) -> tuple[Any, Any, Timings]:
+    """Read and parse the input once, then compute both parts from it.
+
+    With `parallel` the parts run at the same time in two forked processes,
+    which inherit the parsed input instead of receiving a pickled copy.
+    """
+    raw, read_time = timed(read_input, input_path) if input_path else ("", 0.0)
+    parsed, parse_time = timed(solver.parse, raw)
+    if parallel:
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import get_context
+
+        _shared.update(solver=solver, parsed=parsed)
+        try:
+            with ProcessPoolExecutor(2, mp_context=get_context("fork")) as pool:
+                (sol1, time1), (sol2, time2) = pool.map(
+                    _run_shared_part, ("part1", "part2")
+                )
+        finally:
+            _shared.clear()
+    else:
+        sol1, time1 = timed(solver.part1, parsed)
+        sol2, time2 = timed(solver.part2, parsed)
+    return sol1, sol2, Timings(read_time, parse_time, time1, time2)
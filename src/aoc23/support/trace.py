@@ -0,0 +1,166 @@
+"""Spans, counters and gauges for the hot paths of solvers.
+
+Solvers mark phases with `span` (or `traced`), count work with `counter` and
+sample sizes with `gauge`. While tracing is off every call is a check of one
+global. Tracing is switched on by `tracing`, used by `aoc day --trace`, or for
+a whole process by setting AOC_TRACE to 1 (writes trace.json) or to a file
+name. The events are written in the Chrome trace format, which Perfetto and
+chrome://tracing load.
+
+Counters are summed up and recorded whenever a span ends, so counting in a
+hot loop doesn't produce an event per increment. Every gauge call is an event,
+sample them in outer loops.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from contextlib import AbstractContextManager
+
+TRACE_ENV = "AOC_TRACE"
+DEFAULT_TRACE_FILE = "trace.json"
+
+F = TypeVar("F", bound="Callable[..., Any]")
+
+# None while tracing is off
+_events: list[dict[str, Any]] | None = None
+_counters: dict[str, int] = {}
+_NO_SPAN = nullcontext()
+
+
+def _now() -> float:
+    # trace timestamps are microseconds
+    return time.perf_counter_ns() / 1000
+
+
+def _event(phase: str, name: str, ts: float, **fields: Any) -> dict[str, Any]:  # noqa: ANN401
+    return {
+        "name": name,
+        "ph": phase,
+        "ts": ts,
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+        **fields,
+    }
+
+
+def _record_counters(ts: float) -> None:
+    assert _events is not None  # noqa: S101
+    _events.extend(
+        _event("C", name, ts, args={name: value}) for name, value in _counters.items()
+    )
+
+
+class _Span:
+    __slots__ = ("args", "name", "start")
+
+    def __init__(self, name: str, args: dict[str, Any]) -> None:
+        self.name = name
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = _now()
+
+    def __exit__(self, *_exc: object) -> None:
+        if _events is None:
+            # tracing was stopped inside the span
+            return
+        end = _now()
+        span = _event("X", self.name, self.start, dur=end - self.start)
+        if self.args:
+            span["args"] = self.args
+        _events.append(span)
+        _record_counters(end)
+
+
+def enabled() -> bool:
+    return _events is not None
+
+
+def span(name: str, **args: Any) -> AbstractContextManager[None]:  # noqa: ANN401
+    """Record the time spent in the block as `name`, with optional `args`."""
+    if _events is None:
+        return _NO_SPAN
+    return _Span(name, args)
+
+
+def traced(func: F) -> F:
+    """Decorator recording every call of `func` as a span named after it."""
+    name = func.__qualname__
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        if _events is None:
+            return func(*args, **kwargs)
+        with _Span(name, {}):
+            return func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def counter(name: str, value: int = 1) -> None:
+    """Add `value` to the counter `name`."""
+    if _events is not None:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def gauge(name: str, value: float) -> None:
+    """Record the current `value` of `name`, e.g. the size of a frontier."""
+    if _events is not None:
+        _events.append(_event("C", name, _now(), args={name: value}))
+
+
+def start() -> None:
+    """Start collecting events, dropping the ones collected so far."""
+    global _events  # noqa: PLW0603
+    _events = []
+    _counters.clear()
+
+
+def stop() -> dict[str, Any]:
+    """Stop collecting events and return them as Chrome trace."""
+    global _events
+    if _events is None:
+        return {"traceEvents": []}
+    _record_counters(_now())
+    events, _events = _events, None
+    _counters.clear()
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write(path: Path) -> None:
+    """Stop collecting events and write them to `path`."""
+    path.write_text(json.dumps(stop()))
+
+
+@contextmanager
+def tracing(path: Path) -> Iterator[None]:
+    """Trace the block, the events are written to `path` when it's left."""
+    start()
+    try:
+        yield
+    finally:
+        write(path)
+
+
+def _trace_process(setting: str) -> None:
+    if setting in {"", "0"}:
+        return
+    start()
+    # processes forked by multiprocessing leave with os._exit, skipping atexit
+    atexit.register(write, Path(DEFAULT_TRACE_FILE if setting == "1" else setting))
+
+
+_trace_process(os.environ.get(TRACE_ENV, ""))
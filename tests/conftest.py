@@ -0,0 +1,41 @@
+import sys
+from collections.abc import Callable
+from types import ModuleType
+
+import pytest
+from aoc23.cli.runner import day_module_name
+
+
+@pytest.fixture()
+def fake_day(monkeypatch: pytest.MonkeyPatch) -> Callable:
+    """Register a fake day module whose main() returns the given solutions."""
+
+    def register(day: int, sol1, sol2) -> ModuleType:
+        module = ModuleType(day_module_name(day))
+        module.main = lambda: (sol1, sol2)  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+        return module
+
+    return register
+
+
+@pytest.fixture(autouse=True)
+def _cache_home(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep the on-disk caches of the tests out of the user's cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+
+
+@pytest.fixture()
+def solver_day(tmp_path, monkeypatch):
+    """Day 7 summing resp. multiplying the numbers in its input."""
+    module = ModuleType(day_module_name(7))
+    module.__file__ = str(tmp_path / "main.py")
+    module.INPUT = "input01.txt"  # type: ignore[attr-defined]
+    module.parse = lambda raw: [int(n) for n in raw.split()]  # type: ignore[attr-defined]
+    module.part1 = sum  # type: ignore[attr-defined]
+    module.part2 = lambda numbers: numbers[0] * numbers[1]  # type: ignore[attr-defined]
+    (tmp_path / "input01.txt").write_text("3\n4")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    return module
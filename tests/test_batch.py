@@ -0,0 +1,87 @@
+import json
+import os
+import time
+
+import pytest
+from aoc23.cli import batch
+from aoc23.cli.main import cli
+from aoc23.support import generate
+from click.testing import CliRunner
+
+
+@pytest.fixture()
+def inputs(tmp_path):
+    for seed in range(4):
+        path = tmp_path / f"input{seed}.txt"
+        path.write_text("".join(generate.generate(7, 50, seed)))
+    (tmp_path / "notes.md").write_text("not an input")
+    return tmp_path
+
+
+def test_input_paths(inputs):
+    (inputs / "input9.txt.enc").write_bytes(b"")
+    names = [p.name for p in batch.input_paths(str(inputs))]
+    assert names == [f"input{i}.txt" for i in range(4)] + ["input9.txt.enc"]
+    assert batch.input_paths("input[12].txt", inputs) == [
+        inputs / "input1.txt",
+        inputs / "input2.txt",
+    ]
+
+
+@pytest.mark.usefixtures("solver_day")
+def test_solve_files(tmp_path):
+    (tmp_path / "a.txt").write_text("5 6")
+    (tmp_path / "b.txt").write_text("5 x")
+    first, second = batch.solve_files(7, [tmp_path / "a.txt", tmp_path / "b.txt"])
+    assert (first["sol1"], first["sol2"], first["error"]) == (11, 30, None)
+    assert set(first["timings"]) == {"read", "parse", "part1", "part2"}
+    assert second["file"] == str(tmp_path / "b.txt")
+    assert second["error"].startswith("ValueError: invalid literal")
+
+
+def test_day_inputs_in_parallel(inputs):
+    args = ["day", "7", "--inputs", str(inputs)]
+    sequential = CliRunner().invoke(cli, args)
+    parallel = CliRunner().invoke(cli, [*args, "--jobs", "2"])
+    assert sequential.exit_code == parallel.exit_code == 0
+
+    def solutions(output: str) -> set:
+        records = [json.loads(line) for line in output.splitlines()]
+        return {(r["file"], r["sol1"], r["sol2"], r["error"]) for r in records}
+
+    assert len(solutions(sequential.stdout)) == 4  # noqa: PLR2004
+    assert solutions(parallel.stdout) == solutions(sequential.stdout)
+
+
+def test_day_inputs_fails_for_broken_inputs(inputs):
+    (inputs / "input2.txt").write_text("broken")
+    result = CliRunner().invoke(cli, ["day", "7", "--inputs", str(inputs)])
+    assert result.exit_code == 1
+    assert "1 of 4 input(s) failed" in result.output
+
+
+def test_day_inputs_needs_a_solver(inputs):
+    result = CliRunner().invoke(cli, ["day", "1", "--inputs", str(inputs)])
+    assert result.exit_code == 1
+    assert "day 01 reads its input itself" in result.output
+
+
+def test_solve_files_timeout(solver_day, tmp_path):
+    (tmp_path / "a.txt").write_text("5 6")
+    (tmp_path / "b.txt").write_text("5 6")
+    solver_day.part2 = lambda _: time.sleep(60)
+    paths = [tmp_path / "a.txt", tmp_path / "b.txt"]
+    results = list(batch.solve_files(7, paths, jobs=2, timeout=0.2))
+    assert [r["error"][:13] for r in results] == ["TIMEOUT after"] * 2
+
+
+def test_solve_files_worker_died(solver_day, tmp_path):
+    paths = [tmp_path / f"{name}.txt" for name in "abcd"]
+    for path in paths:
+        path.write_text("5 6")
+    paths[1].write_text("0 0")
+    # the worker solving b.txt dies, taking the inputs in flight with it
+    solver_day.part1 = lambda numbers: sum(numbers) or os._exit(1)
+    results = {r["file"]: r for r in batch.solve_files(7, paths, jobs=2)}
+    assert results.pop(str(paths[1]))["error"] == "worker process died"
+    assert [r["sol1"] for r in results.values()] == [11] * 3
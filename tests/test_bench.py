@@ -0,0 +1,72 @@
+import functools
+
+import pytest
+from aoc23.cli import bench
+from aoc23.cli.main import cli
+from click.testing import CliRunner
+
+
+def test_summarize():
+    stats = bench.summarize([4.0, 1.0, 3.0, 2.0, 5.0])
+    assert stats == bench.Stats(
+        runs=5, min=1.0, median=3.0, p95=5.0, stddev=pytest.approx(1.5811, abs=1e-4)
+    )
+
+
+def test_summarize_single_sample():
+    assert bench.summarize([2.0]) == bench.Stats(1, 2.0, 2.0, 2.0, 0.0)
+
+
+@pytest.mark.parametrize(
+    ("pct", "expected"), [(0, 1), (50, 50), (95, 95), (99, 99), (100, 100)]
+)
+def test_percentile(pct, expected):
+    assert bench.percentile(list(range(100, 0, -1)), pct) == expected
+
+
+def test_compare():
+    baseline = {"01": {"main": bench.Stats(5, 1.0, 1.0, 1.0, 0.0)}}
+    within = {"01": {"main": bench.Stats(5, 1.0, 1.1, 1.2, 0.0)}}
+    slower = {"01": {"main": bench.Stats(5, 1.0, 1.2, 1.2, 0.0)}}
+    unknown = {"02": {"main": bench.Stats(5, 9.0, 9.0, 9.0, 0.0)}}
+    assert bench.compare(within, baseline, 0.1) == []
+    assert bench.compare(unknown, baseline, 0.1) == []
+    (regression,) = bench.compare(slower, baseline, 0.1)
+    assert (regression.day, regression.phase) == ("01", "main")
+    assert regression.ratio == pytest.approx(1.2)
+
+
+def test_baseline_roundtrip(tmp_path):
+    result = {"01": {"main": bench.Stats(5, 1.0, 2.0, 3.0, 0.5)}}
+    bench.save_baseline(result, tmp_path / "baseline.json")
+    assert bench.load_baseline(tmp_path / "baseline.json") == result
+
+
+def test_bench_day_starts_cold(solver_day):
+    calls = []
+
+    @functools.cache
+    def total(numbers: tuple[int, ...]) -> int:
+        calls.append(numbers)
+        return sum(numbers)
+
+    solver_day.parse = lambda raw: tuple(map(int, raw.split()))
+    solver_day.part1 = solver_day.total = total
+    bench.bench_day(solver_day, warmup=2, repeat=3)
+    # none of the calls is a cache hit
+    assert len(calls) == 5  # noqa: PLR2004
+
+
+def test_bench_cli(fake_day, tmp_path):
+    fake_day(1, 1, 2)
+    baseline = tmp_path / "baseline.json"
+    args = ["bench", "1", "--repeat", "3", "--save", baseline]
+    result = CliRunner().invoke(cli, args)
+    assert result.exit_code == 0
+    assert result.output.startswith("DAY 01 main")
+    assert bench.load_baseline(baseline)["01"]["main"].runs == 3
+
+    bench.save_baseline({"01": {"main": bench.Stats(3, 0.0, 0.0, 0.0, 0.0)}}, baseline)
+    result = CliRunner().invoke(cli, ["bench", "1", "--compare", baseline])
+    assert result.exit_code == 1
+    assert "DAY 01 main regressed" in result.output
@@ -0,0 +1,81 @@
+import pytest
+from aoc23 import support
+from aoc23.cli import bulk
+from aoc23.cli import main as cli_main
+from aoc23.support.keys import KEY_ENV, KeyProvider
+from click.testing import CliRunner
+
+KEY = bytes(range(32))
+OLD_KEY = bytes(range(32, 64))
+
+
+@pytest.fixture()
+def inputs(tmp_path, monkeypatch):
+    monkeypatch.setenv(KEY_ENV, KEY.hex())
+    monkeypatch.setattr(cli_main, "key_provider", KeyProvider("test", "key"))
+    for day in ("aoc01", "aoc02", "aoc02/extra"):
+        (tmp_path / day).mkdir()
+        (tmp_path / day / "input01.txt").write_text(f"{day}\n1 2 3")
+    return tmp_path
+
+
+def test_expand_paths(inputs):
+    names = ["aoc01/input01.txt", "aoc02/extra/input01.txt", "aoc02/input01.txt"]
+    expected = [inputs / name for name in names]
+    assert bulk.expand_paths(inputs, ["."], ".txt", recursive=True) == expected
+    assert bulk.expand_paths(inputs, ["aoc02"], ".txt") == expected[2:]
+    assert bulk.expand_paths(inputs, ["aoc0*/*.txt", "aoc01/input01.txt"], "") == [
+        expected[0],
+        expected[2],
+    ]
+    assert bulk.expand_paths(inputs, [f"{inputs}/*/extra/*"], "") == [expected[1]]
+    assert bulk.expand_paths(inputs, ["missing.txt"], "") == []
+
+
+@pytest.mark.parametrize("fmt", ["v1", "v2"])
+def test_enc_dec(inputs, fmt):
+    client = CliRunner()
+    result = client.invoke(cli_main.cli, ["enc", "-r", str(inputs), "--format", fmt])
+    assert result.exit_code == 0
+    encrypted = sorted(inputs.rglob("*.enc"))
+    assert len(encrypted) == 3  # noqa: PLR2004
+    for plain in inputs.rglob("*.txt"):
+        plain.unlink()
+
+    result = client.invoke(cli_main.cli, ["dec", "-r", str(inputs), "--write"])
+    assert result.exit_code == 0
+    assert "3 file(s), 39 bytes" in result.output
+    assert (inputs / "aoc02/extra/input01.txt").read_text() == "aoc02/extra\n1 2 3"
+
+
+def test_rotate(inputs, monkeypatch):
+    plain = inputs / "aoc01" / "input01.txt"
+    encrypted = inputs / "aoc01" / "input01.txt.enc"
+    encrypted.write_bytes(support.encrypted_content(plain, OLD_KEY))
+    monkeypatch.setattr(cli_main, "get_aoc_secret", lambda *_: OLD_KEY.hex())
+
+    args = ["enc", "--rotate", "old", str(encrypted)]
+    result = CliRunner().invoke(cli_main.cli, args)
+    assert result.exit_code == 0
+    assert support.decrypted_content(encrypted, KEY) == plain.read_bytes()
+    assert list(inputs.glob("aoc01/.*")) == []
+
+
+@pytest.mark.parametrize("fmt", ["v1", "v2"])
+def test_rotate_wrong_key(inputs, monkeypatch, fmt):
+    result = CliRunner().invoke(
+        cli_main.cli, ["enc", "-r", str(inputs), "--format", fmt]
+    )
+    assert result.exit_code == 0
+    encrypted = sorted(inputs.rglob("*.enc"))
+    # one file encrypted with another key fails the rotation of all of them
+    encrypted[0].write_bytes(support.encrypted_bytes(b"aoc01\n1 2 3", OLD_KEY))
+    before = [path.read_bytes() for path in encrypted]
+    monkeypatch.setattr(cli_main, "get_aoc_secret", lambda *_: KEY.hex())
+
+    args = ["enc", "-r", str(inputs), "--rotate", "old"]
+    result = CliRunner().invoke(cli_main.cli, args)
+    assert result.exit_code == 1
+    assert "doesn't decrypt with the old key, no file was changed" in result.output
+    assert [path.read_bytes() for path in encrypted] == before
+    assert list(inputs.rglob(".*")) == []
@@ -0,0 +1,100 @@
+import socket
+import threading
+
+import pytest
+from aoc23.cli import daemon, main
+from click.testing import CliRunner
+
+
+@pytest.fixture()
+def server(tmp_path):
+    server = daemon.DaemonServer(tmp_path / "aoc23.sock", workers=2)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+@pytest.mark.usefixtures("solver_day")
+def test_parsed_input_is_kept(server):
+    first = daemon.request_day(7, server.server_address)
+    assert (first.sol1, first.sol2) == (7, 12)
+    second = daemon.request_day(7, server.server_address)
+    assert (second.sol1, second.sol2) == (7, 12)
+    assert second.timings.read == second.timings.parse == 0
+
+
+@pytest.mark.usefixtures("solver_day")
+def test_changed_input_is_parsed_again(server, tmp_path):
+    daemon.request_day(7, server.server_address)
+    (tmp_path / "input01.txt").write_text("10\n20")
+    result = daemon.request_day(7, server.server_address)
+    assert (result.sol1, result.sol2) == (30, 200)
+
+
+@pytest.mark.usefixtures("solver_day")
+def test_inline_input_and_single_part(server):
+    message = {"day": 7, "part": 2, "input": "5 6"}
+    response = daemon.request(message, server.server_address)
+    assert (response["sol1"], response["sol2"]) == (None, 30)
+
+
+@pytest.mark.parametrize(
+    ("message", "error"),
+    [
+        ({"day": 17}, "day 17 not available"),
+        ({"day": "x"}, "invalid request"),
+        ({"day": 7, "part": 3}, "invalid part"),
+    ],
+)
+@pytest.mark.usefixtures("solver_day")
+def test_errors(server, message, error):
+    with pytest.raises(RuntimeError, match=error):
+        daemon.request(message, server.server_address)
+
+
+@pytest.mark.usefixtures("solver_day")
+def test_source_change_requests_a_restart(server, monkeypatch):
+    monkeypatch.setattr(daemon, "code_fingerprint", lambda: ())
+    assert daemon.request_day(7, server.server_address) is None
+    assert server.restart
+
+
+def test_no_daemon(tmp_path):
+    assert daemon.request_day(7, tmp_path / "missing.sock") is None
+
+
+def test_stuck_daemon(tmp_path):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stuck:
+        # accepts connections, but never answers
+        stuck.bind(str(tmp_path / "aoc23.sock"))
+        stuck.listen()
+        assert daemon.request_day(7, tmp_path / "aoc23.sock", timeout=0.1) is None
+
+
+@pytest.mark.parametrize("running", [False, True])
+@pytest.mark.usefixtures("solver_day")
+def test_day_via_daemon(request, tmp_path, monkeypatch, running):
+    path = request.getfixturevalue("server").server_address if running else None
+    monkeypatch.setenv(daemon.SOCKET_ENV, path or str(tmp_path / "missing.sock"))
+    result = CliRunner().invoke(main.cli, ["day", "7", "--via-daemon", "--no-cache"])
+    assert result.exit_code == 0
+    assert "Solution 1: 7\nSolution 2: 12\n" in result.output
+
+
+def test_serve_keeps_other_files(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("not a socket")
+    with pytest.raises(RuntimeError, match="isn't a socket"):
+        daemon.serve(path)
+    assert path.read_text() == "not a socket"
+
+
+def test_stale_socket_is_removed(tmp_path):
+    path = tmp_path / "aoc23.sock"
+    daemon.DaemonServer(path, workers=1).server_close()
+    assert path.is_socket()
+    daemon.remove_stale_socket(path)
+    assert not path.exists()
@@ -0,0 +1,53 @@
+import pytest
+from aoc23.aoc01 import main
+from aoc23.support import generate
+
+EXAMPLE = b"""two1nine
+eightwothree
+abcone2threexyz
+xtwone3four
+4nineeightseven2
+zoneight234
+7pqrstsixteen"""
+
+
+def legacy_sums(text: str) -> tuple[int, int]:
+    lines = text.split("\n")
+    return sum(main.line_to_value(line) for line in lines), sum(
+        main.line_to_value(main.dstring_to_digits(line)) for line in lines
+    )
+
+
+def test_example():
+    assert main.calibration_sum(EXAMPLE, main.PATTERN2, main.WORDS) == 281  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("line", "value"),
+    [(b"eighthree", 83), (b"sevenine", 79), (b"oneight", 18), (b"eight", 88)],
+)
+def test_overlapping_words(line, value):
+    assert main.calibration_sum(line, main.PATTERN2, main.WORDS) == value
+    # lines without digits count 0
+    assert main.calibration_sum(line, main.PATTERN1, main.DIGITS) == 0
+
+
+@pytest.mark.parametrize("engine", main.ENGINES)
+@pytest.mark.parametrize("seed", range(3))
+def test_same_as_legacy(engine, seed):
+    text = "".join(generate.generate(1, 2000, seed))
+    assert main.ENGINES[engine](text.encode()) == legacy_sums(text)
+
+
+@pytest.mark.parametrize("engine", main.ENGINES)
+@pytest.mark.parametrize(
+    ("data", "sums"),
+    [
+        (b"", (0, 0)),
+        (b"one", (0, 11)),
+        (b"\n7\n\n", (77, 77)),
+        (b"x2eight\n", (22, 28)),
+    ],
+)
+def test_engine_edge_cases(engine, data, sums):
+    assert main.ENGINES[engine](data) == sums
@@ -0,0 +1,47 @@
+import pytest
+from aoc23.aoc02 import main
+from aoc23.support import generate
+
+EXAMPLE = """Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
+Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue
+Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red
+Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red
+Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green"""
+
+CAPS = [(12, 13, 14), (0, 0, 0), (5, 6, 7), (20, 20, 20), (-1, 30, 30), (3, 99, 99)]
+
+
+def test_parse_table():
+    table = main.parse(EXAMPLE)
+    assert table.game[:4].tolist() == [1, 1, 1, 2]
+    assert table.roll[:4].tolist() == [0, 1, 2, 0]
+    assert table.red[:3].tolist() == [4, 1, 0]
+    assert table.blue[:3].tolist() == [3, 6, 0]
+
+
+def test_example():
+    table = main.parse(EXAMPLE)
+    assert (main.part1(table), main.part2(table)) == (8, 2286)
+
+
+@pytest.mark.parametrize("dense_sets", [main.DENSE_SETS, 0])
+@pytest.mark.parametrize("seed", range(3))
+def test_same_as_legacy(monkeypatch, dense_sets, seed):
+    monkeypatch.setattr(main, "DENSE_SETS", dense_sets)
+    raw = "".join(generate.generate(2, 500, seed))
+    games = [main.parse_line(line) for line in raw.split("\n")]
+    table = main.parse(raw)
+    assert main.part2(table) == main.legacy_part2(games)
+    expected = []
+    for cap in CAPS:
+        monkeypatch.setattr(main, "MAX_RED", cap[0])
+        monkeypatch.setattr(main, "MAX_GREEN", cap[1])
+        monkeypatch.setattr(main, "MAX_BLUE", cap[2])
+        expected.append(main.legacy_part1(games))
+    assert main.possible_id_sums(table, CAPS).tolist() == expected
+
+
+def test_no_games():
+    table = main.parse("")
+    assert main.possible_id_sums(table, CAPS).tolist() == [0] * len(CAPS)
+    assert main.power_sum(table) == 0
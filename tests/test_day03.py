@@ -0,0 +1,68 @@
+import pytest
+from aoc23.aoc03 import main
+from aoc23.support import generate, iter_input
+
+EXAMPLE = """467..114..
+...*......
+..35..633.
+......#...
+617*......
+.....+.58.
+..592.....
+......755.
+...$.*....
+.664.598.."""
+
+
+def brute_force(schematic: main.Schematic) -> tuple[int, int]:
+    """Both parts comparing every symbol with every number."""
+    adjacent = [
+        {
+            n
+            for n in schematic.numbers
+            if abs(n.row - sym.row) <= 1 and n.col_begin - 1 <= sym.col <= n.col_end + 1
+        }
+        for sym in schematic.symbols
+    ]
+    part1 = sum(n.value for n in set().union(*adjacent))
+    part2 = 0
+    for numbers in adjacent:
+        if len(numbers) == 2:  # noqa: PLR2004
+            a, b = numbers
+            part2 += a.value * b.value
+    return part1, part2
+
+
+def test_example():
+    schematic = main.parse(EXAMPLE)
+    assert (main.part1(schematic), main.part2(schematic)) == (4361, 467835)
+
+
+def test_get_adjacent():
+    schematic = main.parse(EXAMPLE)
+    assert {v.value for v in main.get_adjacent(main.Pos(3, 1), schematic)} == {467, 35}
+    assert main.get_adjacent(main.Pos(9, 0), schematic) == set()
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_same_as_brute_force(seed):
+    schematic = main.parse("".join(generate.generate(3, 100, seed)))
+    assert (main.part1(schematic), main.part2(schematic)) == brute_force(schematic)
+
+
+def test_stream_example():
+    rows = list(main.stream_schematic(EXAMPLE.split("\n")))
+    assert [r.row for r in rows] == list(range(10))
+    assert rows[0] == main.WindowRow(0, [467], [])
+    assert rows[1].gear_ratios == [467 * 35]
+    assert main.solve_stream(EXAMPLE.split("\n")) == (4361, 467835)
+    assert main.solve_stream([]) == (0, 0)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_stream_from_iter_input(tmp_path, seed):
+    raw = "".join(generate.generate(3, 100, seed))
+    (tmp_path / "input01.txt").write_text(raw)
+    schematic = main.parse(raw)
+    lines = iter_input(tmp_path / "input01.txt")
+    assert main.solve_stream(lines) == (main.part1(schematic), main.part2(schematic))
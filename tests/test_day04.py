@@ -0,0 +1,12 @@
+from aoc23.aoc04 import main
+
+# card ids and matches taken from the table at the end of aoc04/main.py
+PILE = [main.Card(id=i, matches=m) for i, m in enumerate([4, 2, 2, 1, 0, 0], 1)]
+
+
+def test_get_worth():
+    assert main.get_worth(iter(PILE)) == 8 + 2 + 2 + 1
+
+
+def test_accumulate():
+    assert main.accumulate(iter(PILE)) == 1 + 2 + 4 + 8 + 14 + 1
@@ -0,0 +1,25 @@
+from aoc23.aoc13 import main
+
+EXAMPLE = """\
+#...##..#
+#....#..#
+..##..###
+#####.##.
+#####.##.
+..##..###
+#....#..#"""
+
+
+def test_parts_leave_the_parsed_grids_alone(monkeypatch):
+    grids = main.parse(EXAMPLE)
+    originals = [g.copy() for g in grids]
+    locate = main.locate_reflection_line
+
+    def checked_locate(grid):
+        # the other part may read the grids at any time, e.g. in the daemon
+        assert all(g.equals(o) for g, o in zip(grids, originals, strict=True))
+        return locate(grid)
+
+    monkeypatch.setattr(main, "locate_reflection_line", checked_locate)
+    assert main.part1(grids) == 400  # noqa: PLR2004
+    assert main.part2(grids) == 100  # noqa: PLR2004
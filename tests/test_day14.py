@@ -0,0 +1,22 @@
+from aoc23.aoc14 import main
+
+EXAMPLE = """O....#....
+O.OO#....#
+.....##...
+OO.#O....O
+.O.....O#.
+O.#..O.#.#
+..O..#O..O
+.......O..
+#....###..
+#OO..#...."""
+
+
+def test_example():
+    grid = main.parse(EXAMPLE)
+    assert (main.part1(grid), main.part2(grid)) == (136, 64)
+
+
+def test_cycle_of_length_one():
+    # the rocks don't move at all
+    assert main.part2(main.parse("O#\n#O")) == 3  # noqa: PLR2004
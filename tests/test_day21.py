@@ -0,0 +1,23 @@
+from aoc23.aoc21 import main
+
+EXAMPLE = [
+    "...........",
+    ".....###.#.",
+    ".###.##..#.",
+    "..#.#...#..",
+    "....#.#....",
+    ".##..S####.",
+    ".##..#...#.",
+    ".......##..",
+    ".##.#.####.",
+    ".##..##.##.",
+    "...........",
+]
+
+
+def test_reachable():
+    assert main.reachable(EXAMPLE, 6) == 16  # noqa: PLR2004
+
+
+def test_reachable_beyond_the_grid():
+    assert main.reachable(["S"], 2) == 9  # noqa: PLR2004
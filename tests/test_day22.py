@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import NamedTuple
 
 import pytest
+from aoc23.aoc22 import main
 from aoc23.aoc22.main import Brick, get_dim, parse_line, pulldown
 
 #             x3, y3
@@ -95,3 +96,17 @@ def test_parse_line():
         3: [Brick(n=1, x1=0, y1=0, z1=3, x2=0, y2=3, z2=3)],
         4: [],
     }
+
+
+def test_parts_keep_parsed_bricks():
+    raw = "1,0,1~1,2,1\n0,0,2~2,0,2\n0,2,3~2,2,3\n0,0,4~0,2,4\n2,0,5~2,2,5\n0,1,6~2,1,6\n1,1,8~1,1,9"  # noqa: E501
+    bricks = main.parse(raw)
+    before = [b.clone() for b in bricks]
+    assert (main.part1(bricks), main.part2(bricks)) == (5, 7)
+    assert bricks == before
+    assert (main.part1(bricks), main.part2(bricks)) == (5, 7)
+
+
+def test_dim_covers_bricks_away_from_the_origin():
+    bricks = [Brick(0, 3, 5, 1, 4, 5, 1), Brick(1, 4, 6, 2, 4, 7, 2)]
+    assert get_dim(bricks) == (4, 7)
@@ -0,0 +1,22 @@
+import pytest
+from aoc23.aoc25.main import solution
+
+# two triangles joined by a single wire
+EDGES = {
+    ("a", "b"),
+    ("b", "c"),
+    ("c", "a"),
+    ("c", "d"),
+    ("d", "e"),
+    ("e", "f"),
+    ("f", "d"),
+}
+
+
+def test_solution():
+    assert solution(EDGES, cut_size=1) == 9  # noqa: PLR2004
+
+
+def test_solution_gives_up():
+    with pytest.raises(ValueError, match="no cut of 3 wires found in 5 trials"):
+        solution(EDGES, trials=5)
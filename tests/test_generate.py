@@ -0,0 +1,69 @@
+import io
+from importlib import import_module
+
+import pytest
+from aoc23.cli.main import cli
+from aoc23.support import generate
+from click.testing import CliRunner
+
+
+def text(day: int, scale: int, seed: int = 0) -> str:
+    return "".join(generate.generate(day, scale, seed))
+
+
+def test_same_seed_same_input():
+    assert text(7, 50, seed=1) == text(7, 50, seed=1)
+    assert text(7, 50, seed=1) != text(7, 50, seed=2)
+
+
+@pytest.mark.parametrize("day", [2, 4, 7, 9, 11, 14])
+def test_scale_is_the_number_of_lines(day):
+    lines = text(day, 20).split("\n")
+    assert len(lines) == 20  # noqa: PLR2004
+    assert all(lines)
+
+
+def test_separator():
+    assert text(15, 20).count(",") == 19  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("day", [6, 8, 9, 10, 18, 22, 24, 25])
+def test_generated_input_is_solved(day):
+    module = import_module(f"aoc23.aoc{day:02}.main")
+    parsed = module.parse(text(day, 30))
+    assert module.part1(parsed) is not None
+    assert module.part2(parsed) is not None
+
+
+@pytest.mark.parametrize("scale", [8, 12, 15, 16, 20])
+def test_generated_pipe_maze_has_a_start(scale):
+    # small loops may have no horizontal part to place S on
+    module = import_module("aoc23.aoc10.main")
+    for seed in range(30):
+        parsed = module.parse(text(10, scale, seed))
+        assert module.part1(parsed) > 0
+
+
+def test_write():
+    out = io.StringIO()
+    size = generate.write(3, 10, 0, out)
+    assert size == len(out.getvalue()) == len(text(3, 10))
+
+
+def test_labels_are_unique():
+    labels = [generate.label(i) for i in range(26**3 + 10)]
+    assert len(set(labels)) == len(labels)
+    assert min(map(len, labels)) == 3  # noqa: PLR2004
+
+
+def test_gen_command(tmp_path):
+    path = tmp_path / "input.txt"
+    result = CliRunner().invoke(cli, ["gen", "4", "--scale", "5", "-o", str(path)])
+    assert result.exit_code == 0
+    assert path.read_text() == text(4, 5)
+
+
+def test_gen_without_generator():
+    result = CliRunner().invoke(cli, ["gen", "17"])
+    assert result.exit_code != 0
+    assert "no generator for day 17" in result.output
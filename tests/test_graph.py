@@ -0,0 +1,71 @@
+import random
+
+import pytest
+from aoc23.support.graph import (
+    UNREACHABLE,
+    Graph,
+    Labels,
+    bfs,
+    components,
+    contract,
+    dfs,
+    reachable,
+)
+
+EDGES = [("a", "b"), ("b", "c"), ("a", "d"), ("e", "f")]
+
+
+def test_labels():
+    labels = Labels(["x", "y"])
+    assert labels.intern("z") == 2  # noqa: PLR2004
+    assert labels.intern("x") == 0
+    assert labels.index("y") == 1
+    assert labels[2] == "z"
+    assert list(labels) == ["x", "y", "z"]
+    assert "w" not in labels
+    with pytest.raises(KeyError):
+        labels.index("w")
+
+
+def test_csr_keeps_edge_order():
+    graph = Graph.from_adjacency({"a": ["c", "b"], "b": ["a"], "c": []})
+    assert list(graph.offsets) == [0, 2, 3, 3]
+    assert [graph.labels[n] for n in graph.neighbors(0)] == ["c", "b"]
+    assert graph.degree(2) == 0
+    assert graph.edge_count == 3  # noqa: PLR2004
+
+
+def test_undirected_edges_are_stored_twice():
+    graph = Graph.from_edges(EDGES)
+    assert graph.edge_count == 2 * len(EDGES)
+    assert sorted(graph.labels[n] for n in graph.neighbors(graph.index("a"))) == [
+        "b",
+        "d",
+    ]
+
+
+def test_traversals():
+    graph = Graph.from_edges(EDGES)
+    a, b, c, d, e, _ = map(graph.index, "abcdef")
+    assert list(bfs(graph, a)) == [0, 1, 2, 1, UNREACHABLE, UNREACHABLE]
+    assert list(bfs(graph, [c, e])) == [2, 1, 0, 3, 0, 1]
+    assert dfs(graph, a) == [a, b, c, d]
+    assert list(reachable(graph, a)) == [1, 1, 1, 1, 0, 0]
+    blocked = bytearray(len(graph))
+    blocked[b] = 1
+    assert list(reachable(graph, a, blocked)) == [1, 0, 0, 1, 0, 0]
+
+    directed = Graph.from_edges(EDGES, directed=True)
+    assert list(reachable(directed, b)) == [0, 1, 1, 0, 0, 0]
+
+
+def test_components_and_contraction():
+    graph = Graph.from_edges(EDGES)
+    group = components(graph)
+    assert len(set(group)) == 2  # noqa: PLR2004
+    assert group[graph.index("d")] == group[graph.index("c")]
+    assert group[graph.index("e")] != group[graph.index("a")]
+
+    edges = list(graph.edges())
+    random.Random(0).shuffle(edges)  # noqa: S311
+    assert len(set(contract(graph, edges, nodes_left=4))) == 4  # noqa: PLR2004
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from aoc23.support.grid import Grid, dilate, shift
+
+RAW = b"ab.\n#cd\n..#\n"
+
+
+def test_from_bytes_is_a_view():
+    grid = Grid.from_bytes(RAW)
+    assert (grid.height, grid.width) == (3, 3)
+    assert np.shares_memory(grid.cells, np.frombuffer(RAW, dtype=np.uint8))
+    assert grid.lines() == ["ab.", "#cd", "..#"]
+    assert grid == Grid.from_bytes(RAW.rstrip())
+    assert grid == Grid.from_lines(["ab.", "#cd", "..#"])
+
+
+@pytest.mark.parametrize("raw", [b"ab\nc", b"abc\nde\nfgh", b"ab\n\nc"])
+def test_from_bytes_rejects_ragged_lines(raw):
+    with pytest.raises(ValueError, match="same length"):
+        Grid.from_bytes(raw)
+
+
+def test_find():
+    grid = Grid.from_bytes(RAW)
+    index = grid.find("#")
+    assert list(index) == [3, 8]
+    rows, cols = grid.to_rowcol(index)
+    assert (list(rows), list(cols)) == ([1, 2], [0, 2])
+    assert list(grid.to_flat(rows, cols)) == [3, 8]
+    assert grid[1, 0] == "#"
+
+
+def test_shift():
+    cells = np.arange(9).reshape(3, 3)
+    assert shift(cells, 0, 1, fill=-1).tolist() == [[1, 2, -1], [4, 5, -1], [7, 8, -1]]
+    assert shift(cells, -1, 0, fill=-1).tolist() == [[-1, -1, -1], [0, 1, 2], [3, 4, 5]]
+    assert shift(cells, 1, 0, wrap=True).tolist() == [[3, 4, 5], [6, 7, 8], [0, 1, 2]]
+
+
+def test_dilate():
+    mask = np.zeros((3, 3), dtype=bool)
+    mask[0, 0] = True
+    assert dilate(mask).astype(int).tolist() == [[0, 1, 0], [1, 0, 0], [0, 0, 0]]
+    assert dilate(mask, 8).sum() == 3  # noqa: PLR2004
+    assert dilate(mask, wrap=True).astype(int).tolist() == [
+        [0, 1, 1],
+        [1, 0, 0],
+        [1, 0, 0],
+    ]
+
+
+def test_views():
+    grid = Grid.from_bytes(RAW)
+    assert grid.transpose().lines() == ["a#.", "bc.", ".d#"]
+    assert grid.rotate().lines() == [".d#", "bc.", "a#."]
+    assert grid.flip(0).lines() == ["..#", "#cd", "ab."]
+    assert np.shares_memory(grid.rotate().cells, grid.cells)
+    assert grid.pad(1, "*").lines()[:2] == ["*****", "*ab.*"]
+    assert grid.tile(1, 2).lines()[0] == "ab.ab."
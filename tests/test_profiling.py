@@ -0,0 +1,43 @@
+import pstats
+import tracemalloc
+
+import pytest
+from aoc23.cli import profiling
+from aoc23.cli.main import cli
+from click.testing import CliRunner
+
+
+def allocating_function() -> tuple[int, int]:
+    data = [list(range(100)) for _ in range(100)]
+    return len(data), sum(map(len, data))
+
+
+@pytest.mark.parametrize("mode", ["cpu", "mem", "both"])
+def test_profile_call(mode, tmp_path):
+    prefix = tmp_path / "day"
+    result, report = profiling.profile_call(allocating_function, mode, 5, prefix)
+    assert result == (100, 10000)
+    assert ("allocating_function" in report) == (mode != "mem")
+    assert ("Peak traced memory" in report) == (mode != "cpu")
+    if mode != "mem":
+        assert pstats.Stats(str(prefix) + ".prof").total_calls > 0
+    if mode != "cpu":
+        tracemalloc.Snapshot.load(str(prefix) + ".snapshot")
+    assert not tracemalloc.is_tracing()
+
+
+def test_mem_report_shows_retained_growth():
+    kept = []
+    _, report = profiling.profile_call(lambda: kept.append(bytearray(10**6)), "mem", 1)
+    site = report.splitlines()[2]
+    assert "test_profiling.py" in site
+    assert "(+977 KiB)" in site
+
+
+def test_day_profile(fake_day):
+    fake_day(1, 1, 2)
+    result = CliRunner().invoke(cli, ["day", "1", "--profile", "both", "--top", "3"])
+    assert result.exit_code == 0
+    assert result.output.startswith("Solution 1: 1\nSolution 2: 2\n")
+    assert "function calls" in result.output
+    assert "Peak traced memory" in result.output
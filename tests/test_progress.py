@@ -0,0 +1,25 @@
+import pytest
+from aoc23.support import progress
+
+
+def test_report_without_reporter():
+    progress.report("lines", 1, 10)
+
+
+def test_reporting():
+    reports = []
+    with progress.reporting(lambda *args: reports.append(args)):
+        progress.report("lines", 1, 10)
+        progress.report("cycles", 5)
+    progress.report("lines", 2, 10)
+    assert reports == [("lines", 1, 10), ("cycles", 5, None)]
+
+
+def test_cancel():
+    with progress.reporting(lambda *_: None):
+        progress.cancel()
+        with pytest.raises(progress.Cancelled, match="lines 3/10") as e:
+            progress.report("lines", 3, 10)
+    assert e.value.progress == progress.Progress("lines", 3, 10)
+    # the cancellation ends with the block
+    progress.report("lines", 4, 10)
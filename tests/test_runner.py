@@ -0,0 +1,182 @@
+import itertools
+import multiprocessing
+import os
+import sys
+import time
+
+import pytest
+from aoc23 import support
+from aoc23.cli import runner
+from aoc23.support import progress
+from aoc23.cli.main import cli
+from aoc23.support.cache import ResultCache
+from click.testing import CliRunner
+
+
+def test_run_day(fake_day):
+    fake_day(3, 42, "abc")
+    result = runner.run_day(3)
+    assert result is not None
+    assert (result.day, result.sol1, result.sol2) == (3, 42, "abc")
+    assert result.cpu_time >= 0
+
+
+def test_run_day_not_available():
+    assert runner.run_day(99) is None
+
+
+def child_key() -> str | None:
+    return support.key_provider.get()
+
+
+def test_worker_pool_shares_the_key(monkeypatch):
+    monkeypatch.setattr(support.key_provider, "_key", "abcd")
+    # spawned workers start empty, the key is all they get from the parent
+    with runner.worker_pool(1, multiprocessing.get_context("spawn")) as pool:
+        assert pool.submit(child_key).result() == "abcd"
+
+
+def test_all_days():
+    assert list(runner.DAYS) == list(range(1, 26))
+
+
+def test_run_days_keeps_order(fake_day):
+    fake_day(3, 3, 33)
+    fake_day(1, 1, 11)
+    results = list(runner.run_days([3, 99, 1]))
+    assert [(r.day, r.sol1, r.sol2) for r in results] == [(3, 3, 33), (1, 1, 11)]
+
+
+def test_run_days_isolated_measures_each_day(fake_day):
+    fake_day(2, 2, 22)
+    module = fake_day(1, 1, 11)
+    # ~40 MiB that are only touched inside the child process
+    module.main = lambda: (len(bytearray(40 << 20)), 11)
+    results = list(runner.run_days_isolated([2, 99, 1], jobs=2))
+    assert [(r.day, r.sol1, r.sol2) for r in results] == [(2, 2, 22), (1, 40 << 20, 11)]
+    usage = results[1].usage
+    assert usage is not None
+    assert usage.wall_time > 0
+    assert usage.peak_rss > 30 << 10
+    # the bytearray is freed again, it isn't counted
+    assert usage.allocated_blocks < 1000  # noqa: PLR2004
+    assert "ALLOC BLOCKS" in runner.usage_table(results).splitlines()[0]
+
+
+def test_allocated_blocks_are_counted(fake_day):
+    kept = []
+    module = fake_day(1, 1, 11)
+    module.main = lambda: (kept.extend(object() for _ in range(5000)), 11)
+    (result,) = runner.run_days_isolated([1])
+    assert result.usage is not None
+    assert result.usage.allocated_blocks >= 5000  # noqa: PLR2004
+
+
+def test_run_days_isolated_forwards_errors(fake_day):
+    module = fake_day(1, 1, 11)
+    module.main = lambda: 1 / 0
+    with pytest.raises(ZeroDivisionError):
+        list(runner.run_days_isolated([1]))
+
+
+def test_run_days_isolated_worker_died(fake_day):
+    module = fake_day(1, 1, 11)
+    module.main = lambda: os._exit(1)
+    with pytest.raises(ChildProcessError, match="day 01"):
+        list(runner.run_days_isolated([1]))
+
+
+@pytest.fixture()
+def file_day(fake_day, tmp_path):
+    """A fake day living in a file with an input next to it, counting runs."""
+    calls = []
+    module = fake_day(5, 0, 0)
+    module.__file__ = str(tmp_path / "main.py")
+    (tmp_path / "main.py").write_text("# day 5")
+    (tmp_path / "input01.txt").write_text("1\n2\n")
+
+    def main():
+        calls.append(1)
+        return len(calls), "x"
+
+    module.main = main
+    return tmp_path, calls
+
+
+def test_run_day_cached(file_day, tmp_path):
+    day_dir, calls = file_day
+    cache = ResultCache(tmp_path / "cache")
+    first = runner.run_day(5, cache)
+    second = runner.run_day(5, cache)
+    assert first is not None
+    assert second is not None
+    assert (second.sol1, second.sol2, second.cached) == (1, "x", True)
+    assert not first.cached
+    assert len(calls) == 1
+
+    refreshed = runner.run_day(5, cache, refresh=True)
+    assert refreshed is not None
+    assert (refreshed.sol1, refreshed.cached) == (2, False)
+    assert runner.run_day(5, cache).sol1 == 2  # type: ignore[union-attr]
+
+    (day_dir / "input01.txt").write_text("1\n3\n")
+    assert not runner.run_day(5, cache).cached  # type: ignore[union-attr]
+    assert len(calls) == 3
+
+
+def test_cache_command(file_day):
+    runner.run_day(5, ResultCache())
+    result = CliRunner().invoke(cli, ["cache", "stats"])
+    assert "results      1 entries" in result.output
+    result = CliRunner().invoke(cli, ["cache", "clear"])
+    assert result.output == "Removed 1 entries\n"
+
+
+def count_forever(_item):
+    for step in itertools.count():
+        progress.report("steps", step)
+        time.sleep(0.001)
+
+
+def test_run_isolated_cancels_cooperative_children():
+    (outcome,) = runner.run_isolated(count_forever, [None], timeout=0.3)
+    assert outcome.timed_out
+    assert outcome.progress.startswith("steps ")
+    assert outcome.elapsed < runner.CANCEL_GRACE
+
+
+def test_run_isolated_kills_other_children():
+    start = time.monotonic()
+    outcomes = list(runner.run_isolated(time.sleep, [60, 0], jobs=2, timeout=0.2))
+    assert [(o.position, o.timed_out) for o in outcomes] == [(1, False), (0, True)]
+    assert outcomes[1].progress is None
+    assert time.monotonic() - start < 0.2 + runner.CANCEL_GRACE + 1
+
+
+def test_run_isolated_total_timeout():
+    outcomes = list(runner.run_isolated(time.sleep, [60, 60, 0], total_timeout=0.2))
+    assert [o.timed_out for o in outcomes] == [True, True, True]
+
+
+def test_day_timeout(fake_day):
+    module = fake_day(3, 1, 2)
+    module.main = lambda: count_forever(None)
+    result = CliRunner().invoke(cli, ["day", "3", "--timeout", "0.2", "--no-cache"])
+    assert result.exit_code == 1
+    assert "day 03: TIMEOUT after" in result.output
+    assert "last progress: steps" in result.output
+
+
+def test_day_within_timeout(fake_day):
+    fake_day(3, 1, 2)
+    result = CliRunner().invoke(cli, ["day", "3", "--timeout", "5", "--no-cache"])
+    assert result.exit_code == 0
+    assert "Solution 1: 1\nSolution 2: 2\n" in result.output
+
+
+@pytest.mark.parametrize("options", [[], ["--timeout", "5"]])
+def test_day_not_available(monkeypatch, options):
+    monkeypatch.setitem(sys.modules, runner.day_module_name(17), None)
+    result = CliRunner().invoke(cli, ["day", "17", "--no-cache", *options])
+    assert result.exit_code == 1
+    assert "day 17 not available" in result.output
@@ -0,0 +1,57 @@
+import math
+from itertools import islice
+
+import pytest
+from aoc23.cli import scaling
+
+
+def sample(size: int, seconds: float, functions: dict[str, float]) -> scaling.Sample:
+    return scaling.Sample(size, size, 0.0, seconds, 0.0, size * 100, functions)
+
+
+def test_fit_exponent():
+    sizes = [10, 20, 40, 80]
+    assert scaling.fit_exponent(sizes, [3 * s**2 for s in sizes]) == pytest.approx(2)
+    assert scaling.fit_exponent(sizes, [5.0] * 4) == pytest.approx(0)
+    assert math.isnan(scaling.fit_exponent([10], [1.0]))
+
+
+def test_scales():
+    assert list(islice(scaling.scales(1, 1.5), 5)) == [1, 2, 3, 4, 6]
+
+
+def test_hotspots():
+    samples = [
+        sample(s, s**2 + s, {"pairs:10": s**2, "parse:3": s, "tiny:5": s**3 / 1e9})
+        for s in (100, 200, 400)
+    ]
+    result = scaling.analyze(3, samples, threshold=1.3, min_share=0.05)
+    assert result.time_exponent == pytest.approx(2, abs=0.01)
+    assert result.memory_exponent == pytest.approx(1)
+    (hotspot,) = result.hotspots
+    assert hotspot.function == "pairs:10"
+    assert hotspot.exponent == pytest.approx(2)
+
+
+def test_measure_series_stops_at_the_budget():
+    samples = scaling.measure_series(7, [5, 10, 20], budget=0.0, repeat=1)
+    assert [s.scale for s in samples] == [5]
+    assert samples[0].size > 0
+    assert any(name.startswith("part1:") for name in samples[0].functions)
+
+
+def test_legacy_day_is_refused():
+    with pytest.raises(ValueError, match="reads its input itself"):
+        scaling.measure(1, 5)
+
+
+def test_report(tmp_path):
+    samples = [sample(s, s**2, {"pairs:10": s**2}) for s in (100, 200, 400)]
+    result = scaling.analyze(3, samples)
+    text = scaling.report([result])
+    assert "DAY 03  time ~ size^2.00" in text
+    assert "HOT SPOT pairs:10" in text
+    scaling.write_csv([result], tmp_path / "scaling.csv")
+    rows = (tmp_path / "scaling.csv").read_text().splitlines()
+    assert rows[0] == "day,scale,size,parse,part1,part2,seconds,peak_memory"
+    assert len(rows) == 4  # noqa: PLR2004
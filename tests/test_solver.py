@@ -0,0 +1,26 @@
+import pytest
+from aoc23.cli import bench
+from aoc23.support.solver import LegacySolver, day_solver, solve
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_solve(solver_day, tmp_path, parallel):
+    solver, input_path = day_solver(solver_day)
+    assert input_path == tmp_path / "input01.txt"
+    sol1, sol2, timings = solve(solver, input_path, parallel=parallel)
+    assert (sol1, sol2) == (7, 12)
+    assert min(timings) >= 0
+
+
+def test_legacy_solver(fake_day):
+    solver, input_path = day_solver(fake_day(3, 1, "two"))
+    assert isinstance(solver, LegacySolver)
+    assert input_path is None
+    assert solve(solver, input_path)[:2] == (1, "two")
+
+
+def test_bench_phases(solver_day, fake_day):
+    fake_day(3, 1, 2)
+    result = bench.bench_days([3, 7], warmup=0, repeat=2)
+    assert list(result["03"]) == ["main"]
+    assert list(result["07"]) == ["parse", "part1", "part2"]
@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+from aoc23.cli import startup
+
+# cold start budget of `aoc version` in seconds, can be relaxed on slow machines
+STARTUP_BUDGET = float(os.environ.get("AOC23_STARTUP_BUDGET", "0.5"))
+
+HEAVY_MODULES = ["cryptography", "keyring", "numpy", "pandas", "networkx", "graphviz"]
+
+
+def imported_modules(module: str) -> set[str]:
+    code = f"import sys, {module}; print(*sys.modules)"
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(proc.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["aoc23.cli.main", "aoc23.support", "aoc23.aoc11.main", "aoc23.aoc25.main"],
+)
+def test_no_heavy_imports(module):
+    assert imported_modules(module).isdisjoint(HEAVY_MODULES)
+
+
+def test_version_startup_budget():
+    def cold_start() -> float:
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "aoc23", "version"], check=True)
+        return time.perf_counter() - start
+
+    # best of three, to not fail on a single hiccup of the machine
+    assert min(cold_start() for _ in range(3)) < STARTUP_BUDGET
+
+
+def test_parse_import_times():
+    output = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |     _io",
+            "import time:       546 |      14088 |   email.message",
+            "import time:      3182 |     146828 | aoc23.cli.main",
+        ]
+    )
+    assert startup.parse_import_times(output) == [
+        startup.ImportTime("_io", 120, 120, 2),
+        startup.ImportTime("email.message", 546, 14088, 1),
+        startup.ImportTime("aoc23.cli.main", 3182, 146828, 0),
+    ]
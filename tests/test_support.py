@@ -0,0 +1,200 @@
+import os
+import stat
+
+import keyring.errors
+import pytest
+from aoc23 import support
+from aoc23.support import container
+from aoc23.support.cache import CacheStats, InputCache, ResultCache
+from aoc23.support.keys import KEY_ENV, KeyProvider
+from cryptography.exceptions import InvalidTag
+
+KEY = bytes(range(32))
+
+
+@pytest.fixture()
+def encrypted(tmp_path, monkeypatch):
+    """Encrypted input file, with the test key provided instead of the keyring."""
+    monkeypatch.setenv(KEY_ENV, KEY.hex())
+    monkeypatch.setattr(support, "key_provider", KeyProvider("test", "key"))
+    monkeypatch.setattr(support, "input_cache", InputCache())
+    plain = tmp_path / "input01.txt"
+    plain.write_text("line 1\nline 2")
+    enc = tmp_path / "input01.txt.enc"
+    enc.write_bytes(support.encrypted_content(plain, KEY))
+    plain.unlink()
+    return plain
+
+
+def test_get_input_encrypted(encrypted):
+    assert support.get_input(encrypted) == ["line 1", "line 2"]
+    assert support.get_input(encrypted, len) == [6, 6]
+
+
+def test_read_input_bytes(encrypted, tmp_path):
+    assert support.read_input_bytes(encrypted) == b"line 1\nline 2"
+    assert support.read_input_bytes(tmp_path / "missing.txt") == b""
+
+
+def test_input_cache_hits(encrypted):
+    support.get_input(encrypted)
+    support.get_input(encrypted)
+    assert support.input_cache.stats == CacheStats(hits=1, misses=1)
+
+
+def test_input_cache_detects_changes(encrypted):
+    support.get_input(encrypted)
+    enc = encrypted.with_name("input01.txt.enc")
+    encrypted.write_text("changed")
+    enc.write_bytes(support.encrypted_content(encrypted, KEY))
+    encrypted.unlink()
+    os.utime(enc, ns=(0, 0))
+    assert support.get_input(encrypted) == ["changed"]
+    assert support.input_cache.stats.misses == 2  # noqa: PLR2004
+
+
+def test_input_cache_invalidate(encrypted):
+    support.get_input(encrypted)
+    support.input_cache.invalidate()
+    support.get_input(encrypted)
+    assert support.input_cache.stats.misses == 2  # noqa: PLR2004
+
+
+def test_input_cache_on_disk(encrypted, tmp_path, monkeypatch):
+    support.input_cache.enable_disk(tmp_path / "cache")
+    support.get_input(encrypted)
+    (cached,) = (tmp_path / "cache").iterdir()
+    assert stat.S_IMODE((tmp_path / "cache").stat().st_mode) == 0o700
+    assert stat.S_IMODE(cached.stat().st_mode) == 0o600
+
+    # a new process only finds the disk cache
+    monkeypatch.setattr(support, "input_cache", InputCache())
+    support.input_cache.enable_disk(tmp_path / "cache")
+    assert support.get_input(encrypted) == ["line 1", "line 2"]
+    assert support.input_cache.stats == CacheStats(disk_hits=1)
+
+    support.input_cache.invalidate(encrypted.with_name("input01.txt.enc"))
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+def test_result_cache(tmp_path):
+    cache = ResultCache(tmp_path)
+    assert cache.get("a") is None
+    assert cache.put("a", [1, "x"])
+    assert cache.get("a") == [1, "x"]
+    assert not cache.put("b", object())
+    assert cache.stats == CacheStats(disk_hits=1, misses=1)
+    assert stat.S_IMODE((tmp_path / "a").stat().st_mode) == 0o600
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(tmp_path, max_size=30)
+    for i, key in enumerate("abc"):
+        cache.put(key, "12345678")  # 10 bytes as JSON
+        os.utime(tmp_path / key, ns=(i, i))
+    cache.get("a")  # most recently used now
+    cache.put("d", "12345678")
+    assert [f.name for f, _ in cache.entries()] == ["c", "a", "d"]
+    assert cache.clear() == 3
+    assert cache.get("a") is None
+
+
+@pytest.fixture()
+def no_keyring(monkeypatch):
+    monkeypatch.delenv(KEY_ENV, raising=False)
+    monkeypatch.setattr(KeyProvider, "_from_keyring", lambda _: None)
+
+
+def test_key_provider_memoizes(no_keyring, monkeypatch):
+    provider = KeyProvider("test", "key")
+    assert provider.get() is None
+    monkeypatch.setenv(KEY_ENV, "abcd")
+    assert provider.get() == "abcd"
+    monkeypatch.setenv(KEY_ENV, "ef01")
+    assert provider.get() == "abcd"
+    provider.forget()
+    assert provider.get() == "ef01"
+
+
+def test_key_provider_share(no_keyring, monkeypatch):
+    monkeypatch.setenv(KEY_ENV, "abcd")
+    key = KeyProvider("test", "key").share()
+    assert key == "abcd"
+
+    # a child process started without the environment of its parent
+    monkeypatch.delenv(KEY_ENV)
+    child = KeyProvider("test", "key")
+    child.adopt(key)
+    assert child.get() == "abcd"
+    child.forget()
+    assert child.get() is None
+
+
+def test_key_provider_share_without_keyring(no_keyring, monkeypatch):
+    def fail(_):
+        raise keyring.errors.NoKeyringError
+
+    monkeypatch.setattr(KeyProvider, "_from_keyring", fail)
+    provider = KeyProvider("test", "key")
+    assert provider.share() is None
+    provider.adopt(None)
+    with pytest.raises(keyring.errors.NoKeyringError):
+        provider.get()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 16, 1 << 20])
+@pytest.mark.parametrize(
+    "content", ["", "\n", "a\nbb\n\nccc", "a\nbb\n\nccc\n", "größer\näöü\n" * 5]
+)
+def test_iter_input(encrypted, monkeypatch, chunk_size, content):
+    monkeypatch.setattr(support, "CHUNK_SIZE", chunk_size)
+    encrypted.write_text(content)
+    expected = support.get_input(encrypted)
+    assert list(support.iter_input(encrypted)) == expected
+
+    enc = encrypted.with_name("input01.txt.enc")
+    enc.write_bytes(support.encrypted_content(encrypted, KEY))
+    encrypted.unlink()
+    assert list(support.iter_input(encrypted, len)) == [len(e) for e in expected]
+    assert support.input_cache.stats.misses == 0
+
+
+CONTENT = "".join(f"line {i}\n" for i in range(100)) + "last"
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 10, 64, 1 << 18])
+def test_container_roundtrip(tmp_path, compress, chunk_size):
+    enc = tmp_path / "input01.txt.enc"
+    data = container.encrypted_container(CONTENT.encode(), KEY, chunk_size, compress)
+    enc.write_bytes(data)
+    assert container.is_container(enc)
+    assert support.decrypted_content(enc, KEY) == CONTENT.encode()
+    assert container.decrypted_container(enc, KEY, workers=4) == CONTENT.encode()
+    assert b"".join(support.iter_decrypted_content(enc, KEY)) == CONTENT.encode()
+
+
+@pytest.mark.parametrize("content", ["", "\n", "a", "a\n", CONTENT, CONTENT + "\n"])
+@pytest.mark.parametrize(("start", "stop"), [(0, 1), (0, 1000), (5, 17), (99, 102)])
+def test_container_read_lines(tmp_path, content, start, stop):
+    enc = tmp_path / "input01.txt.enc"
+    enc.write_bytes(container.encrypted_container(content.encode(), KEY, 16))
+    expected = content.split("\n")[start:stop]
+    assert container.read_lines(enc, KEY, start, stop) == expected
+
+
+def test_container_is_authenticated(tmp_path):
+    enc = tmp_path / "input01.txt.enc"
+    data = bytearray(container.encrypted_container(CONTENT.encode(), KEY, 64))
+    data[-1] ^= 1
+    enc.write_bytes(data)
+    assert container.read_lines(enc, KEY, 0, 1) == ["line 0"]
+    with pytest.raises(InvalidTag):
+        container.decrypted_container(enc, KEY)
+
+
+def test_get_input_detects_container(encrypted):
+    enc = encrypted.with_name("input01.txt.enc")
+    enc.write_bytes(container.encrypted_container(CONTENT.encode(), KEY, 64))
+    assert support.get_input(encrypted) == CONTENT.split("\n")
+    assert list(support.iter_input(encrypted)) == CONTENT.split("\n")
@@ -0,0 +1,65 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from aoc23.cli.main import cli
+from aoc23.support import trace
+from click.testing import CliRunner
+
+
+@trace.traced
+def visit(n: int) -> int:
+    trace.counter("states_visited", n)
+    return n
+
+
+def test_disabled():
+    assert not trace.enabled()
+    with trace.span("bfs"):
+        trace.counter("states_visited")
+        trace.gauge("frontier", 3)
+    assert visit(2) == 2  # noqa: PLR2004
+    assert trace.stop() == {"traceEvents": []}
+
+
+def test_tracing(tmp_path):
+    with trace.tracing(tmp_path / "trace.json"):
+        with trace.span("bfs", start=0):
+            trace.gauge("frontier", 3)
+            trace.counter("states_visited")
+        visit(4)
+    assert not trace.enabled()
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    spans = [(e["name"], e.get("args")) for e in events if e["ph"] == "X"]
+    assert spans == [("bfs", {"start": 0}), ("visit", None)]
+    counters = [e["args"] for e in events if e["ph"] == "C"]
+    assert counters[0] == {"frontier": 3}
+    # totals are recorded at the end of every span and of the trace
+    assert [c["states_visited"] for c in counters[1:]] == [1, 5, 5]
+
+
+@pytest.mark.usefixtures("solver_day")
+def test_day_trace(tmp_path):
+    out = tmp_path / "out.json"
+    result = CliRunner().invoke(cli, ["day", "7", "--trace", str(out)])
+    assert result.exit_code == 0
+    events = json.loads(out.read_text())["traceEvents"]
+    names = [e["name"] for e in events if e["ph"] == "X"]
+    assert names == ["read_input", "<lambda>", "sum", "<lambda>"]
+
+
+def test_day_trace_excludes_timeout(tmp_path):
+    args = ["day", "7", "--trace", str(tmp_path / "t.json"), "--timeout", "1"]
+    result = CliRunner().invoke(cli, args)
+    assert result.exit_code == 2  # noqa: PLR2004
+    assert "--trace excludes" in result.output
+
+
+def test_trace_env(tmp_path):
+    code = "from aoc23.support import trace\nwith trace.span('phase'): pass"
+    env = {**os.environ, trace.TRACE_ENV: str(tmp_path / "env.json")}
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)  # noqa: S603
+    events = json.loads((tmp_path / "env.json").read_text())["traceEvents"]
+    assert [e["name"] for e in events] == ["phase"]